@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Timing helpers shared by the benchmark scripts in this directory.
+"""
+
+from typing import Callable
+from timeit import repeat
+
+
+def best_of(
+    statement: Callable[[], object], number: int, repetitions: int = 3
+) -> float:
+    """
+    Times a statement, and returns the best of a few repetitions in seconds per call.
+
+    Parameters:
+      statement -- The statement to time.
+      number -- The amount of calls per repetition.
+      repetitions -- The amount of repetitions.
+    """
+    return min(repeat(statement, number=number, repeat=repetitions)) / number
+
+
+def report(
+    name: str, baseline: float, candidate: float, width: int = 40, precision: int = 2
+) -> None:
+    """
+    Prints one row of a benchmark table: the name, both timings, and the speedup of the candidate.
+
+    Parameters:
+      name -- The name of the benchmark.
+      baseline -- The timing of the baseline.
+      candidate -- The timing of the candidate.
+      width -- The width of the name column.
+      precision -- The amount of decimals of the timings.
+    """
+    print(
+        f"{name:<{width}} {baseline:>10.{precision}f} {candidate:>10.{precision}f} {baseline / candidate:>8.2f}x"
+    )
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks the per-trace overhead of `SequenceGenerator.generate_trace`, which validates every call,
+against a plan from `SequenceGenerator.compile` (`generator.GenerationPlan.GenerationPlan`), which validated once.
+
+Run from the repository root with `python benchmarks/compiled_plan.py`.
+"""
+
+from typing import Callable, Dict
+import sys
+import os
+
+# Make python find our modules
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+
+# Own
+from generator import SequenceGenerator  # noqa: E402
+from _timing import best_of, report  # noqa: E402
+
+
+def microseconds(statement: Callable[[], object], number: int) -> float:
+    """
+    Times a statement, and returns the best of 5 repetitions in microseconds per call.
+    """
+    return 1000000 * best_of(statement, number, 5)
+
+
+def main() -> None:
+    """
+    Runs all benchmarks and prints a table of microseconds per trace.
+    """
+    cases: Dict[str, Dict[str, int]] = {
+        "fib": {"first": 1, "second": 2},
+        "pascal": {"first": 1},
+        "catalan": {"first": 1},
+        "range_up": {"first": 1, "step": 2},
+        "long_term_dependency": {
+            "first": 1,
+            "second": 2,
+            "third": 3,
+            "fourth": 4,
+            "fifth": 5,
+        },
+        "long_term_single_dependency": {
+            "first": 1,
+            "second": 2,
+            "third": 3,
+            "fourth": 4,
+            "fifth": 5,
+            "constant": 2,
+        },
+    }
+
+    print(f"{'benchmark':<40} {'trace':>10} {'plan':>10} {'speedup':>9}")
+    for length in [10, 100]:
+        generator = SequenceGenerator(wanted_length=length)
+        for seq_name, params in cases.items():
+            plan = generator.compile(seq_name)
+            values = tuple(params.values())
+            report(
+                f"{seq_name}, length {length}",
+                microseconds(
+                    lambda: tuple(generator.generate_trace(seq_name, **params)), 20000
+                ),
+                microseconds(lambda: plan.generate_trace(values), 20000),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks the linear recurrence engine (`generator.LinearRecurrence.LinearRecurrence`)
+against the hand-written generators it replaced, and random access against generating a prefix.
+
+Run from the repository root with `python benchmarks/linear_recurrence.py`.
+"""
+
+from typing import Callable, Generator, List
+import sys
+import os
+
+# Make python find our modules
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+
+# Own
+from generator import SequenceGenerator, LinearRecurrence  # noqa: E402
+from _timing import best_of, report  # noqa: E402
+
+
+# Hand-written generators, as they were before the engine
+def hand_fib(length: int, first: int, second: int) -> Generator:
+    """
+    F(n) = F(n - 1) + F(n - 2), with its own loop.
+    """
+    yield first
+    if length == 1:
+        return
+    yield second
+    for _ in range(length - 2):
+        first, second = second, first + second
+        yield second
+
+
+def hand_long_term_dependency(length: int, *seeds: int) -> Generator:
+    """
+    F(n) = F(n - 1) + F(n - 5), with its own loop and tuple shuffling.
+    """
+    yield from seeds[:length]
+    n_5, n_4, n_3, n_2, n_1 = seeds
+    for _ in range(length - 5):
+        n = n_5 + n_1
+        yield n
+        n_1, n_2, n_3, n_4, n_5 = n, n_1, n_2, n_3, n_4
+
+
+def hand_short_term_single_dependency(
+    length: int, first: int, constant: int
+) -> Generator:
+    """
+    F(n) = F(n - 1) * c, with its own loop.
+    """
+    yield first
+    for _ in range(length - 1):
+        first *= constant
+        yield first
+
+
+def milliseconds(statement: Callable[[], object], number: int) -> float:
+    """
+    Times a statement, and returns the best of 5 repetitions in milliseconds per call.
+    """
+    return 1000 * best_of(statement, number, 5)
+
+
+def row(name: str, baseline: float, engine: float) -> None:
+    """
+    Prints one row of the benchmark table.
+    """
+    report(name, baseline, engine, width=48, precision=3)
+
+
+def main() -> None:
+    """
+    Runs all benchmarks and prints a table of milliseconds per call.
+    """
+    print(f"{'benchmark':<48} {'baseline':>10} {'engine':>10} {'speedup':>9}")
+
+    for length in [10, 100, 1000]:
+        fib = LinearRecurrence((1, 1))
+        row(
+            f"fib, length {length}",
+            milliseconds(lambda: list(hand_fib(length, 1, 1)), 2000),
+            milliseconds(lambda: fib.terms([1, 1], length), 2000),
+        )
+
+        long_term = LinearRecurrence((1, 0, 0, 0, 1))
+        row(
+            f"long_term_dependency, length {length}",
+            milliseconds(
+                lambda: list(hand_long_term_dependency(length, 1, 2, 3, 4, 5)), 2000
+            ),
+            milliseconds(lambda: long_term.terms([1, 2, 3, 4, 5], length), 2000),
+        )
+
+        short_term = LinearRecurrence((3,))
+        row(
+            f"short_term_single_dependency, length {length}",
+            milliseconds(
+                lambda: list(hand_short_term_single_dependency(length, 1, 3)), 2000
+            ),
+            milliseconds(lambda: short_term.terms([1], length), 2000),
+        )
+
+    # Batches of seeds run the recurrence once, on columns of terms
+    seed_rows: List[List[int]] = [
+        [first, second, 3, 4, 5] for first in range(30) for second in range(30)
+    ]
+    long_term = LinearRecurrence((1, 0, 0, 0, 1))
+    row(
+        "long_term_dependency, 900 seeds, length 100",
+        milliseconds(
+            lambda: [
+                list(hand_long_term_dependency(100, *seeds)) for seeds in seed_rows
+            ],
+            20,
+        ),
+        milliseconds(lambda: long_term.batch_terms(seed_rows, 100), 20),
+    )
+
+    # Random access: a single far term, against generating the prefix up to it
+    generator = SequenceGenerator(wanted_length=1)
+    for n in [1000, 10000, 100000]:
+        row(
+            f"long_term_dependency, term {n}",
+            milliseconds(
+                lambda: list(hand_long_term_dependency(n + 1, 1, 2, 3, 4, 5))[-1], 5
+            ),
+            milliseconds(
+                lambda: generator.nth_term(
+                    "long_term_dependency",
+                    n,
+                    first=1,
+                    second=2,
+                    third=3,
+                    fourth=4,
+                    fifth=5,
+                ),
+                5,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
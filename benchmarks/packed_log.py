@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks storing and reloading big integer logs as a pickled list of tuples (`helper.dumps`, `helper.loads`)
+against a `generator.Log.Log` of packed integers, saved as numpy files and memory mapped on load.
+
+Run from the repository root with `python benchmarks/packed_log.py`.
+"""
+
+from typing import Any, Dict, List, Tuple
+from tempfile import TemporaryDirectory
+import sys
+import os
+
+# Make python find our modules
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+
+# Own
+from generator import Log, SequenceGenerator  # noqa: E402
+from helper import dumps, loads  # noqa: E402
+from _timing import best_of  # noqa: E402
+
+
+def main() -> None:
+    """
+    Runs all benchmarks and prints a table of megabytes on disk and seconds per step.
+    """
+    cases: List[Tuple[str, int, Dict[str, Any]]] = [
+        ("catalan", 100, {"firsts": list(range(1, 20001))}),
+        ("fib", 100, {"firsts": list(range(150)), "seconds": list(range(150))}),
+    ]
+
+    print(
+        f"{'benchmark':<22} {'format':<8} {'MB':>7} {'save':>8} {'load':>8} {'trace':>10} {'iterate':>8}"
+    )
+    for seq_name, length, lists in cases:
+        log = SequenceGenerator(wanted_length=length).generate_log(seq_name, **lists)
+        compact = Log(log)
+        middle = len(log) // 2
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, seq_name)
+            pickled = (
+                best_of(lambda: dumps(path, log), 1),
+                best_of(lambda: loads(path), 1),
+                best_of(lambda: loads(path)[middle], 1),
+                best_of(lambda: list(loads(path)), 1),
+                os.path.getsize(f"{path}.pkl"),
+            )
+            packed = (
+                best_of(lambda: compact.save(path), 1),
+                best_of(lambda: Log.load(path), 1),
+                best_of(lambda: Log.load(path)[middle], 1),
+                best_of(lambda: list(Log.load(path)), 1),
+                sum(
+                    os.path.getsize(f"{path}-{name}.npy")
+                    for name in ["values", "offsets"]
+                ),
+            )
+
+        name = f"{seq_name}, {len(log)} traces"
+        for label, (save, load, trace, iterate, size) in [
+            ("pickle", pickled),
+            ("packed", packed),
+        ]:
+            print(
+                f"{name:<22} {label:<8} {size / 2 ** 20:>7.1f} {save:>8.3f} {load:>8.3f} {trace:>10.6f} {iterate:>8.3f}"
+            )
+            name = ""
+
+
+if __name__ == "__main__":
+    main()
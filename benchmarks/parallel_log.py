@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks generating a log in worker processes (`generator.ParallelBackend.ParallelBackend`)
+against the serial path, for big integer sequences at large lengths.
+
+Run from the repository root with `python benchmarks/parallel_log.py [max workers]`.
+"""
+
+from typing import Any, Dict, List, Tuple
+import sys
+import os
+
+# Make python find our modules
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+
+# Own
+from generator import SequenceGenerator  # noqa: E402
+from _timing import best_of  # noqa: E402
+
+
+def main() -> None:
+    """
+    Runs all benchmarks and prints a table of seconds per log, per amount of workers.
+    """
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    cases: List[Tuple[str, int, Dict[str, Any]]] = [
+        ("catalan", 2000, {"firsts": list(range(1, 65))}),
+        ("fib", 5000, {"firsts": list(range(8)), "seconds": list(range(8))}),
+    ]
+
+    print(f"{'benchmark':<24} {'workers':>8} {'seconds':>10} {'speedup':>9}")
+    for seq_name, length, lists in cases:
+        generator = SequenceGenerator(wanted_length=length)
+        serial = best_of(lambda: generator.generate_log(seq_name, **lists), 1)
+        print(f"{seq_name + ', ' + str(length):<24} {'serial':>8} {serial:>10.3f}")
+
+        workers = 2
+        while workers <= max_workers:
+            seconds = best_of(
+                lambda: generator.generate_log(seq_name, workers=workers, **lists), 1
+            )
+            print(f"{'':<24} {workers:>8} {seconds:>10.3f} {serial / seconds:>8.2f}x")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
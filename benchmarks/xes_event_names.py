@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks finding the names of all events of an XES log with an XPath lookup per event
+(`event.find(".//*[@key='concept:name']")`, as `XESTransformator` used to do)
+against the scan over direct children of `XESTransformator.__event_name`,
+and reports the time of a whole transform.
+
+Run from the repository root with `python benchmarks/xes_event_names.py [log]`,
+the log defaults to `input_data/BPI_Challenge_2012.xes.gz`.
+"""
+
+from xml.etree import ElementTree as ET
+import gzip
+import sys
+import os
+
+# Make python find our modules
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+
+# Own
+from generator import XESTransformator  # noqa: E402
+from helper import DATAPATH  # noqa: E402
+from _timing import best_of  # noqa: E402
+
+
+def main() -> None:
+    """
+    Runs all benchmarks and prints a table of seconds per log.
+    """
+    log = (
+        sys.argv[1]
+        if len(sys.argv) > 1
+        else os.path.join(DATAPATH, "BPI_Challenge_2012.xes.gz")
+    )
+    if log.endswith(".gz"):
+        with gzip.open(log, "rb") as opened_log:
+            root = ET.parse(opened_log).getroot()
+    else:
+        root = ET.parse(log).getroot()
+    events = [element for element in root.iter() if element.tag.endswith("}event")]
+
+    transformator = XESTransformator()
+    event_name = transformator._XESTransformator__event_name  # type: ignore[attr-defined]
+
+    xpath = best_of(
+        lambda: [
+            event.find(".//*[@key='concept:name']").attrib["value"]  # type: ignore[union-attr]
+            for event in events
+        ],
+        1,
+    )
+    scan = best_of(lambda: [event_name(event) for event in events], 1)
+
+    print(f"{os.path.basename(log)}: {len(events)} events")
+    print(f"{'benchmark':<24} {'seconds':>10} {'speedup':>9}")
+    print(f"{'event names, xpath':<24} {xpath:>10.3f}")
+    print(f"{'event names, scan':<24} {scan:>10.3f} {xpath / scan:>8.2f}x")
+    print(
+        f"{'transform':<24} {best_of(lambda: transformator.transform(log), 1):>10.3f}"
+    )
+    print(
+        f"{'transform, streaming':<24} {best_of(lambda: transformator.transform(log, streaming=True), 1):>10.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
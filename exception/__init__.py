@@ -1,19 +1,25 @@
 from exception.exceptions import (
+    InvalidIndexException,
     InvalidLengthException,
+    InvalidModulusException,
     MissingRequiredParameter,
     MissingItem,
     NotYetImplemented,
     InvalidLogFormat,
     InvalidElementPassed,
     ParsingError,
+    WorkerNotInitialised,
 )
 
 __all__ = [
+    "InvalidIndexException",
     "InvalidLengthException",
+    "InvalidModulusException",
     "MissingRequiredParameter",
     "MissingItem",
     "NotYetImplemented",
     "InvalidLogFormat",
     "InvalidElementPassed",
     "ParsingError",
+    "WorkerNotInitialised",
 ]
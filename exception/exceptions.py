@@ -1,5 +1,5 @@
 # Typing
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 
 class InvalidLengthException(ValueError):
@@ -24,6 +24,69 @@ class InvalidLengthException(ValueError):
         return f"{self.length} -> {self.message}"
 
 
+class InvalidIndexException(ValueError):
+    """
+    Raised when a term of a sequence was requested at an invalid (negative) index.
+
+    Attributes:
+      index -- given index
+    """
+
+    def __init__(
+        self,
+        index: int = 0,
+        message: str = "Attempted to compute a term at invalid index: '%s'",
+    ) -> None:
+        self.index = index
+        self.message = message % index
+        super().__init__(self.message)
+
+    def __repr__(self) -> str:
+        return f"{self.index} -> {self.message}"
+
+
+class InvalidModulusException(ValueError):
+    """
+    Raised when sequences were requested modulo an invalid (non-positive) modulus.
+
+    Attributes:
+      modulus -- given modulus
+    """
+
+    def __init__(
+        self,
+        modulus: int = 0,
+        message: str = "Attempted to reduce a sequence by invalid modulus: '%s'",
+    ) -> None:
+        self.modulus = modulus
+        self.message = message % modulus
+        super().__init__(self.message)
+
+    def __repr__(self) -> str:
+        return f"{self.modulus} -> {self.message}"
+
+
+class WorkerNotInitialised(RuntimeError):
+    """
+    Raised when a worker process is asked for a shard of a log before its log was built.
+
+    Attributes:
+      shard -- requested (start, stop) shard
+    """
+
+    def __init__(
+        self,
+        shard: Tuple[int, int],
+        message: str = "Attempted to generate shard %s in a worker process without a log",
+    ) -> None:
+        self.shard = shard
+        self.message = message % (shard,)
+        super().__init__(self.message)
+
+    def __repr__(self) -> str:
+        return f"{self.shard} -> {self.message}"
+
+
 class NotYetImplemented(NotImplementedError):
     """
     Raised when a sequence generator was given a key for a sequence function that is not implemented.
@@ -1,6 +1,6 @@
 # ! /home/dan/miniconda3/bin/conda "run -n internship python"
 # -*- coding: utf-8 -*-
-from typing import List, Tuple, Dict
+from typing import Any, List, Tuple, Dict
 from os import listdir
 from os.path import join
 
@@ -24,7 +24,10 @@ def transform() -> None:
     for to_transform in TO_TRANSFORM:
         print(f"Attempting to transform '{to_transform}' with '{transformator}'...")
         transformed = transformator.transform(join(DATAPATH, to_transform))
-        success = dumps(join(LOGPATH, f"{to_transform}-transformed"), transformed)
+        # Pickled as a list of tuples, such that the files do not depend on `generator.Log.Log`
+        success = dumps(
+            join(LOGPATH, f"{to_transform}-transformed"), list(transformed)
+        )
         if not success:
             raise OSError("Failed to dump data to disk..")
         else:
@@ -41,7 +44,7 @@ def generate() -> None:
     # Exclude 0 for multiplication issues
     some_numbers = list(range(1, 101))
 
-    configurations_to_use: List[Tuple[str, str, Dict[str, List[int]]]] = [
+    configurations_to_use: List[Tuple[str, str, Dict[str, Any]]] = [
         # Fib, fixed 0 first element, random seconds
         ("fib", "fixed0-random", {"firsts": [0], "seconds": some_numbers}),
         # Fib, fixed 0 second element, random firsts
@@ -181,17 +184,19 @@ def generate() -> None:
                 "fifths": some_numbers,
             },
         ),
-        # Cannot go up to 100 - memory error on laptop (could have been expected)
-        # In stead, go up to 10
+        # Cannot enumerate 100^5 combinations - memory error on laptop (could have been expected)
+        # In stead, sample as many traces as 10^5 combinations would give
         (
             "long_term_dependency",
             "generic",
             {
-                "firsts": list(range(1, 11)),
-                "seconds": list(range(1, 11)),
-                "thirds": list(range(1, 11)),
-                "fourths": list(range(1, 11)),
-                "fifths": list(range(1, 11)),
+                "firsts": some_numbers,
+                "seconds": some_numbers,
+                "thirds": some_numbers,
+                "fourths": some_numbers,
+                "fifths": some_numbers,
+                "sample": 10 ** 5,
+                "seed": 0,
             },
         ),
         # Various long term single dependency logs
@@ -345,18 +350,20 @@ def generate() -> None:
             )
             for const in some_numbers
         ],
-        # Same issue, go only through lists of 10
+        # Same issue, sample in stead
         *[
             (
                 "long_term_single_dependency",
                 f"generic-const{const}",
                 {
-                    "firsts": list(range(1, 11)),
-                    "seconds": list(range(1, 11)),
-                    "thirds": list(range(1, 11)),
-                    "fourths": list(range(1, 11)),
-                    "fifths": list(range(1, 11)),
+                    "firsts": some_numbers,
+                    "seconds": some_numbers,
+                    "thirds": some_numbers,
+                    "fourths": some_numbers,
+                    "fifths": some_numbers,
                     "constants": [const],
+                    "sample": 10 ** 5,
+                    "seed": const,
                 },
             )
             for const in some_numbers
@@ -379,12 +386,15 @@ def generate() -> None:
 
     generator = SequenceGenerator(wanted_length=100)
     for (key, case_name, args) in configurations_to_use:
-        generated_log = generator.generate_log(key, **args)
-        success = dumps(join(LOGPATH, f"{key}-{case_name}"), generated_log)
+        # Interned, such that identical traces are shared and pickled once
+        interned_log = generator.generate_log(key, backend="numpy", intern=True, **args)
+        success = dumps(join(LOGPATH, f"{key}-{case_name}"), list(interned_log))
         if not success:
             raise OSError("Failed to dump data to disk..")
         else:
-            print(f"Success: '{key}-{case_name}'")
+            print(
+                f"Success: '{key}-{case_name}' (dedup ratio {interned_log.dedup_ratio:.2f})"
+            )
 
 
 def generate_datasets() -> None:
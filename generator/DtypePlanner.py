@@ -0,0 +1,296 @@
+# Typing
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Packages
+from functools import partial
+from math import comb, inf, isqrt, log2
+import numpy as np
+
+# Own
+from generator.ParamGrid import ParamGrid
+
+
+class DtypePlanner:
+    """
+    Predicts the largest (absolute) term of every trace in a log before generating it,
+    from the growth rate of the sequence generator, the length and the parameters of the trace.
+    Those predictions are used to choose the narrowest integer type per block of traces,
+    in which the numpy backend computes the block, and in which a compact `generator.Log.Log` stores it.
+
+    All predictions are upper bounds on log2 of the largest term, such that a chosen type never overflows.
+    Linear recurrences with constant coefficients are bounded from their `recurrence` entry
+    of `SequenceGenerator.config`, and sequences without a bound are planned with python integers.
+
+    Attributes:
+      length -- The amount of items per trace.
+      config -- A config object that holds, per sequence generator, a reference to its bound method.
+    """
+
+    dtypes: List[np.dtype] = [
+        np.dtype(np.int8),
+        np.dtype(np.int16),
+        np.dtype(np.int32),
+        np.dtype(np.int64),
+    ]
+    """Candidate integer types, from narrow to wide. Blocks that fit none of them use python integers."""
+
+    margin = 1.0
+    """Amount of bits kept free in every type, covering rounding in the (floating point) predictions."""
+
+    # Class Methods
+    def __init__(
+        self,
+        length: int,
+        generate_trace: Callable[..., Iterable[int]],
+        recurrences: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Initialises the DtypePlanner class.
+
+        Parameters:
+          length -- The amount of items per trace.
+          generate_trace -- Reference to `SequenceGenerator.generate_trace` (with the same length),
+                            used for sequences without a closed form growth rate.
+          recurrences -- Per linear recurrence, its entry of `SequenceGenerator.config`
+                         (with `parameters` and a `recurrence`).
+        """
+        self.length = length
+        """The amount of items per trace."""
+        self.__generate_trace = generate_trace
+        self.config: Dict[str, Callable[[List[np.ndarray]], np.ndarray]] = {
+            "pascal": self.__pascal,
+            "recaman": self.__recaman,
+            "catalan": self.__catalan,
+            "range_up": self.__range_up,
+            "range_down": self.__range_down,
+            "long_term_single_dependency": self.__long_term_single_dependency,
+            "short_term_single_dependency": self.__short_term_single_dependency,
+        }
+        """A config object that holds, per sequence generator, a reference to its bound method.
+        Every method maps (per parameter) log2 of the absolute parameter values
+        to (per trace) an upper bound on log2 of the largest absolute term."""
+
+        # Recurrences with constant coefficients share one bound, from their config entry
+        for seq_name, entry in recurrences.items():
+            coefficients = entry["recurrence"]["coefficients"]
+            if all(isinstance(coefficient, int) for coefficient in coefficients):
+                self.config[seq_name] = partial(
+                    self.__recurrence,
+                    [
+                        entry["parameters"].index(seed)
+                        for seed in entry["recurrence"]["seeds"]
+                    ],
+                    self.growth_rate(coefficients),
+                )
+
+        # Exact per-value magnitudes for sequences without a closed form bound, by (sequence name, value)
+        self.__exact: Dict[Tuple[str, int], float] = {}
+
+    def __repr__(self) -> str:
+        return f"DtypePlanner(length={self.length})"
+
+    # Helper methods
+    @staticmethod
+    def log2_magnitude(value: int) -> float:
+        """
+        Computes log2 of the absolute value of some (arbitrarily large) integer.
+
+        Parameters:
+          value -- The integer.
+
+        Returns log2(|value|), or -inf for 0.
+        """
+        if value == 0:
+            return -inf
+        if abs(value) < 2 ** 1000:
+            return log2(abs(value))
+        return float(abs(value).bit_length())
+
+    @staticmethod
+    def growth_rate(coefficients: Sequence[int]) -> float:
+        """
+        Computes the growth rate of the linear recurrence G(n) = |c_1| G(n - 1) + ... + |c_k| G(n - k),
+        which bounds the growth of F(n) = c_1 F(n - 1) + ... + c_k F(n - k).
+
+        Parameters:
+          coefficients -- The coefficients (c_1, ..., c_k).
+
+        Returns the largest root of x^k = |c_1| x^(k - 1) + ... + |c_k|, but at least 1.
+        """
+        characteristic = [1.0] + [
+            -float(abs(coefficient)) for coefficient in coefficients
+        ]
+        roots = np.roots(characteristic)
+        largest = float(np.abs(roots).max()) if len(roots) else 0.0
+
+        # Rounding in the roots should only ever loosen the bound
+        return max(largest * (1 + 1e-9), 1.0)
+
+    def __exact_magnitude(self, seq_name: str, value: int) -> float:
+        """
+        Computes log2 of the largest absolute term of the trace of a single parameter sequence,
+        where the parameter is `|value|`. Results are remembered.
+
+        Parameters:
+          seq_name -- The name of the sequence generation method.
+          value -- The value of the (single) parameter.
+
+        Returns log2 of the largest absolute term.
+        """
+        key = (seq_name, abs(value))
+        if key not in self.__exact:
+            trace = self.__generate_trace(seq_name, first=abs(value))
+            self.__exact[key] = self.log2_magnitude(max(abs(term) for term in trace))
+
+        return self.__exact[key]
+
+    # Bounds, log2 of the largest term in every trace
+    def __recurrence(
+        self, seeds: List[int], growth_rate: float, magnitudes: List[np.ndarray]
+    ) -> np.ndarray:
+        """
+        |F(n)| <= max|seed| * rho^n, with rho the growth rate (e.g. phi for fib),
+        as rho^j >= 1 for the seeds and rho^k = |c_1| rho^(k - 1) + ... + |c_k|.
+        """
+        largest = np.maximum.reduce([magnitudes[seed] for seed in seeds])
+        return largest + (self.length - 1) * log2(growth_rate)
+
+    def __pascal(self, magnitudes: List[np.ndarray]) -> np.ndarray:
+        """
+        |first * C(r, c)| <= |first| * C(r, r // 2) for row r of the last term.
+        """
+        (first,) = magnitudes
+        row = (isqrt(8 * (self.length - 1) + 1) - 1) // 2
+        return first + log2(comb(row, row // 2))
+
+    def __recaman(self, magnitudes: List[np.ndarray]) -> np.ndarray:
+        """
+        |a(n)| <= |first| + n (n + 1) / 2, as every step adds at most n.
+        """
+        (first,) = magnitudes
+        return np.logaddexp2(first, log2(max(self.length * (self.length - 1) // 2, 1)))
+
+    def __catalan(self, magnitudes: List[np.ndarray]) -> np.ndarray:
+        """
+        Every term is a polynomial in `first` with nonnegative coefficients,
+        so the trace of |first| dominates. Those traces are computed exactly (see `DtypePlanner.magnitudes`).
+        """
+        (first,) = magnitudes
+        return first
+
+    def __range_up(self, magnitudes: List[np.ndarray]) -> np.ndarray:
+        """
+        |first + n * step| <= |first| + length * |step|, and positions up to length are used.
+        """
+        first, step = magnitudes
+        terms = np.logaddexp2(first, step + log2(self.length))
+        return np.maximum(terms, log2(self.length))
+
+    def __range_down(self, magnitudes: List[np.ndarray]) -> np.ndarray:
+        """
+        |last + (length - n) * step - 1| <= |last| + length * |step| + 1
+        """
+        last, step = magnitudes
+        terms = np.logaddexp2(np.logaddexp2(last, step + log2(self.length)), 0.0)
+        return np.maximum(terms, log2(self.length))
+
+    def __long_term_single_dependency(self, magnitudes: List[np.ndarray]) -> np.ndarray:
+        """
+        |F(n)| = |seed[n % 5]| * |c|^(n // 5), and the constant itself is used in computations.
+        """
+        *seeds, constant = magnitudes
+        exponent = np.maximum(constant, 0.0) * ((self.length - 1) // 5)
+        return np.maximum(np.maximum.reduce(seeds) + exponent, constant)
+
+    def __short_term_single_dependency(
+        self, magnitudes: List[np.ndarray]
+    ) -> np.ndarray:
+        """
+        |F(n)| = |first| * |c|^n, and the constant itself is used in computations.
+        """
+        first, constant = magnitudes
+        exponent = np.maximum(constant, 0.0) * (self.length - 1)
+        return np.maximum(first + exponent, constant)
+
+    # Public methods
+    def magnitudes(
+        self, seq_name: str, grid: ParamGrid, start: int, stop: int
+    ) -> np.ndarray:
+        """
+        Predicts log2 of the largest absolute term (and parameter) of the traces `start` up to `stop` of `grid`.
+
+        Parameters:
+          seq_name -- The name of the sequence generation method.
+          grid -- The parameter combinations, in `SequenceGenerator.config` order.
+          start -- The first trace.
+          stop -- The trace after the last trace.
+
+        Returns an array with an upper bound on log2 of the largest absolute term, per trace.
+        Sequences without a bound in `self.config` (e.g. recurrences that only have a config entry)
+        are not bounded, such that they are planned with python integers.
+        """
+        if seq_name not in self.config:
+            return np.full(len(range(start, min(stop, len(grid)))), inf)
+
+        tables = []
+        for values in grid.value_lists:
+            if seq_name == "catalan":
+                per_value = [
+                    self.__exact_magnitude(seq_name, value) for value in values
+                ]
+            else:
+                per_value = [self.log2_magnitude(value) for value in values]
+            tables.append(np.array(per_value, dtype=np.float64))
+        columns = grid.take(tables, start, stop)
+
+        # Parameters are part of the computation as well
+        return np.maximum(self.config[seq_name](columns), np.maximum.reduce(columns))
+
+    def fits(self, magnitudes: np.ndarray) -> np.ndarray:
+        """
+        Checks which predicted magnitudes fit in the widest integer type.
+
+        Parameters:
+          magnitudes -- log2 of the largest absolute integers to hold.
+
+        Returns a boolean array, true where the magnitude fits.
+        """
+        return magnitudes + self.margin < self.dtypes[-1].itemsize * 8 - 1
+
+    def dtype(self, magnitude: float) -> np.dtype:
+        """
+        Chooses the narrowest integer type that holds integers up to 2 ** `magnitude` in absolute value.
+
+        Parameters:
+          magnitude -- log2 of the largest absolute integer to hold.
+
+        Returns a numpy integer type, or the object type (python integers) if none fits.
+        """
+        for dtype in self.dtypes:
+            if magnitude + self.margin < dtype.itemsize * 8 - 1:
+                return dtype
+
+        return np.dtype(object)
+
+    def plan(
+        self, seq_name: str, grid: ParamGrid, block_size: int
+    ) -> List[Tuple[int, int, np.dtype]]:
+        """
+        Chooses an integer type per block of `block_size` traces of `grid`.
+
+        Parameters:
+          seq_name -- The name of the sequence generation method.
+          grid -- The parameter combinations, in `SequenceGenerator.config` order.
+          block_size -- The amount of traces per block.
+
+        Returns a list of (start, stop, dtype) tuples, one per block.
+        """
+        total = len(grid)
+
+        plan = []
+        for start in range(0, total, block_size):
+            stop = min(start + block_size, total)
+            magnitude = float(self.magnitudes(seq_name, grid, start, stop).max())
+            plan.append((start, stop, self.dtype(magnitude)))
+
+        return plan
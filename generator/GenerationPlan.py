@@ -0,0 +1,117 @@
+# Typing
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Packages
+from itertools import product
+
+# Own
+from exception import MissingRequiredParameter
+
+
+class GenerationPlan:
+    """
+    A sequence generator that was validated once, for one length, see `SequenceGenerator.compile`.
+
+    The plan holds a method reference that takes the parameter values in config order,
+    such that generating a trace no longer checks the sequence name, the parameters or builds a dictionary.
+
+    Attributes:
+      seq_name -- The name of the sequence generation method.
+      length -- The amount of items to generate per trace.
+      names -- The names of the parameters, in config order.
+      value_lists -- Per parameter, the list of values to use in `GenerationPlan.generate_log`, or None.
+    """
+
+    # Class Methods
+    def __init__(
+        self,
+        seq_name: str,
+        length: int,
+        names: List[str],
+        method: Callable[[Sequence[int]], Iterable[int]],
+        value_lists: Optional[List[List[int]]] = None,
+    ) -> None:
+        """
+        Initialises the GenerationPlan class.
+
+        Parameters:
+          seq_name -- The name of the sequence generation method.
+          length -- The amount of items to generate per trace.
+          names -- The names of the parameters, in config order.
+          method -- Generates the terms of a trace, given the parameter values in config order.
+          value_lists -- Per parameter, the list of values to use in `GenerationPlan.generate_log`.
+        """
+        self.seq_name = seq_name
+        """The name of the sequence generation method."""
+        self.length = length
+        """The amount of items to generate per trace."""
+        self.names = names
+        """The names of the parameters, in config order."""
+        self.value_lists = value_lists
+        """Per parameter, the list of values to use in `GenerationPlan.generate_log`, or None."""
+
+        self.__method = method
+
+    def __repr__(self) -> str:
+        return f"GenerationPlan(seq_name={self.seq_name}, length={self.length}, names={self.names})"
+
+    # Public methods
+    def bind(self, value_lists: List[List[int]]) -> "GenerationPlan":
+        """
+        Gets a plan with the same method reference, for other parameter lists.
+
+        Parameters:
+          value_lists -- Per parameter (in config order), the list of values to use.
+
+        Returns a `GenerationPlan`.
+        """
+        return GenerationPlan(
+            self.seq_name, self.length, self.names, self.__method, value_lists
+        )
+
+    def generate_trace(self, values: Sequence[int]) -> Tuple[int, ...]:
+        """
+        Generates a single trace, without any checks.
+
+        Parameters:
+          values -- The parameter values, in config order.
+
+        Returns the trace as a tuple, equal to `tuple(SequenceGenerator.generate_trace(...))`.
+        """
+        return tuple(self.__method(values))
+
+    def generate_traces(self, rows: Iterable[Sequence[int]]) -> List[Tuple[int, ...]]:
+        """
+        Generates many traces, without any checks.
+
+        Parameters:
+          rows -- Per trace, the parameter values in config order.
+
+        Returns a list of traces, one per row.
+        """
+        method = self.__method
+        return [tuple(method(values)) for values in rows]
+
+    def iter_log(self) -> Iterator[Tuple[int, ...]]:
+        """
+        Generates the traces for the cartesian product of `self.value_lists`, one at a time.
+
+        Raises a `MissingRequiredParameter` when the plan was compiled without parameter lists.
+
+        Returns an iterator of traces, in the same order as `SequenceGenerator.generate_log`.
+        """
+        if self.value_lists is None:
+            raise MissingRequiredParameter([name + "s" for name in self.names])
+
+        method = self.__method
+        return (tuple(method(values)) for values in product(*self.value_lists))
+
+    def generate_log(self) -> List[Tuple[int, ...]]:
+        """
+        Generates the traces for the cartesian product of `self.value_lists`.
+
+        Raises a `MissingRequiredParameter` when the plan was compiled without parameter lists.
+
+        Returns a log of traces as a list of tuples, equal to `SequenceGenerator.generate_log`.
+        """
+        return list(self.iter_log())
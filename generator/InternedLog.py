@@ -0,0 +1,107 @@
+# Typing
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+# Packages
+from array import array
+import numpy as np
+
+
+class InternedLog:
+    """
+    A log in which identical traces are stored once.
+    Every trace is hashed as it is added, and a trace that was seen before is replaced by a reference to the first one,
+    such that the log keeps the distinct traces, a reference per trace and a count per distinct trace.
+
+    Traces are shared objects, so a list of this log (`list(log)`) is pickled with every distinct trace once.
+    The log compares equal to the list of tuples that `SequenceGenerator.generate_log` returns.
+
+    Attributes:
+      traces -- The distinct traces, in order of first occurrence.
+      counts -- Per distinct trace, the amount of times it occurs in the log.
+      indices -- Per trace of the log, the index of its distinct trace.
+    """
+
+    # Class Methods
+    def __init__(self, traces: Iterable[Tuple[int, ...]] = ()) -> None:
+        """
+        Initialises the InternedLog class.
+
+        Parameters:
+          traces -- The traces of the log, in order.
+        """
+        self.traces: List[Tuple[int, ...]] = []
+        """The distinct traces, in order of first occurrence."""
+        self.counts: List[int] = []
+        """Per distinct trace, the amount of times it occurs in the log."""
+
+        self.__lookup: Dict[Tuple[int, ...], int] = {}
+        self.__indices = array("q")
+        self.extend(traces)
+
+    def __repr__(self) -> str:
+        return f"InternedLog(traces={len(self)}, distinct={len(self.traces)})"
+
+    def __len__(self) -> int:
+        return len(self.__indices)
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        traces = self.traces
+        return (traces[index] for index in self.__indices)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[int, ...], List[Tuple[int, ...]]]:
+        if isinstance(index, slice):
+            return [self.traces[position] for position in self.__indices[index]]
+        return self.traces[self.__indices[index]]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (InternedLog, list)):
+            return len(self) == len(other) and all(
+                left == right for left, right in zip(self, other)
+            )
+        return NotImplemented
+
+    # Public methods
+    @property
+    def indices(self) -> np.ndarray:
+        """
+        Per trace of the log, the index of its distinct trace.
+        """
+        return np.array(self.__indices, dtype=np.int64)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """
+        The amount of traces per distinct trace, 1.0 for a log without duplicates (or without traces).
+        """
+        return len(self) / len(self.traces) if self.traces else 1.0
+
+    def append(self, trace: Tuple[int, ...]) -> Tuple[int, ...]:
+        """
+        Adds a trace to the end of the log, interning it.
+
+        Parameters:
+          trace -- The trace to add.
+
+        Returns the shared (interned) trace, which is equal to `trace`.
+        """
+        index = self.__lookup.setdefault(trace, len(self.traces))
+        if index == len(self.traces):
+            self.traces.append(trace)
+            self.counts.append(1)
+        else:
+            self.counts[index] += 1
+
+        self.__indices.append(index)
+        return self.traces[index]
+
+    def extend(self, traces: Iterable[Tuple[int, ...]]) -> None:
+        """
+        Adds traces to the end of the log, interning every one of them.
+
+        Parameters:
+          traces -- The traces to add, in order.
+        """
+        for trace in traces:
+            self.append(trace)
@@ -0,0 +1,277 @@
+# Typing
+from typing import Any, Generator, List, Sequence, Tuple
+
+# Packages
+from itertools import islice
+import numpy as np
+
+# Own
+from exception import InvalidLengthException
+
+
+class LinearRecurrence:
+    """
+    Evaluates an order-k linear recurrence with constant coefficients,
+    F(n) = c_1 F(n - 1) + c_2 F(n - 2) + ... + c_k F(n - k),
+    where the first k terms (the seeds) are given.
+
+    Terms can be generated in order, and single terms can be computed directly (jump-ahead).
+    Jumping ahead raises the companion matrix of the recurrence to the n-th power,
+    which is done by computing x^n modulo the characteristic polynomial x^k - c_1 x^(k - 1) - ... - c_k:
+    O(k^2 log n) big integer operations in stead of O(k^3 log n) for the matrix itself.
+
+    Many seeds can be evaluated at once, by running the recurrence on columns of terms.
+
+    Attributes:
+      coefficients -- The coefficients (c_1, ..., c_k), where c_i multiplies F(n - i).
+      order -- The order k of the recurrence, the amount of seeds.
+    """
+
+    # Class Methods
+    def __init__(self, coefficients: Sequence[int]) -> None:
+        """
+        Initialises the LinearRecurrence class.
+
+        Parameters:
+          coefficients -- The coefficients (c_1, ..., c_k), where c_i multiplies F(n - i).
+                          Trailing zeros are meaningful: they increase the amount of seeds.
+        """
+        self.coefficients: Tuple[int, ...] = tuple(coefficients)
+        """The coefficients (c_1, ..., c_k), where c_i multiplies F(n - i)."""
+        self.order = len(self.coefficients)
+        """The order k of the recurrence, the amount of seeds."""
+
+        # Only nonzero coefficients contribute, as (lag, coefficient)
+        self.__lags = [
+            (lag, coefficient)
+            for lag, coefficient in enumerate(self.coefficients, start=1)
+            if coefficient != 0
+        ]
+
+    def __repr__(self) -> str:
+        return f"LinearRecurrence(coefficients={self.coefficients})"
+
+    # Helper methods
+    def __check_seeds(self, seeds: Sequence[int]) -> None:
+        """
+        Checks that exactly `self.order` seeds are given.
+
+        Parameters:
+          seeds -- The first k terms.
+
+        Raises an `InvalidLengthException` when the amount of seeds does not match the order.
+        """
+        if len(seeds) != self.order:
+            raise InvalidLengthException(
+                length=len(seeds),
+                message=f"Expected {self.order} seeds for {self!r}, but got %s",
+            )
+
+    def __shift(self, polynomial: List[int]) -> List[int]:
+        """
+        Multiplies a polynomial by x, modulo the characteristic polynomial.
+        The coefficient of x^k is replaced using x^k = c_1 x^(k - 1) + ... + c_k.
+
+        Parameters:
+          polynomial -- The coefficients of x^0 up to x^(k - 1).
+
+        Returns the coefficients of the product, x^0 up to x^(k - 1).
+        """
+        top = polynomial[-1]
+        shifted = [0] + polynomial[:-1]
+        if top:
+            for lag, coefficient in self.__lags:
+                shifted[self.order - lag] += top * coefficient
+        return shifted
+
+    def __multiply(self, left: List[int], right: List[int]) -> List[int]:
+        """
+        Multiplies two polynomials, modulo the characteristic polynomial.
+
+        Parameters:
+          left -- The coefficients of x^0 up to x^(k - 1).
+          right -- The coefficients of x^0 up to x^(k - 1).
+
+        Returns the coefficients of the product, x^0 up to x^(k - 1).
+        """
+        k = self.order
+        product = [0] * (2 * k - 1)
+        for i, a in enumerate(left):
+            if a:
+                for j, b in enumerate(right):
+                    product[i + j] += a * b
+
+        # Reduce from the highest degree down: x^d = sum_i c_i x^(d - i)
+        for degree in range(2 * k - 2, k - 1, -1):
+            top = product[degree]
+            if top:
+                for lag, coefficient in self.__lags:
+                    product[degree - lag] += top * coefficient
+        return product[:k]
+
+    def __power(self, n: int) -> List[int]:
+        """
+        Computes x^n modulo the characteristic polynomial, by square and multiply.
+        Its coefficients (a_0, ..., a_(k - 1)) satisfy F(n) = a_0 F(0) + ... + a_(k - 1) F(k - 1) for any seeds.
+
+        Parameters:
+          n -- The (nonnegative) exponent.
+
+        Returns the coefficients of x^0 up to x^(k - 1).
+        """
+        result = [1] + [0] * (self.order - 1)
+        for bit in bin(n)[2:]:
+            result = self.__multiply(result, result)
+            if bit == "1":
+                result = self.__shift(result)
+        return result
+
+    # Public methods
+    def terms(self, seeds: Sequence[Any], length: int) -> List[Any]:
+        """
+        Computes the first `length` terms.
+        Terms only need to support addition and multiplication by an integer,
+        such that seeds can be integers or (object) arrays of integers, see `LinearRecurrence.batch_terms`.
+
+        Parameters:
+          seeds -- The first k terms.
+          length -- The amount of terms to compute.
+
+        Returns a list of terms, which starts with (a prefix of) the seeds.
+        """
+        self.__check_seeds(seeds)
+        terms = list(seeds[:length])
+        start = len(terms)
+        count = length - start
+        if count <= 0:
+            return terms
+
+        lags = self.__lags
+        if not lags:
+            terms.extend([0 * terms[0]] * count)
+            return terms
+
+        # One reader per lag, that reads F(n - lag) while F(n) is appended.
+        # List iterators see appended items, so this avoids indexing in the hot loop.
+        readers = [islice(terms, start - lag, None) for lag, _ in lags]
+        append = terms.append
+
+        # Most recurrences have one or two nonzero coefficients, often equal to 1
+        if len(lags) == 1:
+            ((_, coefficient),) = lags
+            (reader,) = readers
+            if coefficient == 1:
+                for term in islice(reader, count):
+                    append(term)
+            else:
+                for term in islice(reader, count):
+                    append(coefficient * term)
+        elif len(lags) == 2 and lags[0][1] == lags[1][1] == 1:
+            first, second = readers
+            for term, other in zip(islice(first, count), second):
+                append(term + other)
+        else:
+            coefficients = [coefficient for _, coefficient in lags]
+            for values in islice(zip(*readers), count):
+                append(sum(c * value for c, value in zip(coefficients, values)))
+
+        return terms
+
+    def stream(self, seeds: Sequence[int]) -> Generator:
+        """
+        Yields all terms, one by one, without bound.
+        Only the last k terms are kept.
+
+        Parameters:
+          seeds -- The first k terms.
+
+        Returns an infinite generator of terms.
+        """
+        self.__check_seeds(seeds)
+        window = list(seeds)
+        yield from window
+
+        lags = self.__lags
+        while True:
+            current = sum(coefficient * window[-lag] for lag, coefficient in lags)
+            yield current
+            window.append(current)
+            del window[0]
+
+    def nth_term(self, seeds: Sequence[int], n: int) -> int:
+        """
+        Computes the term at index `n` directly, in O(k^2 log n) operations.
+
+        Parameters:
+          seeds -- The first k terms.
+          n -- The (zero-based, nonnegative) index of the wanted term.
+
+        Returns the term at index `n`.
+        """
+        self.__check_seeds(seeds)
+        if n < self.order:
+            return seeds[n]
+        return sum(a * seed for a, seed in zip(self.__power(n), seeds))
+
+    def jump(self, seeds: Sequence[int], n: int) -> Tuple[int, ...]:
+        """
+        Jumps ahead `n` terms: computes the k consecutive terms starting at index `n`,
+        which are the seeds to continue the recurrence from.
+
+        Parameters:
+          seeds -- The first k terms.
+          n -- The (zero-based, nonnegative) index of the first wanted term.
+
+        Returns the terms at indices `n` up to `n + k`.
+        """
+        self.__check_seeds(seeds)
+        polynomial = self.__power(n)
+
+        state = []
+        for _ in range(self.order):
+            state.append(sum(a * seed for a, seed in zip(polynomial, seeds)))
+            polynomial = self.__shift(polynomial)
+        return tuple(state)
+
+    def batch_terms(
+        self, seed_rows: Sequence[Sequence[int]], length: int
+    ) -> List[Tuple[int, ...]]:
+        """
+        Computes the first `length` terms for many seeds at once.
+        The recurrence is evaluated once, on columns (object arrays) that hold a term of every trace,
+        such that the loop over traces runs inside numpy.
+
+        Parameters:
+          seed_rows -- Per trace, the first k terms.
+          length -- The amount of terms per trace.
+
+        Returns a list of traces, one per row of seeds.
+        """
+        for seeds in seed_rows:
+            self.__check_seeds(seeds)
+        if not seed_rows or length <= 0:
+            return [()] * len(seed_rows)
+
+        columns = [np.array(column, dtype=object) for column in zip(*seed_rows)]
+        terms = self.terms(columns, length)
+        return list(zip(*[term.tolist() for term in terms]))
+
+    def batch_nth_term(self, seed_rows: Sequence[Sequence[int]], n: int) -> List[int]:
+        """
+        Computes the term at index `n` for many seeds at once, sharing the jump-ahead between them.
+
+        Parameters:
+          seed_rows -- Per trace, the first k terms.
+          n -- The (zero-based, nonnegative) index of the wanted term.
+
+        Returns a list of terms, one per row of seeds.
+        """
+        if n < self.order:
+            return [self.nth_term(seeds, n) for seeds in seed_rows]
+
+        polynomial = self.__power(n)
+        terms = []
+        for seeds in seed_rows:
+            self.__check_seeds(seeds)
+            terms.append(sum(a * seed for a, seed in zip(polynomial, seeds)))
+        return terms
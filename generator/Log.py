@@ -0,0 +1,337 @@
+# Typing
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
+
+# Packages
+from array import array
+import numpy as np
+
+# Own
+from generator.InternedLog import InternedLog
+from generator.PackedInts import PackedInts
+from generator.PrefixLog import PrefixLog
+
+
+class Log:
+    """
+    A log stored as one flat buffer of terms, plus the offset of every trace in that buffer.
+    Trace `i` is made up of the terms `offsets[i]` up to `offsets[i + 1]`, such that traces can have any length.
+
+    Both buffers are typed arrays of the narrowest signed integer type that holds every value seen so far,
+    and are widened (up to 64 bits) when a larger value is added.
+    Only a log with a value beyond 64 bits packs its terms into 64 bit limbs (see `generator.PackedInts.PackedInts`),
+    which are converted back to python integers when traces are requested.
+
+    A log is saved as plain numpy files (`Log.save`), and loaded without a python integer per term (`Log.load`),
+    memory mapped by default.
+
+    The log compares equal to the list of tuples that `SequenceGenerator.generate_log`
+    and `XESTransformator.transform` used to return, and indexing it gives a tuple.
+
+    Attributes:
+      values -- All terms of all traces, in order.
+      offsets -- Per trace, the index of its first term in `values`, followed by the total amount of terms.
+    """
+
+    typecodes = ["b", "h", "i", "q"]
+    """Signed `array` typecodes, from narrow to wide. Buffers that fit none of them are packed."""
+
+    # Class Methods
+    def __init__(self, traces: Iterable[Tuple[int, ...]] = ()) -> None:
+        """
+        Initialises the Log class.
+
+        Parameters:
+          traces -- The traces of the log, in order.
+        """
+        # Growing buffers are arrays (or packed integers), loaded buffers are (memory mapped) numpy arrays
+        self.__values: Union[array, PackedInts, np.ndarray] = array(Log.typecodes[0])
+        self.__offsets: Union[array, np.ndarray] = array(Log.typecodes[0], [0])
+        self.extend(traces)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "Log":
+        """
+        Loads a log saved by `Log.save`, without unpickling and without creating a python integer per term.
+
+        Parameters:
+          path -- The path the log was saved to, without extension.
+          mmap -- Whether to memory map the buffers (read-only), in stead of reading them into memory.
+                  Adding traces to a memory mapped log copies its buffers into memory.
+
+        Returns a `Log` instance.
+        """
+        mmap_mode: Optional[Literal["r", "r+", "c"]] = "r" if mmap else None
+        values = np.load(f"{path}-values.npy", mmap_mode=mmap_mode, allow_pickle=False)
+        offsets = np.load(
+            f"{path}-offsets.npy", mmap_mode=mmap_mode, allow_pickle=False
+        )
+
+        # Packed integers are the only unsigned buffer
+        if values.dtype == np.uint64:
+            widths = np.load(
+                f"{path}-widths.npy", mmap_mode=mmap_mode, allow_pickle=False
+            )
+            values = PackedInts.from_limbs(values, widths)
+
+        log = cls()
+        log.__values = values
+        log.__offsets = offsets
+        return log
+
+    def __repr__(self) -> str:
+        return f"Log(traces={len(self)}, terms={len(self.__values)}, dtype={self.__dtype()})"
+
+    def __len__(self) -> int:
+        return len(self.__offsets) - 1
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        # Converts the terms of a block of traces at once
+        offsets = self.__offsets
+        traces_per_block = 4096
+        for begin in range(0, len(self), traces_per_block):
+            end = min(begin + traces_per_block, len(self))
+            bounds = offsets[begin : end + 1].tolist()
+            terms = self.__terms(bounds[0], bounds[-1])
+            first = bounds[0]
+            for start, stop in zip(bounds, bounds[1:]):
+                yield tuple(terms[start - first : stop - first])
+
+    @overload
+    def __getitem__(self, index: int) -> Tuple[int, ...]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Tuple[int, ...]]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[int, ...], List[Tuple[int, ...]]]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(len(self))[index]]
+
+        # Resolves negative indices, and raises an IndexError when out of range
+        position = range(len(self))[index]
+        start, stop = self.__offsets[position], self.__offsets[position + 1]
+        return tuple(self.__terms(int(start), int(stop)))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (Log, InternedLog, PrefixLog, list)):
+            return len(self) == len(other) and all(
+                left == right for left, right in zip(self, other)
+            )
+        return NotImplemented
+
+    # Helper methods
+    def __dtype(self) -> np.dtype:
+        """
+        Gets the type of the terms, without converting them.
+
+        Returns an integer type, or the object type for packed integers.
+        """
+        if isinstance(self.__values, PackedInts):
+            return np.dtype(object)
+        return np.dtype(
+            self.__values.typecode
+            if isinstance(self.__values, array)
+            else self.__values.dtype
+        )
+
+    def __terms(self, start: int, stop: int) -> List[int]:
+        """
+        Converts the terms `start` up to `stop` into python integers.
+
+        Parameters:
+          start -- The first term.
+          stop -- The term after the last term.
+
+        Returns a list of python integers.
+        """
+        if isinstance(self.__values, PackedInts):
+            return self.__values.unpack(start, stop)
+        return self.__values[start:stop].tolist()
+
+    def __widen(self, buffer: array) -> Union[array, PackedInts]:
+        """
+        Copies a buffer into the next wider integer type.
+
+        Parameters:
+          buffer -- The buffer to widen.
+
+        Returns an `array` of the next typecode in `Log.typecodes`, or packed integers after 64 bits.
+        """
+        wider = [
+            code for code in Log.typecodes if array(code).itemsize > buffer.itemsize
+        ]
+        return array(wider[0], buffer) if wider else PackedInts(buffer)
+
+    def __store(
+        self, buffer: Union[array, PackedInts, np.ndarray], items: Iterable[int]
+    ) -> Union[array, PackedInts]:
+        """
+        Adds items to the end of a buffer, widening the buffer until every item fits.
+
+        Parameters:
+          buffer -- The buffer to add to.
+          items -- The items to add.
+
+        Returns the buffer holding the items, which is either `buffer` or a (wider) copy of it.
+        """
+        # A loaded buffer is copied into a growing one
+        if isinstance(buffer, np.ndarray):
+            buffer = array(buffer.dtype.char, buffer.tobytes())
+
+        size = len(buffer)
+        while isinstance(buffer, array):
+            try:
+                buffer.extend(items)
+                return buffer
+            except OverflowError:
+                # Drop what was added before the item that did not fit, and retry with a wider type
+                del buffer[size:]
+                buffer = self.__widen(buffer)
+
+        # Packed integers hold any value
+        buffer.extend(items)
+        return buffer
+
+    def __store_offsets(self, ends: Iterable[int]) -> None:
+        """
+        Adds the ends of traces to the offsets, widening the offsets until every end fits.
+
+        Parameters:
+          ends -- The index after the last term of every added trace, in order.
+        """
+        offsets = self.__store(self.__offsets, ends)
+        if isinstance(offsets, PackedInts):
+            raise OverflowError("A log holds at most 2 ** 63 - 1 terms")
+        self.__offsets = offsets
+
+    def __store_array(
+        self, buffer: Union[array, PackedInts, np.ndarray], items: np.ndarray
+    ) -> Union[array, PackedInts]:
+        """
+        Adds the items of an integer array to the end of a buffer, without converting them to python integers.
+        The buffer is widened (once) to the narrowest type that holds both the buffer and the items.
+
+        Parameters:
+          buffer -- The buffer to add to.
+          items -- A one dimensional array of (at most 64 bit) integers.
+
+        Returns the buffer holding the items, which is either `buffer` or a (wider) copy of it.
+        """
+        if isinstance(buffer, np.ndarray):
+            buffer = array(buffer.dtype.char, buffer.tobytes())
+        if isinstance(buffer, PackedInts):
+            buffer.extend(items.tolist())
+            return buffer
+        if not len(items):
+            return buffer
+
+        low, high = int(items.min()), int(items.max())
+        code = next(
+            code
+            for code in Log.typecodes
+            if array(code).itemsize >= buffer.itemsize
+            and -(2 ** (8 * array(code).itemsize - 1)) <= low
+            and high < 2 ** (8 * array(code).itemsize - 1)
+        )
+        if code != buffer.typecode:
+            buffer = array(code, buffer)
+        buffer.frombytes(items.astype(code, copy=False).tobytes())
+        return buffer
+
+    # Public methods
+    @property
+    def values(self) -> np.ndarray:
+        """
+        All terms of all traces, in order, as a copy of the buffer (an object array after 64 bits).
+        """
+        if isinstance(self.__values, PackedInts):
+            return np.array(self.__values.unpack(), dtype=object)
+        return np.array(self.__values, dtype=self.__dtype())
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """
+        Per trace, the index of its first term in `values`, followed by the total amount of terms.
+        """
+        return np.array(self.__offsets, dtype=np.int64)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of both buffers in bytes.
+        """
+        if isinstance(self.__values, PackedInts):
+            size = self.__values.nbytes
+        else:
+            size = len(self.__values) * self.__values.itemsize
+        return size + len(self.__offsets) * self.__offsets.itemsize
+
+    def append(self, trace: Iterable[int]) -> None:
+        """
+        Adds a trace to the end of the log.
+
+        Parameters:
+          trace -- The terms of the trace.
+        """
+        # Widening retries the trace, so iterators are consumed once
+        trace = tuple(trace)
+        self.__values = self.__store(self.__values, trace)
+        self.__store_offsets([len(self.__values)])
+
+    def extend(self, traces: Iterable[Iterable[int]]) -> None:
+        """
+        Adds traces to the end of the log.
+
+        Parameters:
+          traces -- The traces to add, in order.
+        """
+        for trace in traces:
+            self.append(trace)
+
+    def extend_array(self, traces: np.ndarray) -> None:
+        """
+        Adds the rows of a 2D array as traces to the end of the log.
+        Integer arrays are copied into the buffer as they are, without a python integer per term,
+        such that the (narrow) type chosen for the array is kept.
+
+        Parameters:
+          traces -- An `(n_traces, length)` array of integers, or of python integers (object).
+        """
+        if traces.dtype == object:
+            self.extend(map(tuple, traces.tolist()))
+            return
+
+        rows, length = traces.shape
+        ends = len(self.__values) + length * np.arange(1, rows + 1)
+        self.__values = self.__store_array(self.__values, traces.ravel())
+        self.__store_offsets(ends.tolist())
+
+    def save(self, path: str) -> None:
+        """
+        Saves the log as two numpy files, `{path}-values.npy` and `{path}-offsets.npy`, without pickling.
+        Packed integers are saved as their limbs, and a third file `{path}-widths.npy`
+        with the amount of limbs per integer, see `generator.PackedInts.PackedInts`.
+
+        Parameters:
+          path -- The path to save to, without extension.
+        """
+        if isinstance(self.__values, PackedInts):
+            values = self.__values.limbs
+            widths = self.__values.widths
+            np.save(f"{path}-widths.npy", widths, allow_pickle=False)
+        else:
+            values = np.asarray(self.__values)
+
+        np.save(f"{path}-values.npy", values, allow_pickle=False)
+        np.save(f"{path}-offsets.npy", np.asarray(self.__offsets), allow_pickle=False)
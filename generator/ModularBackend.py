@@ -0,0 +1,274 @@
+# Typing
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# Packages
+from functools import partial
+import numpy as np
+
+# Own
+from generator.ParamGrid import ParamGrid
+from generator.Recaman import Recaman
+
+
+class ModularBackend:
+    """
+    Generates entire logs at once as `(n_traces, length)` integer arrays, where every term is reduced modulo `modulus`.
+    Every sequence generator is supported, and no intermediate result ever exceeds `modulus` squared,
+    such that all arithmetic is done with 64 bit integers (for moduli up to `ModularBackend.max_int64_modulus`).
+
+    Recurrences are evaluated one position at a time, for all traces at once.
+    Linear recurrences are read from the `recurrence` entries of `SequenceGenerator.config`,
+    such that a recurrence that only has a config entry is supported as well.
+    The result is identical to reducing every term of `SequenceGenerator.generate_log` modulo `modulus`.
+
+    Attributes:
+      length -- The amount of items to generate per trace.
+      modulus -- The modulus that all terms are reduced by.
+      dtype -- The integer type used in computations, either int64 or object (python integers) for huge moduli.
+      block_size -- The maximum amount of array elements computed at once.
+      config -- A config object that holds, per supported method, a reference to the method.
+    """
+
+    max_int64_modulus = 3037000499
+    """The largest modulus for which (modulus - 1) ** 2 fits in a 64 bit integer."""
+
+    # Class Methods
+    def __init__(
+        self,
+        length: int,
+        modulus: int,
+        recurrences: Dict[str, Dict[str, Any]],
+        block_size: int = 2 ** 22,
+    ) -> None:
+        """
+        Initialises the ModularBackend class.
+
+        Parameters:
+          length -- The amount of items to generate per trace.
+          modulus -- The (positive) modulus that all terms are reduced by.
+          recurrences -- Per linear recurrence, its entry of `SequenceGenerator.config`
+                         (with `parameters` and a `recurrence`).
+          block_size -- The maximum amount of array elements computed at once.
+        """
+        self.length = length
+        """The amount of items to generate per trace."""
+        self.modulus = modulus
+        """The modulus that all terms are reduced by."""
+        self.dtype = np.dtype(np.int64 if modulus <= self.max_int64_modulus else object)
+        """The integer type used in computations."""
+        self.block_size = block_size
+        """The maximum amount of array elements computed at once."""
+        self.config: Dict[str, Callable[[List[np.ndarray]], np.ndarray]] = {
+            "pascal": self.__pascal,
+            "recaman": self.__recaman,
+            "catalan": self.__catalan,
+            "range_up": self.__range_up,
+            "range_down": self.__range_down,
+        }
+        """A config object that holds, per supported method, a reference to the method.
+        Every method maps exact parameter columns (in `SequenceGenerator.config` order)
+        to a 2D array of reduced traces."""
+
+        # Linear recurrences share one method, bound to their config entry
+        for seq_name, entry in recurrences.items():
+            self.config[seq_name] = partial(
+                self.__recurrence, entry["parameters"], entry["recurrence"]
+            )
+
+    def __repr__(self) -> str:
+        return f"ModularBackend(length={self.length}, modulus={self.modulus})"
+
+    # Helper methods
+    def __reduce(self, column: np.ndarray) -> np.ndarray:
+        """
+        Reduces a column of exact (python) integers modulo `self.modulus`.
+
+        Parameters:
+          column -- An object array of python integers.
+
+        Returns an array of residues in [0, modulus), of type `self.dtype`.
+        """
+        return (column % self.modulus).astype(self.dtype)
+
+    def __empty(self, rows: int) -> np.ndarray:
+        """
+        Allocates the array for `rows` traces.
+
+        Parameters:
+          rows -- The amount of traces.
+
+        Returns an array of zeros of shape (rows, self.length).
+        """
+        return np.zeros((rows, self.length), dtype=self.dtype)
+
+    def __positions(self) -> np.ndarray:
+        """
+        Gets the positions 0 up to `self.length`, reduced modulo `self.modulus`, as a row.
+
+        Returns an array of residues.
+        """
+        return np.array(
+            [index % self.modulus for index in range(self.length)], dtype=self.dtype
+        )
+
+    def __linear_recurrence(
+        self, seeds: List[np.ndarray], lags: Dict[int, Union[int, np.ndarray]]
+    ) -> np.ndarray:
+        """
+        Evaluates a linear recurrence F(n) = sum_lag c_lag * F(n - lag), modulo `self.modulus`.
+
+        Parameters:
+          seeds -- The reduced first terms, one column per seed.
+          lags -- Per lag, the reduced coefficient, either an integer or a column (one coefficient per trace).
+
+        Returns an array of reduced traces.
+        """
+        traces = self.__empty(len(seeds[0]))
+        for index, seed in enumerate(seeds[: self.length]):
+            traces[:, index] = seed
+
+        for index in range(len(seeds), self.length):
+            current = np.zeros(len(traces), dtype=self.dtype)
+            for lag, coefficient in lags.items():
+                term = (coefficient * traces[:, index - lag]) % self.modulus
+                current = (current + term) % self.modulus
+            traces[:, index] = current
+
+        return traces
+
+    # Sequences, modulo self.modulus
+    def __recurrence(
+        self,
+        names: List[str],
+        recurrence: Dict[str, Any],
+        columns: List[np.ndarray],
+    ) -> np.ndarray:
+        """
+        F(n) = c_1 F(n - 1) + ... + c_k F(n - k), with the coefficients and seeds of a `recurrence` config entry.
+        Coefficients are integers or parameter names, and seeds are parameter names.
+        """
+        reduced = dict(zip(names, (self.__reduce(column) for column in columns)))
+        seeds = [reduced[seed] for seed in recurrence["seeds"]]
+        lags = {
+            lag: (
+                reduced[coefficient]
+                if isinstance(coefficient, str)
+                else coefficient % self.modulus
+            )
+            for lag, coefficient in enumerate(recurrence["coefficients"], start=1)
+            if coefficient != 0
+        }
+        return self.__linear_recurrence(seeds, lags)
+
+    def __range_up(self, columns: List[np.ndarray]) -> np.ndarray:
+        """
+        F(n) = first + n * step
+        """
+        first, step = [self.__reduce(column) for column in columns]
+        offsets = (step[:, None] * self.__positions()) % self.modulus
+        return (first[:, None] + offsets) % self.modulus
+
+    def __range_down(self, columns: List[np.ndarray]) -> np.ndarray:
+        """
+        F(n) = last + (length - n) * step - 1
+        """
+        last, step = columns
+        highest = self.__reduce(last + step * self.length - 1)
+        offsets = (self.__reduce(step)[:, None] * self.__positions()) % self.modulus
+        return (highest[:, None] - offsets) % self.modulus
+
+    def __pascal(self, columns: List[np.ndarray]) -> np.ndarray:
+        """
+        `first` times the triangle of pascal, where the triangle is built row by row modulo `self.modulus`.
+        """
+        template = np.zeros(self.length, dtype=self.dtype)
+        row = np.ones(1, dtype=self.dtype)
+        filled = 0
+        while filled < self.length:
+            size = min(len(row), self.length - filled)
+            template[filled : filled + size] = row[:size]
+            filled += size
+
+            # compute the next row
+            inner = (row[:-1] + row[1:]) % self.modulus
+            row = np.concatenate([row[:1], inner, row[:1]])
+
+        first = self.__reduce(columns[0])
+        return (first[:, None] * template) % self.modulus
+
+    def __catalan(self, columns: List[np.ndarray]) -> np.ndarray:
+        """
+        C(n) = sum_j C(j) * C(n - j - 1), with C(0) = C(1) = first.
+        The linear time recurrence of `SequenceGenerator` divides by n + 1, which is not possible modulo `self.modulus`,
+        so this evaluates the (quadratic) table, for all traces at once.
+        """
+        first = self.__reduce(columns[0])
+        traces = self.__empty(len(first))
+        traces[:, : min(2, self.length)] = first[:, None]
+
+        for index in range(2, self.length):
+            products = (traces[:, :index] * traces[:, index - 1 :: -1]) % self.modulus
+            if self.dtype == object:
+                traces[:, index] = products.sum(axis=1) % self.modulus
+            else:
+                # Sum in chunks such that the (partial) sums never overflow
+                chunk = max(1, (2 ** 63 - 1) // self.modulus)
+                total = np.zeros(len(first), dtype=self.dtype)
+                for start in range(0, index, chunk):
+                    partial = products[:, start : start + chunk].sum(axis=1)
+                    total = (total + partial % self.modulus) % self.modulus
+                traces[:, index] = total
+
+        return traces
+
+    def __recaman(self, columns: List[np.ndarray]) -> np.ndarray:
+        """
+        Recaman's sequence is defined by comparing exact terms, so it is computed exactly
+        (it grows roughly linearly) and then reduced.
+        """
+        traces = self.__empty(len(columns[0]))
+        for row, first in enumerate(columns[0].tolist()):
+            exact = np.array(
+                list(Recaman.cached(first).prefix(self.length)), dtype=object
+            )
+            traces[row] = self.__reduce(exact)
+
+        return traces
+
+    # Public methods
+    def generate_log(self, seq_name: str, grid: ParamGrid) -> List[Tuple[int, ...]]:
+        """
+        Generates the traces of a sequence generator for every row of `grid`, see `iter_log`.
+
+        Returns a log of traces as a list of tuples.
+        """
+        return list(self.iter_log(seq_name, grid))
+
+    def iter_log(
+        self,
+        seq_name: str,
+        grid: ParamGrid,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[Tuple[int, ...]]:
+        """
+        Generates the reduced traces of a sequence generator for the rows of `grid`.
+
+        Parameters:
+          seq_name -- The name of the sequence generation method.
+          grid -- The parameter combinations, in `SequenceGenerator.config` order.
+          start -- The first trace to generate.
+          stop -- The trace after the last trace to generate, all traces by default.
+
+        Returns an iterator of traces (tuples), in the same order as the rows of `grid`.
+        Traces are computed per block, such that at most one block is kept in memory.
+        """
+        method = self.config[seq_name]
+
+        last = len(grid) if stop is None else min(stop, len(grid))
+        rows_per_block = max(1, self.block_size // self.length)
+
+        for begin in range(start, last, rows_per_block):
+            end = min(begin + rows_per_block, last)
+            block = method(grid.columns(begin, end))
+            yield from map(tuple, block.tolist())
@@ -0,0 +1,196 @@
+# Typing
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Packages
+import numpy as np
+
+# Own
+from generator.DtypePlanner import DtypePlanner
+from generator.ParamGrid import ParamGrid
+
+
+class NumpyBackend:
+    """
+    Generates entire logs at once as `(n_traces, length)` integer arrays,
+    for sequence generators that have a closed form.
+
+    Every block of rows is computed with the narrowest integer type chosen by a `generator.DtypePlanner.DtypePlanner`,
+    and rows whose largest term does not (provably) fit in 64 bits are computed with exact python integers.
+    Blocks keep that type when they are stored in a `generator.Log.Log` (see `NumpyBackend.iter_blocks`).
+    The result is identical to the one of `SequenceGenerator.generate_log`.
+
+    Attributes:
+      length -- The amount of items to generate per trace.
+      planner -- The planner that chooses integer types.
+      block_size -- The maximum amount of array elements computed at once.
+      config -- A config object that holds, per supported method, a reference to the method.
+    """
+
+    # Class Methods
+    def __init__(
+        self, length: int, planner: DtypePlanner, block_size: int = 2 ** 22
+    ) -> None:
+        """
+        Initialises the NumpyBackend class.
+
+        Parameters:
+          length -- The amount of items to generate per trace.
+          planner -- The planner that chooses integer types, for the same length.
+          block_size -- The maximum amount of array elements computed at once.
+        """
+        self.length = length
+        """The amount of items to generate per trace."""
+        self.planner = planner
+        """The planner that chooses integer types."""
+        self.block_size = block_size
+        """The maximum amount of array elements computed at once."""
+        self.config: Dict[str, Callable[[List[np.ndarray]], np.ndarray]] = {
+            "range_up": self.__range_up,
+            "range_down": self.__range_down,
+            "short_term_single_dependency": self.__short_term_single_dependency,
+            "long_term_single_dependency": self.__long_term_single_dependency,
+        }
+        """A config object that holds, per supported method, a reference to the method.
+        Every method maps parameter columns (in `SequenceGenerator.config` order) to a 2D array of traces."""
+
+    def __repr__(self) -> str:
+        return (
+            f"NumpyBackend(length={self.length}, supported={list(self.config.keys())})"
+        )
+
+    # Helper methods
+    def __positions(self, column: np.ndarray) -> np.ndarray:
+        """
+        Gets the positions 0 up to `self.length` as a row, with the same type of integers as `column`.
+
+        Parameters:
+          column -- A parameter column, either of some numpy integer type or of python integers.
+
+        Returns an array of positions.
+        """
+        if column.dtype == object:
+            return np.array(range(self.length), dtype=object)
+        return np.arange(self.length, dtype=column.dtype)
+
+    # Closed forms, computed on 2D arrays of 64 bit (or python) integers
+    def __range_up(self, columns: List[np.ndarray]) -> np.ndarray:
+        """
+        F(n) = first + n * step
+        """
+        first, step = columns
+        return first[:, None] + step[:, None] * self.__positions(step)
+
+    def __range_down(self, columns: List[np.ndarray]) -> np.ndarray:
+        """
+        F(n) = last + (length - n) * step - 1
+        """
+        last, step = columns
+        highest = last + step * self.__positions(step)[-1] + step - 1
+        return highest[:, None] - step[:, None] * self.__positions(step)
+
+    def __short_term_single_dependency(self, columns: List[np.ndarray]) -> np.ndarray:
+        """
+        F(n) = first * c^n, as a cumulative product of [first, c, c, ...].
+        Every intermediate product is a term, so nothing overflows if the terms do not.
+        """
+        first, constant = columns
+        factors = np.repeat(constant[:, None], self.length, axis=1)
+        factors[:, 0] = first
+        return np.cumprod(factors, axis=1, dtype=factors.dtype)
+
+    def __long_term_single_dependency(self, columns: List[np.ndarray]) -> np.ndarray:
+        """
+        F(n) = F(n - 5) * c = seed[n % 5] * c^(n // 5), as a cumulative product over blocks of 5.
+        """
+        *seeds, constant = columns
+        blocks = -(-self.length // 5)
+        factors = np.repeat(constant[:, None, None], blocks, axis=1)
+        factors = np.repeat(factors, 5, axis=2)
+        factors[:, 0, :] = np.stack(seeds, axis=1)
+        traces = np.cumprod(factors, axis=1, dtype=factors.dtype)
+        return traces.reshape(len(constant), blocks * 5)[:, : self.length]
+
+    # Public methods
+    def supports(self, seq_name: str) -> bool:
+        """
+        Checks whether this backend can generate logs for a particular sequence generator.
+
+        Parameters:
+          seq_name -- The name of the sequence generation method.
+
+        Returns true if the method is supported.
+        """
+        return seq_name in self.config
+
+    def generate_log(self, seq_name: str, grid: ParamGrid) -> List[Tuple[int, ...]]:
+        """
+        Generates the traces of a sequence generator for every row of `grid`, see `iter_log`.
+
+        Returns a log of traces as a list of tuples.
+        """
+        return list(self.iter_log(seq_name, grid))
+
+    def iter_blocks(
+        self,
+        seq_name: str,
+        grid: ParamGrid,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Generates the traces of a sequence generator for the rows of `grid`, as 2D arrays of consecutive traces.
+        **Unsafe** for sequence generators that are not supported, see `NumpyBackend.supports`.
+
+        Parameters:
+          seq_name -- The name of the sequence generation method.
+          grid -- The parameter combinations, in `SequenceGenerator.config` order.
+          start -- The first trace to generate.
+          stop -- The trace after the last trace to generate, all traces by default.
+
+        Returns an iterator of `(n_traces, length)` arrays, in the same order as the rows of `grid`.
+        Every array keeps the narrowest type chosen by the planner,
+        or is an object array of python integers for traces that may not fit in 64 bits.
+        """
+        method = self.config[seq_name]
+
+        last = len(grid) if stop is None else min(stop, len(grid))
+        rows_per_block = max(1, self.block_size // self.length)
+
+        for begin in range(start, last, rows_per_block):
+            end = min(begin + rows_per_block, last)
+            exact = grid.columns(begin, end)
+            magnitudes = self.planner.magnitudes(seq_name, grid, begin, end)
+
+            # Rows that fit in 64 bits, and the narrowest type that holds all of them
+            safe = self.planner.fits(magnitudes)
+            dtype = self.planner.dtype(magnitudes[safe].max()) if safe.any() else None
+
+            # Common case: the entire block fits
+            if safe.all():
+                yield method([column.astype(dtype) for column in exact])
+                continue
+
+            # Runs of consecutive rows that either fit (numpy integers) or may overflow (python integers)
+            bounds = [0, *(np.flatnonzero(np.diff(safe)) + 1).tolist(), len(safe)]
+            for low, high in zip(bounds, bounds[1:]):
+                columns = [column[low:high] for column in exact]
+                if safe[low]:
+                    columns = [column.astype(dtype) for column in columns]
+                yield method(columns)
+
+    def iter_log(
+        self,
+        seq_name: str,
+        grid: ParamGrid,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[Tuple[int, ...]]:
+        """
+        Generates the traces of a sequence generator for the rows of `grid`, see `NumpyBackend.iter_blocks`.
+        **Unsafe** for sequence generators that are not supported, see `NumpyBackend.supports`.
+
+        Returns an iterator of traces (tuples), in the same order as the rows of `grid`.
+        Traces are computed per block, such that at most one block is kept in memory.
+        """
+        for block in self.iter_blocks(seq_name, grid, start, stop):
+            yield from map(tuple, block.tolist())
@@ -0,0 +1,211 @@
+# Typing
+from typing import Iterable, Iterator, List, Optional, Union, overload
+
+# Packages
+from array import array
+import numpy as np
+
+
+class PackedInts:
+    """
+    Integers of any size, packed into one contiguous buffer of 64 bit limbs, without a python integer per value.
+
+    Every integer takes as many little-endian limbs (in two's complement) as it needs,
+    and the amount of limbs per integer is kept in a second buffer,
+    such that integer `i` is made up of the limbs `starts[i]` up to `starts[i] + widths[i]`,
+    where `starts` is the cumulative sum of `widths`.
+
+    Conversion is done for many integers at once: integers of one limb are converted by numpy,
+    and the limbs of all integers of some other width are gathered, and converted from bytes per integer.
+
+    Both buffers are plain numpy arrays (see `PackedInts.limbs` and `PackedInts.widths`),
+    which can be saved and memory mapped with `numpy.save` and `numpy.load`.
+    """
+
+    limb_bytes = 8
+    """The amount of bytes per limb."""
+
+    # Class Methods
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        """
+        Initialises the PackedInts class.
+
+        Parameters:
+          values -- The integers to pack, in order.
+        """
+        # Growing buffers, or (read-only, possibly memory mapped) arrays of `PackedInts.from_limbs`
+        self.__limbs: Union[bytearray, np.ndarray] = bytearray()
+        self.__widths: Union[array, np.ndarray] = array("I")
+
+        # The first limb of every integer, computed when integers are converted
+        self.__starts: Optional[np.ndarray] = None
+        self.extend(values)
+
+    @classmethod
+    def from_limbs(cls, limbs: np.ndarray, widths: np.ndarray) -> "PackedInts":
+        """
+        Wraps the buffers of packed integers, as returned by `PackedInts.limbs` and `PackedInts.widths`,
+        without copying them.
+        Memory mapped arrays (see `numpy.load`) stay on disk until integers are added.
+
+        Parameters:
+          limbs -- An unsigned 64 bit array with the limbs of all integers.
+          widths -- An unsigned 32 bit array with the amount of limbs per integer.
+
+        Returns a `PackedInts` instance.
+        """
+        packed = cls()
+        packed.__limbs = limbs
+        packed.__widths = widths
+        return packed
+
+    def __repr__(self) -> str:
+        return f"PackedInts(values={len(self)}, limbs={len(self.__view())})"
+
+    def __len__(self) -> int:
+        return len(self.__widths)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.unpack())
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[int]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, List[int]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.unpack(start, max(start, stop))
+            return [self[position] for position in range(start, stop, step)]
+
+        # Resolves negative indices, and raises an IndexError when out of range
+        position = range(len(self))[index]
+        return self.unpack(position, position + 1)[0]
+
+    # Helper methods
+    def __view(self) -> np.ndarray:
+        """
+        Views the limbs as an array.
+        The view of a growing buffer locks its size, so it should not outlive a call.
+
+        Returns an unsigned 64 bit array.
+        """
+        if isinstance(self.__limbs, np.ndarray):
+            return self.__limbs
+        return np.frombuffer(self.__limbs, dtype="<u8")
+
+    def __starts_of(self, start: int, stop: int) -> np.ndarray:
+        """
+        Finds the first limb of the integers `start` up to `stop`.
+
+        Parameters:
+          start -- The first integer.
+          stop -- The integer after the last integer.
+
+        Returns an integer array.
+        """
+        if self.__starts is None:
+            self.__starts = np.zeros(len(self) + 1, dtype=np.int64)
+            np.cumsum(self.widths, out=self.__starts[1:])
+        return self.__starts[start:stop]
+
+    # Public methods
+    @property
+    def limbs(self) -> np.ndarray:
+        """
+        The limbs of all integers, as an unsigned 64 bit array.
+        A copy of the buffer, or the array itself for `PackedInts.from_limbs`.
+        """
+        if isinstance(self.__limbs, np.ndarray):
+            return self.__limbs
+        return self.__view().copy()
+
+    @property
+    def widths(self) -> np.ndarray:
+        """
+        The amount of limbs per integer, as an unsigned 32 bit array.
+        """
+        return np.asarray(self.__widths, dtype=np.uint32).copy()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of both buffers in bytes.
+        """
+        return self.__view().nbytes + self.widths.nbytes
+
+    def unpack(self, start: int = 0, stop: Optional[int] = None) -> List[int]:
+        """
+        Converts the integers `start` up to `stop` back into python integers.
+
+        Parameters:
+          start -- The first integer.
+          stop -- The integer after the last integer, all integers by default.
+
+        Returns a list of python integers.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        widths = np.asarray(self.__widths[start:stop], dtype=np.int64)
+        starts = self.__starts_of(start, stop)
+        limbs = np.asarray(self.__view())
+
+        values = np.empty(len(widths), dtype=object)
+        for width in np.flatnonzero(np.bincount(widths)).tolist():
+            positions = np.flatnonzero(widths == width)
+            if width == 1:
+                values[positions] = limbs[starts[positions]].view("<i8").tolist()
+                continue
+
+            # Gather the limbs of all integers of this width, and convert the bytes of every integer (unsigned)
+            rows = limbs[starts[positions, None] + np.arange(width)]
+            chunks = rows.view(np.dtype((np.void, width * PackedInts.limb_bytes)))
+            converted = np.empty(len(positions), dtype=object)
+            converted[:] = [
+                int.from_bytes(chunk, "little") for chunk in chunks.ravel().tolist()
+            ]
+
+            # Negative integers (highest bit set) are their two's complement
+            negative = np.flatnonzero(rows[:, -1] >> np.uint64(63))
+            converted[negative] -= 1 << (64 * width)
+            values[positions] = converted
+
+        return values.tolist()
+
+    def extend(self, values: Iterable[int]) -> None:
+        """
+        Adds (python) integers to the end.
+
+        Parameters:
+          values -- The integers to add, in order.
+        """
+        values = list(values)
+        if not values:
+            return
+
+        # A signed integer of b bits (without sign) takes b + 1 bits
+        bits = np.fromiter(
+            map(int.bit_length, values), dtype=np.int64, count=len(values)
+        )
+        widths = bits // (8 * PackedInts.limb_bytes) + 1
+
+        # Loaded buffers are copied into growing ones
+        limbs = self.__limbs
+        if isinstance(limbs, np.ndarray):
+            limbs = bytearray(limbs.tobytes())
+        counts = self.__widths
+        if isinstance(counts, np.ndarray):
+            counts = array("I", counts.tolist())
+
+        sizes = (widths * PackedInts.limb_bytes).tolist()
+        limbs += b"".join(
+            [
+                value.to_bytes(size, "little", signed=True)
+                for value, size in zip(values, sizes)
+            ]
+        )
+        counts.extend(widths.tolist())
+        self.__limbs, self.__widths = limbs, counts
+        self.__starts = None
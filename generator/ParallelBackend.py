@@ -0,0 +1,142 @@
+# Typing
+from typing import Any, Dict, List, Optional, Tuple
+
+# Packages
+from concurrent.futures import ProcessPoolExecutor
+
+# Own
+from exception import WorkerNotInitialised
+from generator.ParamGrid import ParamGrid
+from generator.VirtualLog import VirtualLog
+
+
+class ParallelBackend:
+    """
+    Generates a log in worker processes, where every worker generates contiguous shards of the cartesian product.
+
+    Every worker builds its own (lazy) log once, from the arguments of `SequenceGenerator.generate_log`,
+    after which a shard is described by its first and last index only.
+    Shards are collected in order, such that the result is identical to the serial log.
+
+    Workers build generators with the default config of the generator class,
+    and register the config entry of the sequence as exported by the generator (see `SequenceGenerator.export_entry`),
+    such that sequences that were added to or changed in the config of one instance are generated the same.
+
+    Attributes:
+      length -- The amount of items to generate per trace.
+      workers -- The amount of worker processes.
+    """
+
+    shards_per_worker = 4
+    """The amount of shards per worker, more shards balance uneven shards better."""
+
+    __log: Optional[VirtualLog] = None
+    """The log of the current worker process, see `ParallelBackend.initialise_worker`."""
+
+    # Class Methods
+    def __init__(self, length: int, workers: int) -> None:
+        """
+        Initialises the ParallelBackend class.
+
+        Parameters:
+          length -- The amount of items to generate per trace.
+          workers -- The amount of worker processes.
+        """
+        self.length = length
+        """The amount of items to generate per trace."""
+        self.workers = workers
+        """The amount of worker processes."""
+
+    def __repr__(self) -> str:
+        return f"ParallelBackend(length={self.length}, workers={self.workers})"
+
+    # Worker methods, called in worker processes
+    @staticmethod
+    def initialise_worker(
+        generator_class: type,
+        length: int,
+        seq_name: str,
+        kwargs: Dict[str, Any],
+        entry: Tuple[Dict[str, Any], Dict[str, str]],
+    ) -> None:
+        """
+        Builds the (lazy) log of the current worker process.
+        **Unsafe** when used in any other place than a worker process of `ParallelBackend.generate_log`.
+
+        Parameters:
+          generator_class -- The class of the generator, usually `SequenceGenerator`.
+          length -- The amount of items to generate per trace.
+          seq_name -- The name of the sequence generation method.
+          kwargs -- The keyword arguments of `SequenceGenerator.generate_log`.
+          entry -- The exported config entry of the sequence generation method, see `SequenceGenerator.export_entry`.
+        """
+        generator = generator_class(length)
+        generator.import_entry(seq_name, *entry)
+        ParallelBackend.__log = generator.generate_log(seq_name, lazy=True, **kwargs)
+
+    @staticmethod
+    def generate_shard(shard: Tuple[int, int]) -> List[Tuple[int, ...]]:
+        """
+        Generates a shard of the log of the current worker process.
+        **Unsafe** when used in any other place than a worker process of `ParallelBackend.generate_log`.
+
+        Parameters:
+          shard -- The first trace and the trace after the last trace of the shard.
+
+        Raises a `WorkerNotInitialised` when the log of the current process was not built.
+
+        Returns the traces of the shard.
+        """
+        start, stop = shard
+        if ParallelBackend.__log is None:
+            raise WorkerNotInitialised(shard)
+        return ParallelBackend.__log[start:stop]
+
+    # Public methods
+    def shards(self, total: int) -> List[Tuple[int, int]]:
+        """
+        Splits a log into contiguous shards of (almost) equal size.
+
+        Parameters:
+          total -- The amount of traces in the log.
+
+        Returns a list of (start, stop) tuples, in order.
+        """
+        count = max(1, min(total, self.workers * self.shards_per_worker))
+        bounds = [total * index // count for index in range(count + 1)]
+        return list(zip(bounds, bounds[1:]))
+
+    def generate_log(
+        self,
+        generator_class: type,
+        seq_name: str,
+        grid: ParamGrid,
+        kwargs: Dict[str, Any],
+        entry: Tuple[Dict[str, Any], Dict[str, str]],
+    ) -> List[Tuple[int, ...]]:
+        """
+        Generates a log in worker processes.
+
+        Parameters:
+          generator_class -- The class of the generator, usually `SequenceGenerator`.
+          seq_name -- The name of the sequence generation method.
+          grid -- The parameter combinations, in `SequenceGenerator.config` order.
+          kwargs -- The (checked) keyword arguments of `SequenceGenerator.generate_log`.
+          entry -- The exported config entry of the sequence generation method, see `SequenceGenerator.export_entry`.
+                   It is sent to the workers, so it should be picklable
+                   (methods of the generator itself and recurrences that only have a config entry are).
+
+        Returns a log of traces as a list of tuples, in the same order as the rows of `grid`.
+        """
+        shards = self.shards(len(grid))
+
+        log: List[Tuple[int, ...]] = []
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(shards)),
+            initializer=ParallelBackend.initialise_worker,
+            initargs=(generator_class, self.length, seq_name, kwargs, entry),
+        ) as executor:
+            for traces in executor.map(ParallelBackend.generate_shard, shards):
+                log.extend(traces)
+
+        return log
@@ -0,0 +1,309 @@
+# Typing
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+# Packages
+from itertools import islice, product
+from math import prod
+from random import Random
+import sys
+import numpy as np
+
+# Own
+from exception import InvalidLengthException
+
+
+class ParamGrid:
+    """
+    The cartesian product of parameter lists, stored as columns: one array per parameter.
+
+    Row `i` is the `i`-th parameter combination of `itertools.product(*value_lists)`.
+    No row is stored: the columns of a range of rows are decoded from their indices as mixed-radix numbers,
+    where the last parameter changes fastest, and gathered from one array of values per parameter.
+
+    A grid can be restricted to a selection of rows (see `ParamGrid.sample`),
+    in which case row `i` is the `i`-th selected row, and only selected rows are decoded.
+
+    Attributes:
+      names -- The names of the parameters, in config order.
+      value_lists -- Per parameter, the list of values to use.
+      shape -- Per parameter, the amount of values.
+      selection -- The (increasing) indices of the selected rows of the cartesian product, or None for all rows.
+    """
+
+    # Class Methods
+    def __init__(
+        self,
+        names: List[str],
+        value_lists: List[List[int]],
+        selection: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Initialises the ParamGrid class.
+
+        Parameters:
+          names -- The names of the parameters, in config order.
+          value_lists -- Per parameter, the list of values to use.
+          selection -- The (increasing) indices of the selected rows of the cartesian product, all rows by default.
+        """
+        self.names = names
+        """The names of the parameters, in config order."""
+        self.value_lists = value_lists
+        """Per parameter, the list of values to use."""
+        self.shape: Tuple[int, ...] = tuple(len(values) for values in value_lists)
+        """Per parameter, the amount of values."""
+        self.selection = selection
+        """The (increasing) indices of the selected rows of the cartesian product, or None for all rows."""
+
+        # Per parameter, the values as python integers (object array), built once
+        self.__values = [np.array(values, dtype=object) for values in value_lists]
+        self.__total = prod(self.shape)
+        self.__length = self.__total if selection is None else len(selection)
+
+    def __repr__(self) -> str:
+        return f"ParamGrid(names={self.names}, shape={self.shape}, rows={len(self)})"
+
+    def __len__(self) -> int:
+        return self.__length
+
+    # Helper methods
+    def __stop(self, stop: Optional[int]) -> int:
+        """
+        Resolves the end of a range of rows.
+
+        Parameters:
+          stop -- The row after the last row, or None for all rows.
+
+        Returns the row after the last row, at most `len(self)`.
+        """
+        return len(self) if stop is None else min(stop, len(self))
+
+    def __digits(self, index: int) -> List[int]:
+        """
+        Decodes a single index of the cartesian product into an index per parameter, with python integers.
+
+        Parameters:
+          index -- The (nonnegative) index into the cartesian product.
+
+        Returns per parameter, the index into its list of values.
+        """
+        digits = []
+        for size in reversed(self.shape):
+            index, digit = divmod(index, size)
+            digits.append(digit)
+        return digits[::-1]
+
+    def __encode(self, digits: List[int]) -> int:
+        """
+        Encodes an index per parameter into an index of the cartesian product, the inverse of `self.__digits`.
+
+        Parameters:
+          digits -- Per parameter, the index into its list of values.
+
+        Returns the index into the cartesian product.
+        """
+        index = 0
+        for digit, radix in zip(digits, self.shape):
+            index = index * radix + digit
+        return index
+
+    def __stratified(self, size: int, random: Random, attempts: int = 64) -> Set[int]:
+        """
+        Draws (at most) `size` distinct rows, where every value of every parameter occurs (about) equally often.
+
+        Parameters:
+          size -- The amount of rows to draw.
+          random -- The random generator.
+          attempts -- The amount of swaps tried per row that was drawn twice.
+
+        Returns a set of indices into the cartesian product.
+        """
+        strata = []
+        for values in self.value_lists:
+            offset = random.randrange(len(values))
+            stratum = [(offset + i) % len(values) for i in range(size)]
+            random.shuffle(stratum)
+            strata.append(stratum)
+        rows = [list(digits) for digits in zip(*strata)]
+
+        # Rows drawn twice, and the index of every other row
+        keys: List[Optional[int]] = []
+        drawn: Set[int] = set()
+        for digits in rows:
+            key = self.__encode(digits)
+            keys.append(None if key in drawn else key)
+            drawn.add(key)
+
+        # Swap the value of a parameter between a row drawn twice and some other row, if both become new
+        for row, kept in enumerate(keys):
+            if kept is not None:
+                continue
+            for _ in range(attempts):
+                other = random.randrange(size)
+                position = random.randrange(len(self.shape))
+                other_key = keys[other]
+                if other_key is None:
+                    continue
+
+                left, right = rows[row][:], rows[other][:]
+                left[position], right[position] = right[position], left[position]
+                left_key, right_key = self.__encode(left), self.__encode(right)
+                if left_key == right_key or {left_key, right_key} & drawn:
+                    continue
+
+                drawn.discard(other_key)
+                drawn.update([left_key, right_key])
+                rows[row], rows[other] = left, right
+                keys[row], keys[other] = left_key, right_key
+                break
+
+        return {key for key in keys if key is not None}
+
+    # Public methods
+    def indices(self, start: int = 0, stop: Optional[int] = None) -> List[np.ndarray]:
+        """
+        Decodes the rows `start` up to `stop` into an index per parameter.
+
+        Parameters:
+          start -- The first row.
+          stop -- The row after the last row, all rows by default.
+
+        Returns per parameter, an integer array with the index into its list of values, per row.
+        """
+        last = max(start, self.__stop(stop))
+        if not self.shape:
+            return []
+
+        rows = (
+            range(start, last) if self.selection is None else self.selection[start:last]
+        )
+        if self.__total <= np.iinfo(np.intp).max:
+            if self.selection is None:
+                positions = np.arange(start, last)
+            else:
+                positions = np.array(rows, dtype=np.intp)
+            return list(np.unravel_index(positions, self.shape))
+
+        # Too many combinations for numpy integers: decode with python integers
+        digits = [self.__digits(row) for row in rows]
+        if not digits:
+            return [np.zeros(0, dtype=np.intp) for _ in self.shape]
+        return [np.array(column, dtype=np.intp) for column in zip(*digits)]
+
+    def take(
+        self, tables: List[np.ndarray], start: int = 0, stop: Optional[int] = None
+    ) -> List[np.ndarray]:
+        """
+        Gathers per-value tables into columns, for the rows `start` up to `stop`.
+
+        Parameters:
+          tables -- Per parameter, an array with one entry per value (for example some function of the values).
+          start -- The first row.
+          stop -- The row after the last row, all rows by default.
+
+        Returns per parameter, an array with the entry of every row.
+        """
+        return [table[index] for table, index in zip(tables, self.indices(start, stop))]
+
+    def columns(self, start: int = 0, stop: Optional[int] = None) -> List[np.ndarray]:
+        """
+        Builds the parameter columns for the rows `start` up to `stop`.
+        The columns of all rows are the (flattened) meshgrid of the value lists.
+
+        Parameters:
+          start -- The first row.
+          stop -- The row after the last row, all rows by default.
+
+        Returns the columns as python integers (object arrays).
+        """
+        return self.take(self.__values, start, stop)
+
+    def row(self, index: int) -> Tuple[int, ...]:
+        """
+        Finds the parameter values of a single (nonnegative) row.
+
+        Parameters:
+          index -- The index of the row.
+
+        Returns the values of the row, in config order.
+        """
+        if self.selection is not None:
+            index = self.selection[index]
+
+        digits = self.__digits(index)
+        return tuple(values[digit] for values, digit in zip(self.value_lists, digits))
+
+    def rows(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[Tuple[int, ...]]:
+        """
+        Generates the parameter values of the rows `start` up to `stop`, one row at a time.
+        Rows from the start are taken from `itertools.product`, other rows are decoded per block.
+
+        Parameters:
+          start -- The first row.
+          stop -- The row after the last row, all rows by default.
+
+        Returns an iterator of tuples, in config order.
+        """
+        last = self.__stop(stop)
+        if start == 0 and self.selection is None:
+            yield from islice(product(*self.value_lists), last)
+            return
+
+        rows_per_block = 4096
+        for begin in range(start, last, rows_per_block):
+            end = min(begin + rows_per_block, last)
+            yield from zip(*[column.tolist() for column in self.columns(begin, end)])
+
+    def params(self, index: int) -> Dict[str, int]:
+        """
+        Gets the parameters of a single (nonnegative) row, as accepted by `SequenceGenerator.generate_trace`.
+
+        Parameters:
+          index -- The index of the row.
+
+        Returns a dictionary with a value per parameter.
+        """
+        return dict(zip(self.names, self.row(index)))
+
+    def sample(
+        self, size: int, seed: Optional[int] = None, stratified: bool = False
+    ) -> "ParamGrid":
+        """
+        Draws distinct rows of the cartesian product at random, without enumerating it.
+
+        Uniform samples give every set of `size` rows the same probability.
+        Stratified samples draw every parameter from a shuffled, balanced list of its values,
+        such that every value of every parameter occurs (about) equally often.
+        Rows that are drawn twice swap the value of a parameter with another row, which keeps the balance,
+        and are only replaced by uniformly drawn rows when no such swap is found.
+
+        Parameters:
+          size -- The amount of rows to draw.
+          seed -- The seed of the random generator, the same seed gives the same sample.
+          stratified -- Whether to stratify the sample per parameter.
+
+        Raises an `InvalidLengthException` when `size` is negative or exceeds the amount of combinations.
+
+        Returns a `ParamGrid` of the drawn rows, in the order of the cartesian product.
+        """
+        total = self.__total
+        if not 0 <= size <= total:
+            raise InvalidLengthException(
+                length=size,
+                message=f"Cannot sample %s distinct traces from a log of {total} traces",
+            )
+
+        random = Random(seed)
+        if stratified:
+            drawn = self.__stratified(size, random)
+        elif total <= sys.maxsize:
+            drawn = set(random.sample(range(total), size))
+        else:
+            drawn = set()
+
+        # Fill up with uniform rows, until `size` rows are distinct
+        while len(drawn) < size:
+            drawn.add(random.randrange(total))
+
+        return ParamGrid(self.names, self.value_lists, sorted(drawn))
@@ -0,0 +1,79 @@
+# Typing
+from typing import Any, Iterator, List, Sequence, Tuple, Union
+
+# Own
+from generator.InternedLog import InternedLog
+
+
+class PrefixLog:
+    """
+    A log of shorter traces that views a log of longer traces, without copying it.
+    Trace `i` is the first `length` terms of trace `i` of the longer log,
+    or the last `length` terms for sequences that are anchored at their end (`range_down` counts down to `last`).
+
+    Any log can be viewed: a list, a `generator.VirtualLog.VirtualLog`, a `generator.InternedLog.InternedLog`
+    or a `generator.Log.Log`.
+    The log compares equal to the list of tuples that `SequenceGenerator.generate_log` returns for `length`.
+
+    Attributes:
+      log -- The log of longer traces.
+      length -- The amount of terms per trace.
+      reverse -- Whether the traces are viewed by their last terms.
+    """
+
+    # Class Methods
+    def __init__(
+        self, log: Sequence[Tuple[int, ...]], length: int, reverse: bool = False
+    ) -> None:
+        """
+        Initialises the PrefixLog class.
+
+        Parameters:
+          log -- The log of longer traces, with at least `length` terms per trace.
+          length -- The (positive) amount of terms per trace.
+          reverse -- Whether to view the traces by their last terms, see above.
+        """
+        self.log = log
+        """The log of longer traces."""
+        self.length = length
+        """The amount of terms per trace."""
+        self.reverse = reverse
+        """Whether the traces are viewed by their last terms."""
+
+    def __repr__(self) -> str:
+        return f"PrefixLog(traces={len(self)}, length={self.length}, reverse={self.reverse})"
+
+    def __len__(self) -> int:
+        return len(self.log)
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        return (self.__view(trace) for trace in self.log)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[int, ...], List[Tuple[int, ...]]]:
+        if isinstance(index, slice):
+            return [self.__view(trace) for trace in self.log[index]]
+        return self.__view(self.log[index])
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (PrefixLog, InternedLog, list)):
+            return len(self) == len(other) and all(
+                left == right for left, right in zip(self, other)
+            )
+        return NotImplemented
+
+    # Helper methods
+    def __view(self, trace: Tuple[int, ...]) -> Tuple[int, ...]:
+        """
+        Shortens a trace of the longer log.
+        A trace that already has `self.length` terms is returned as is.
+
+        Parameters:
+          trace -- The longer trace.
+
+        Returns the first (or last) `self.length` terms.
+        """
+        if self.reverse:
+            return trace[len(trace) - self.length :]
+        return trace[: self.length]
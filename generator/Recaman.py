@@ -0,0 +1,205 @@
+# Typing
+from typing import Generator, MutableSequence, Set, Union
+
+# Packages
+from array import array
+from collections import OrderedDict
+
+
+class Recaman:
+    """
+    Incrementally computes Recaman's sequence for a particular first element,
+    such that asking for a longer prefix extends the one that was computed before.
+
+    In stead of a set of all seen terms, membership is tracked in a `bytearray` with one byte per value.
+    The sequence grows roughly linearly (the first 10^6 terms stay below 6 * 10^6),
+    so the visited structure is sized from that growth rate, and doubled whenever a term does not fit.
+    When the values are much larger than the amount of terms (e.g. for a large first element),
+    the visited values are kept in a set in stead, such that memory stays proportional to the amount of terms.
+    Terms are stored in a compact `array` of 64 bit integers, unless they do not fit.
+
+    Attributes:
+      first -- The first element of the sequence.
+      terms -- The terms computed so far.
+    """
+
+    cache_size = 8
+    """The maximum amount of sequences (one per first element) kept by `Recaman.cached`."""
+
+    __cache: "OrderedDict[int, Recaman]" = OrderedDict()
+    """The most recently used sequences, by first element."""
+
+    growth = 8
+    """The expected maximum ratio between a term and its index, used to size the visited structure."""
+
+    window_size = 2 ** 16
+    """The amount of values the `bytearray` may always cover, on top of `2 * growth` per term."""
+
+    # Class Methods
+    def __init__(self, first: int = 0) -> None:
+        """
+        Initialises the Recaman class.
+
+        Parameters:
+          first -- The first element of the sequence.
+                   The original sequence defines this as 0.
+        """
+        self.first = first
+        """The first element of the sequence."""
+        self.terms: MutableSequence[int] = array("q")
+        """The terms computed so far."""
+
+        # Current value of the sequence
+        self.__current = first
+
+        # Visited values, one byte per value, or a set when the values are too large.
+        # Only nonnegative values are ever looked up.
+        self.__visited: Union[bytearray, Set[int]] = bytearray(1)
+
+    def __repr__(self) -> str:
+        return f"Recaman(first={self.first}, computed={len(self.terms)})"
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    @classmethod
+    def cached(cls, first: int = 0) -> "Recaman":
+        """
+        Gets the (shared) sequence for a particular first element,
+        evicting the least recently used one when there are more than `Recaman.cache_size`.
+
+        Parameters:
+          first -- The first element of the sequence.
+
+        Returns a `Recaman` instance, possibly with terms computed by earlier calls.
+        """
+        if first in cls.__cache:
+            cls.__cache.move_to_end(first)
+        else:
+            cls.__cache[first] = cls(first)
+            while len(cls.__cache) > cls.cache_size:
+                cls.__cache.popitem(last=False)
+
+        return cls.__cache[first]
+
+    # Helper methods
+    def __reserve(self, visited: bytearray, size: int, length: int) -> bool:
+        """
+        Grows the visited structure such that it fits the values below `size`,
+        or replaces it by a set when it would be much larger than the amount of terms.
+
+        Parameters:
+          visited -- The visited structure, one byte per value.
+          size -- The amount of values that should fit.
+          length -- The amount of terms that will be computed.
+
+        Returns whether the `bytearray` is kept.
+        """
+        limit = 2 * self.growth * length + self.window_size
+        if size > limit:
+            self.__visited = {value for value, seen in enumerate(visited) if seen}
+            return False
+
+        if len(visited) < size:
+            visited.extend(bytes(size - len(visited)))
+        return True
+
+    def __extend_bytes(self, visited: bytearray, length: int) -> None:
+        """
+        Computes terms until the first `length` terms are known,
+        or until a term does not fit and the visited values were moved to a set.
+
+        Parameters:
+          visited -- The visited structure, one byte per value.
+          length -- The amount of terms that should be known.
+        """
+        # Local references, this loop is hot
+        capacity = len(visited)
+        terms = self.terms
+        current = self.__current
+
+        for index in range(len(terms), length):
+            # Compute a(n) = a(n-1) - n
+            # if nonnegative and not in sequence, take it
+            new = current - index
+            if new < 0 or visited[new]:
+                # Negative or already seen: add index in stead
+                new = current + index
+
+            # Negative values are never looked up, so they do not need to be saved
+            if new >= 0:
+                if new >= capacity:
+                    if not self.__reserve(visited, capacity + new + 1, length):
+                        break
+                    capacity = len(visited)
+                visited[new] = 1
+
+            current = new
+            try:
+                terms.append(current)
+            except OverflowError:
+                # Does not fit in 64 bits: fall back to python integers
+                terms = self.terms = list(terms)
+                terms.append(current)
+
+        self.__current = current
+
+    def __extend_set(self, visited: Set[int], length: int) -> None:
+        """
+        Computes terms until the first `length` terms are known.
+
+        Parameters:
+          visited -- The visited values.
+          length -- The amount of terms that should be known.
+        """
+        # Local references, this loop is hot
+        terms = self.terms
+        current = self.__current
+
+        for index in range(len(terms), length):
+            new = current - index
+            if new < 0 or new in visited:
+                new = current + index
+            if new >= 0:
+                visited.add(new)
+
+            current = new
+            try:
+                terms.append(current)
+            except OverflowError:
+                terms = self.terms = list(terms)
+                terms.append(current)
+
+        self.__current = current
+
+    # Public methods
+    def extend_to(self, length: int) -> None:
+        """
+        Computes terms until (at least) the first `length` terms are known.
+
+        Parameters:
+          length -- The amount of terms that should be known.
+        """
+        if len(self.terms) >= length:
+            return
+
+        # Sizes the bytes such that they (probably) fit all values of the first `length` terms
+        if isinstance(self.__visited, bytearray):
+            size = max(self.__current, 0) + self.growth * length
+            if self.__reserve(self.__visited, size, length):
+                self.__extend_bytes(self.__visited, length)
+        if isinstance(self.__visited, set):
+            self.__extend_set(self.__visited, length)
+
+    def prefix(self, length: int) -> Generator:
+        """
+        Yields the first `length` terms of the sequence, computing them if needed.
+
+        Parameters:
+          length -- The amount of terms to yield.
+
+        Returns a generator that generates the sequence.
+        """
+        self.extend_to(length)
+        terms = self.terms
+        return (terms[index] for index in range(length))
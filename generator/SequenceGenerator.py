@@ -1,17 +1,51 @@
 # Typing
-from typing import Any, Callable, Dict, Generator, List, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 
 # Packages
+from functools import lru_cache, partial
+import numpy as np
+from math import comb, isqrt
+from random import Random
 import itertools
+import numbers
+import operator
 
 # Own
 from exception import (
+    InvalidIndexException,
     InvalidLengthException,
+    InvalidModulusException,
     MissingRequiredParameter,
-    MissingItem,
     NotYetImplemented,
 )
-from helper import check_item_list
+from generator.DtypePlanner import DtypePlanner
+from generator.GenerationPlan import GenerationPlan
+from generator.InternedLog import InternedLog
+from generator.LinearRecurrence import LinearRecurrence
+from generator.Log import Log
+from generator.ModularBackend import ModularBackend
+from generator.NumpyBackend import NumpyBackend
+from generator.ParallelBackend import ParallelBackend
+from generator.ParamGrid import ParamGrid
+from generator.PrefixLog import PrefixLog
+from generator.Recaman import Recaman
+from generator.Trace import Trace
+from generator.VirtualLog import VirtualLog
 
 
 class SequenceGenerator:
@@ -24,6 +58,9 @@ class SequenceGenerator:
                 a list of required parameters and a reference to the method.
     """
 
+    superpose_length = 128
+    """The longest traces for which linear generators combine basis traces, longer traces are generated one by one."""
+
     # Class Methods
     def __init__(self, wanted_length: int = 10):
         """
@@ -42,22 +79,49 @@ class SequenceGenerator:
         """The amount of items to generate."""
         self.config: Dict[str, Dict[str, Any]] = {
             # fib = short term, multiple dependencies
-            "fib": {"parameters": ["first", "second"], "method": self.__fib_wrapper},
-            "pascal": {"parameters": ["first"], "method": self.__pascal_wrapper},
-            "recaman": {"parameters": ["first"], "method": self.__recaman_wrapper},
-            "catalan": {"parameters": ["first"], "method": self.__catalan_wrapper},
+            "fib": {
+                "parameters": ["first", "second"],
+                "method": self.__fib_wrapper,
+                "nth_term": self.__fib_nth_term_wrapper,
+                "recurrence": {"coefficients": (1, 1), "seeds": ["first", "second"]},
+                "linear": True,
+            },
+            "pascal": {
+                "parameters": ["first"],
+                "method": self.__pascal_wrapper,
+                "nth_term": self.__pascal_nth_term_wrapper,
+                "stream": self.__pascal_stream_wrapper,
+            },
+            "recaman": {
+                "parameters": ["first"],
+                "method": self.__recaman_wrapper,
+                "stream": self.__recaman_stream_wrapper,
+            },
+            "catalan": {
+                "parameters": ["first"],
+                "method": self.__catalan_wrapper,
+                "stream": self.__catalan_stream_wrapper,
+            },
             "range_up": {
                 "parameters": ["first", "step"],
                 "method": self.__range_up_wrapper,
+                "stream": self.__range_up_stream_wrapper,
             },
             "range_down": {
                 "parameters": ["last", "step"],
                 "method": self.__range_down_wrapper,
+                "stream": self.__range_down_stream_wrapper,
+                "reversed": True,
             },
             # long term, multiple dependency
             "long_term_dependency": {
                 "parameters": ["first", "second", "third", "fourth", "fifth"],
                 "method": self.__long_term_dependency_wrapper,
+                "recurrence": {
+                    "coefficients": (1, 0, 0, 0, 1),
+                    "seeds": ["first", "second", "third", "fourth", "fifth"],
+                },
+                "linear": True,
             },
             # long term, singular dependency
             "long_term_single_dependency": {
@@ -70,15 +134,36 @@ class SequenceGenerator:
                     "constant",
                 ],
                 "method": self.__long_term_single_dependency_wrapper,
+                "recurrence": {
+                    "coefficients": (0, 0, 0, 0, "constant"),
+                    "seeds": ["first", "second", "third", "fourth", "fifth"],
+                },
             },
             # short term, singular dependency
             "short_term_single_dependency": {
                 "parameters": ["first", "constant"],
                 "method": self.__short_term_single_dependency_wrapper,
+                "recurrence": {"coefficients": ("constant",), "seeds": ["first"]},
             },
         }
         """A config object that holds, per implemented metod,
-        a list of required parameters and a reference to the method."""
+        a list of required parameters and a reference to the method.
+        Methods that support random access also hold a reference to an `nth_term` method,
+        and methods whose traces are linear in their parameters are flagged with `linear`.
+
+        Linear recurrences hold a `recurrence` with their `coefficients` (c_1, ..., c_k) and `seeds`,
+        see `generator.LinearRecurrence.LinearRecurrence`. Coefficients are integers or parameter names.
+        A recurrence without a `method` or `nth_term` is generated by the recurrence engine,
+        so new recurrences only need a config entry with `parameters` and a `recurrence`.
+
+        Methods whose traces can be resumed hold a reference to a `stream` method, that yields all terms without bound
+        (recurrences do not need one). Streams of methods flagged with `reversed` yield the terms back to front."""
+
+        self.__basis_cache: Dict[Tuple[str, int, Hashable], List[Tuple[int, ...]]] = {}
+        """Basis traces of linear sequence generators, per (sequence name, length, config entry)."""
+
+        self.__plans: Dict[Tuple[str, int, Hashable], GenerationPlan] = {}
+        """Compiled plans, per (sequence name, length, config entry), see `SequenceGenerator.compile`."""
 
     def __repr__(self) -> str:
         return f"SequenceGenerator(length={self.length}, implemented_generators={self.get_generators()})"
@@ -95,23 +180,7 @@ class SequenceGenerator:
 
         Returns a generator that generates the sequence.
         """
-        yield first
-        # If you only want 1 number, for some reason?
-        if self.length == 1:
-            return
-
-        yield second
-
-        count = 0
-        while count < self.length - 2:
-            # Increment count
-            count += 1
-            # Compute next value
-            current = first + second
-            yield current
-            # Update values
-            first = second
-            second = current
+        return self.__recurrence("fib", {"first": first, "second": second})
 
     def __fib_wrapper(self, params: Dict[str, int]) -> Generator:
         """
@@ -122,60 +191,156 @@ class SequenceGenerator:
         """
         return self.__fib(first=params["first"], second=params["second"])
 
+    def __fib_nth_term(self, n: int, first: int = 1, second: int = 1) -> int:
+        """
+        Computes the term at index `n` of the Fibonacci sequence
+        where the first term is `first` and the second term is `second`,
+        without generating the terms before it.
+
+        Uses fast doubling on the standard Fibonacci numbers F(k), and the identity
+        G(n) = first * F(n - 1) + second * F(n) = first * (F(n + 1) - F(n)) + second * F(n).
+        This takes O(log n) big integer multiplications.
+
+        Parameters:
+          n: The (zero-based) index of the wanted term.
+          first: The first element of the sequence.
+          second: The second element of the sequence.
+
+        Returns the term at index `n`.
+        """
+        # Invariant: (a, b) = (F(k), F(k + 1)) for k the bits of n processed so far
+        a, b = 0, 1
+        for bit in bin(n)[2:]:
+            # Doubling: F(2k) = F(k) * (2F(k + 1) - F(k)), F(2k + 1) = F(k)^2 + F(k + 1)^2
+            c = a * (2 * b - a)
+            d = a * a + b * b
+            if bit == "1":
+                a, b = d, c + d
+            else:
+                a, b = c, d
+
+        return first * (b - a) + second * a
+
+    def __fib_nth_term_wrapper(self, n: int, params: Dict[str, int]) -> int:
+        """
+        Wrapper method for `self.__fib_nth_term`.
+        Written so we can have a unified interface to compute terms, given a sequence key.
+
+        **Unsafe** when used in any other place than the generation config dict `SequenceGenerator.config`.
+        """
+        return self.__fib_nth_term(n, first=params["first"], second=params["second"])
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def __pascal_template(length: int) -> Tuple[int, ...]:
+        """
+        Computes the first `length` numbers of the triangle of pascal (with 1 on top),
+        read from left to right, top to bottom, as one flat tuple.
+
+        Every other pascal sequence is a multiple of this one, so the template is cached
+        and shared between all generators (bounded to the most recently used lengths).
+
+        Parameters:
+          length: The amount of numbers to compute.
+
+        Returns a tuple with the first `length` numbers of the triangle.
+        """
+        template = [1]
+        row = [1]
+
+        while len(template) < length:
+            # compute the next row, and add it to the template
+            row = [1] + [left + right for left, right in zip(row, row[1:])] + [1]
+            template.extend(row)
+
+        return tuple(template[:length])
+
+    @staticmethod
+    def __pascal_position(index: int) -> Tuple[int, int]:
+        """
+        Maps an index in the (flattened) triangle of pascal to its position in the triangle.
+        Row `r` starts at index r (r + 1) / 2, such that `r` is the largest row for which that is at most `index`.
+
+        Parameters:
+          index: The (zero-based) index in the sequence.
+
+        Returns a tuple (row, column), both zero-based.
+        """
+        row = (isqrt(8 * index + 1) - 1) // 2
+        return row, index - row * (row + 1) // 2
+
     def __pascal(self, first: int = 1) -> Generator:
         """
         Yield the first `self.length` numbers of the sequence defined by
         reading the pascal triangle from left to right, top to bottom,
         where the first integer is `first` (usually this is 1).
 
+        Every number in the triangle is `first` times a binomial coefficient,
+        so the sequence is a scaled copy of the shared template `self.__pascal_template`.
+
         Parameters:
           first: The first integer on top of the triangle,
                    and consequently the first integer in the sequence.
 
         Returns a generator that generates the sequence.
         """
-        yield first
+        template = self.__pascal_template(self.length)
 
-        # If for some reason you only want the first number?
-        if self.length == 1:
-            return
+        # The template itself is the default sequence
+        if first == 1:
+            return (item for item in template)
 
-        def next_row(row: List[int]) -> List[int]:
-            """
-            Computes the next row in the triangle of pascal.
+        return (first * item for item in template)
 
-            Parameters:
-              row: The current row.
+    def __pascal_nth_term(self, n: int, first: int = 1) -> int:
+        """
+        Computes the term at index `n` of the sequence defined by
+        reading the pascal triangle from left to right, top to bottom,
+        where the first integer is `first`, directly as `first` times a binomial coefficient.
 
-            Returns a the next row.
-            """
-            lst = []
-            tmp = 0
-            for val in row:
-                lst.append(tmp + val)
-                tmp = val
-            lst.append(first)
-            return lst
+        Parameters:
+          n: The (zero-based) index of the wanted term.
+          first: The first integer on top of the triangle.
 
-        row = [first]
+        Returns the term at index `n`.
+        """
+        row, column = self.__pascal_position(n)
+        return first * comb(row, column)
+
+    def __pascal_nth_term_wrapper(self, n: int, params: Dict[str, int]) -> int:
+        """
+        Wrapper method for `self.__pascal_nth_term`.
+        Written so we can have a unified interface to compute terms, given a sequence key.
 
-        # Keep track of counts, start at 1
-        counts = 1
+        **Unsafe** when used in any other place than the generation config dict `SequenceGenerator.config`.
+        """
+        return self.__pascal_nth_term(n, first=params["first"])
+
+    def __pascal_stream(self, first: int = 1) -> Generator:
+        """
+        Yields all numbers of `self.__pascal`, without bound, row by row.
+
+        Parameters:
+          first: The first integer on top of the triangle.
 
+        Returns an infinite generator that generates the sequence.
+        """
+        row = [1]
         while True:
+            for item in row:
+                yield first * item
+
             # compute the next row
-            next = next_row(row)
-
-            # loop through them
-            for item in next:
-                # test for length
-                if counts < self.length:
-                    yield item
-                    counts += 1
-                else:
-                    return
+            row = [1] + [left + right for left, right in zip(row, row[1:])] + [1]
 
-            row = next
+    def __pascal_stream_wrapper(self, params: Dict[str, int]) -> Generator:
+        """
+        Wrapper method for `self.__pascal_stream`.
+        Written so we can have a unified interface to resume traces, given a sequence key.
+
+        **Unsafe** when used in any other place than the generation config dict `SequenceGenerator.config`.
+        """
+        return self.__pascal_stream(first=params["first"])
 
     def __pascal_wrapper(self, params: Dict[str, int]) -> Generator:
         """
@@ -192,95 +357,112 @@ class SequenceGenerator:
         from the on-line encyclopedia of integer sequences.
         Available [here](https://oeis.org/A005132).
 
+        The terms are computed by a shared `generator.Recaman.Recaman` instance per `first`,
+        such that longer traces extend previously computed ones in stead of starting over.
+
         Parameters:
           first: The first element of the sequence.
                    The original sequence defines this as 0.
 
         Returns a generator that generates the sequence.
         """
-        # If for some reason you only want the first number?
-        if self.length == 1:
-            yield first
-            return
-
-        # Keep track of a count and already seen digits
-        count = 0
-        current = first
-        already_seen = set([])
-
-        def get_next(current: int, index: int) -> int:
-            """
-            Computes the next value in the sequence.
+        return Recaman.cached(first).prefix(self.length)
 
-            Parameters:
-              current: The current value.
-              index: The index of the current value.
-
-            Returns the new value.
-            """
-            # Compute a(n) = a(n-1) - n
-            # if nonnegative and not in sequence, return
-            new_number = current - index
-
-            if (new_number < 0) | (new_number in already_seen):
-                # Negative or already seen: add index in stead
-                new_number = current + index
+    def __recaman_wrapper(self, params: Dict[str, int]) -> Generator:
+        """
+        Wrapper method for `self.recaman`.
+        Written so we can have a unified interface to generate traces, given a sequence key.
 
-            return new_number
+        **Unsafe** when used in any other place than the generation config dict `SequenceGenerator.config`.
+        """
+        return self.__recaman(first=params["first"])
 
-        while count < self.length:
-            # Compute next term in the sequence
-            new = get_next(current, count)
+    def __recaman_stream(self, first: int = 0) -> Generator:
+        """
+        Yields all numbers of `self.__recaman`, without bound.
+        The shared `generator.Recaman.Recaman` instance is extended in (growing) chunks.
 
-            # Save it to the set of already seen terms
-            already_seen.add(new)
+        Parameters:
+          first: The first element of the sequence.
 
-            # Set current to new value and increase count
-            count += 1
-            current = new
+        Returns an infinite generator that generates the sequence.
+        """
+        sequence = Recaman.cached(first)
+        index, chunk = 0, 64
+        while True:
+            sequence.extend_to(index + chunk)
+            # Read the terms after extending, they may have moved to python integers
+            terms = sequence.terms
+            for position in range(index, index + chunk):
+                yield terms[position]
 
-            # Finally, yield the correct value
-            yield current
+            index, chunk = index + chunk, chunk * 2
 
-    def __recaman_wrapper(self, params: Dict[str, int]) -> Generator:
+    def __recaman_stream_wrapper(self, params: Dict[str, int]) -> Generator:
         """
-        Wrapper method for `self.recaman`.
-        Written so we can have a unified interface to generate traces, given a sequence key.
+        Wrapper method for `self.__recaman_stream`.
+        Written so we can have a unified interface to resume traces, given a sequence key.
 
         **Unsafe** when used in any other place than the generation config dict `SequenceGenerator.config`.
         """
-        return self.__recaman(first=params["first"])
+        return self.__recaman_stream(first=params["first"])
 
-    def __catalan(self, first: int = 1) -> Generator:
+    def __catalan(self, first: int = 1) -> Iterator[int]:
         """
         Generates the Catalan numbers, where the first integer is parametrised.
         The catalan sequence is available [here](https://oeis.org/A000108).
 
-        Implemented using dynamic programming as the direct formula has issues with `n > 30`
+        The direct (floating point) formula has issues with `n > 30`.
         In particular, 14544636039226909 became 14544636039226908 and all subsequent values were off.
+        The quadratic dynamic programming table C(n) = sum_j C(j) * C(n - j - 1), with C(0) = C(1) = `first`,
+        is exact but costs O(n^2) big integer multiplications for every value of `first`.
+
+        In stead, we use that the generating function of that table is algebraic,
+        namely C(x) = `first` + (`first` - `first`^2) x + x C(x)^2.
+        Its coefficients therefore satisfy a linear recurrence with polynomial coefficients (for n >= 2):
+        (n + 1) C(n) = 2 `first` (2n - 1) C(n - 1) - 4 `first` (`first` - 1) (n - 2) C(n - 2).
+        The division is always exact, so every term costs O(1) big integer operations.
+        For `first` = 1 this is the well known (n + 1) C(n) = 2 (2n - 1) C(n - 1).
 
         Parameters:
           first: The first element of the sequence.
                    The original sequence defines this as 1.
 
-        Returns a generator that generates the sequence.
+        Returns an iterator that generates the sequence.
         """
-        # Initialise dynamic programming table
-        dp = [0] * (self.length + 1)
-        dp[0] = first  # in our case this is a parameter. By default it should be 1.
-        dp[1] = first  # in our case this is a parameter. By default it should be 1.
+        return itertools.islice(self.__catalan_stream(first), self.length)
 
-        # Fill the dp entries based on the recursive formula
-        for i in range(2, self.length + 1):
-            for j in range(i):
-                dp[i] += dp[j] * dp[i - j - 1]
+    def __catalan_stream(self, first: int = 1) -> Generator:
+        """
+        Yields all numbers of `self.__catalan`, without bound.
 
-        # Loop through table, and yield the next item as long as the index does not exceed the length!
-        for index in range(len(dp)):
-            if index < self.length:
-                yield dp[index]
+        Parameters:
+          first: The first element of the sequence.
 
-    def __catalan_wrapper(self, params: Dict[str, int]) -> Generator:
+        Returns an infinite generator that generates the sequence.
+        """
+        # in our case this is a parameter. By default it should be 1.
+        yield first
+        yield first
+
+        # Constant part of the coefficient of C(n - 2)
+        constant = 4 * first * (first - 1)
+
+        # Keep track of C(n - 2) and C(n - 1)
+        n_minus_2 = first
+        n_minus_1 = first
+
+        for n in itertools.count(2):
+            # Compute next number and yield it
+            current = (
+                2 * first * (2 * n - 1) * n_minus_1 - constant * (n - 2) * n_minus_2
+            ) // (n + 1)
+            yield current
+
+            # Update values
+            n_minus_2, n_minus_1 = n_minus_1, current
+
+    def __catalan_wrapper(self, params: Dict[str, int]) -> Iterator[int]:
         """
         Wrapper method for `self.recaman`.
         Written so we can have a unified interface to generate traces, given a sequence key.
@@ -289,6 +471,15 @@ class SequenceGenerator:
         """
         return self.__catalan(first=params["first"])
 
+    def __catalan_stream_wrapper(self, params: Dict[str, int]) -> Generator:
+        """
+        Wrapper method for `self.__catalan_stream`.
+        Written so we can have a unified interface to resume traces, given a sequence key.
+
+        **Unsafe** when used in any other place than the generation config dict `SequenceGenerator.config`.
+        """
+        return self.__catalan_stream(first=params["first"])
+
     def __range_up(self, first: int = 0, step: int = 1) -> Generator:
         """
         Simple range generator that counts up.
@@ -327,6 +518,15 @@ class SequenceGenerator:
         """
         return self.__range_up(first=params["first"], step=params["step"])
 
+    def __range_up_stream_wrapper(self, params: Dict[str, int]) -> Iterator[int]:
+        """
+        Wrapper method that yields all numbers of `self.range_up`, without bound.
+        Written so we can have a unified interface to resume traces, given a sequence key.
+
+        **Unsafe** when used in any other place than the generation config dict `SequenceGenerator.config`.
+        """
+        return itertools.count(params["first"], params["step"])
+
     def __range_down(self, last: int = 0, step: int = 1) -> Generator:
         """
         Simple range generator that counts down with stepsize `step`
@@ -368,6 +568,16 @@ class SequenceGenerator:
         """
         return self.__range_down(last=params["last"], step=params["step"])
 
+    def __range_down_stream_wrapper(self, params: Dict[str, int]) -> Iterator[int]:
+        """
+        Wrapper method that yields all numbers of `self.range_down`, without bound, back to front.
+        A longer trace starts higher, but every trace ends with `last` + `step` - 1,
+        so traces of different lengths only extend each other when read back to front.
+
+        **Unsafe** when used in any other place than the generation config dict `SequenceGenerator.config`.
+        """
+        return itertools.count(params["last"] + params["step"] - 1, params["step"])
+
     def __long_term_dependency(
         self,
         first: int = 0,
@@ -380,42 +590,14 @@ class SequenceGenerator:
         Generalization of Fibonacci sequence with increased dependency, where F(n) = F(n-1) + F(n-5).
         In other words, the 6th term is equal to the sum of the 5th and the 1st.
         """
-        count = 0
-
-        # Basecases
-        should_check = [first, second, third, fourth, fifth]
-        for num in should_check:
-            if count < self.length:
-                yield num
-                count += 1
-            else:
-                return
-
-        # Assume we want the next element in general case
-
-        # Need to keep points to 5 previous elements
-        n_minus_1 = fifth
-        n_minus_2 = fourth
-        n_minus_3 = third
-        n_minus_4 = second
-        n_minus_5 = first
-
-        while count < self.length:
-            # Increment count
-            count += 1
-
-            # Compute next number and yield it
-            n = n_minus_5 + n_minus_1
-            yield n
-
-            # Update values
-            n_minus_1, n_minus_2, n_minus_3, n_minus_4, n_minus_5 = (
-                n,
-                n_minus_1,
-                n_minus_2,
-                n_minus_3,
-                n_minus_4,
-            )
+        params = {
+            "first": first,
+            "second": second,
+            "third": third,
+            "fourth": fourth,
+            "fifth": fifth,
+        }
+        return self.__recurrence("long_term_dependency", params)
 
     def __long_term_dependency_wrapper(self, params: Dict[str, int]) -> Generator:
         """
@@ -444,42 +626,15 @@ class SequenceGenerator:
         """
         F(n) = F(n-5) * c.
         """
-        count = 0
-
-        # Basecases
-        should_check = [first, second, third, fourth, fifth]
-        for num in should_check:
-            if count < self.length:
-                yield num
-                count += 1
-            else:
-                return
-
-        # Assume we want the next element in general case
-
-        # Need to keep points to 5 previous elements
-        n_minus_1 = fifth
-        n_minus_2 = fourth
-        n_minus_3 = third
-        n_minus_4 = second
-        n_minus_5 = first
-
-        while count < self.length:
-            # Increment count
-            count += 1
-
-            # Compute next number and yield it
-            n = n_minus_5 * constant
-            yield n
-
-            # Update values
-            n_minus_1, n_minus_2, n_minus_3, n_minus_4, n_minus_5 = (
-                n,
-                n_minus_1,
-                n_minus_2,
-                n_minus_3,
-                n_minus_4,
-            )
+        params = {
+            "first": first,
+            "second": second,
+            "third": third,
+            "fourth": fourth,
+            "fifth": fifth,
+            "constant": constant,
+        }
+        return self.__recurrence("long_term_single_dependency", params)
 
     def __long_term_single_dependency_wrapper(
         self, params: Dict[str, int]
@@ -505,20 +660,9 @@ class SequenceGenerator:
         """
         A short term dependency. F(n) = F(n-1) * c
         """
-        yield first
-        # If you only want 1 number, for some reason?
-        if self.length == 1:
-            return
-
-        count = 0
-        while count < self.length - 1:
-            # Increment count
-            count += 1
-            # Compute next value
-            current = first * constant
-            yield current
-            # Update values
-            first = current
+        return self.__recurrence(
+            "short_term_single_dependency", {"first": first, "constant": constant}
+        )
 
     def __short_term_single_dependency_wrapper(
         self, params: Dict[str, int]
@@ -555,9 +699,198 @@ class SequenceGenerator:
 
         Returns a method reference.
         """
-        return self.config[seq_name]["method"]
+        entry = self.config[seq_name]
+        if "method" not in entry:
+            return partial(self.__recurrence, seq_name)
+        return entry["method"]
+
+    def __get_nth_term_method(
+        self, seq_name: str
+    ) -> Callable[[int, Dict[str, int]], int]:
+        """
+        Gets the method reference that computes single terms for a particular sequence generator.
+
+        Parameters:
+          seq_name: The name of the sequence generation method for which to retrieve a method reference.
+
+        Raises a `NotYetImplemented` when the method does not support random access.
+
+        Returns a method reference.
+        """
+        entry = self.config[seq_name]
+        if "nth_term" in entry:
+            return entry["nth_term"]
+        if "recurrence" in entry:
+            return partial(self.__recurrence_nth_term, seq_name)
+        raise NotYetImplemented(f"{seq_name}.nth_term")
+
+    def __get_stream_method(
+        self, seq_name: str
+    ) -> Callable[[Dict[str, int]], Iterator[int]]:
+        """
+        Gets the method reference that yields all terms of a particular sequence generator.
+
+        Parameters:
+          seq_name: The name of the sequence generation method for which to retrieve a method reference.
+
+        Raises a `NotYetImplemented` when the method cannot be resumed.
+
+        Returns a method reference.
+        """
+        entry = self.config[seq_name]
+        if "stream" in entry:
+            return entry["stream"]
+        if "recurrence" in entry:
+            return partial(self.__recurrence_stream, seq_name)
+        raise NotYetImplemented(f"{seq_name}.stream")
+
+    # Linear recurrences
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def __recurrence_engine(coefficients: Tuple[int, ...]) -> LinearRecurrence:
+        """
+        Gets the engine for a linear recurrence, shared between all generators
+        (bounded to the most recently used coefficients).
+
+        Parameters:
+          coefficients: The coefficients (c_1, ..., c_k), where c_i multiplies F(n - i).
+
+        Returns a `generator.LinearRecurrence.LinearRecurrence`.
+        """
+        return LinearRecurrence(coefficients)
+
+    def __get_recurrence(
+        self, seq_name: str, params: Dict[str, int]
+    ) -> Tuple[LinearRecurrence, List[int]]:
+        """
+        Resolves the recurrence of a sequence generator for particular parameters.
+
+        Parameters:
+          seq_name: The name of the (recurrence) sequence generation method.
+          params: The parameters of the trace.
+
+        Returns a tuple of the engine and the seeds.
+        """
+        recurrence = self.config[seq_name]["recurrence"]
+        coefficients = tuple(
+            params[coefficient] if isinstance(coefficient, str) else coefficient
+            for coefficient in recurrence["coefficients"]
+        )
+        seeds = [params[seed] for seed in recurrence["seeds"]]
+        return self.__recurrence_engine(coefficients), seeds
+
+    def __recurrence(self, seq_name: str, params: Dict[str, int]) -> Generator:
+        """
+        Yield the first `self.length` numbers of the linear recurrence of a sequence generator.
+        Written so we can have a unified interface to generate traces, given a sequence key.
+
+        **Unsafe** when used in any other place than the generation config dict `SequenceGenerator.config`.
+        """
+        engine, seeds = self.__get_recurrence(seq_name, params)
+        return (term for term in engine.terms(seeds, self.length))
+
+    def __recurrence_stream(self, seq_name: str, params: Dict[str, int]) -> Generator:
+        """
+        Yields all numbers of the linear recurrence of a sequence generator, without bound.
+        Written so we can have a unified interface to resume traces, given a sequence key.
+
+        **Unsafe** when used in any other place than the generation config dict `SequenceGenerator.config`.
+        """
+        engine, seeds = self.__get_recurrence(seq_name, params)
+        return engine.stream(seeds)
+
+    def __recurrence_nth_term(
+        self, seq_name: str, n: int, params: Dict[str, int]
+    ) -> int:
+        """
+        Computes the term at index `n` of the linear recurrence of a sequence generator,
+        by jumping ahead in O(k^2 log n) operations.
+        Written so we can have a unified interface to compute terms, given a sequence key.
+
+        **Unsafe** when used in any other place than the generation config dict `SequenceGenerator.config`.
+        """
+        engine, seeds = self.__get_recurrence(seq_name, params)
+        return engine.nth_term(seeds, n)
+
+    def __compile_method(
+        self, seq_name: str
+    ) -> Callable[[Sequence[int]], Iterable[int]]:
+        """
+        Gets a method reference for a particular sequence generator, that takes the parameter values in config order.
+        Recurrences are bound to their engine directly, or to the shared engine cache when coefficients are parameters.
+
+        Parameters:
+          seq_name: The name of the sequence generation method for which to retrieve a method reference.
+
+        Returns a method reference.
+        """
+        names = self.__get_params(seq_name)
+        entry = self.config[seq_name]
+
+        if "recurrence" in entry:
+            recurrence = entry["recurrence"]
+            seeds = [names.index(seed) for seed in recurrence["seeds"]]
+            length = self.length
+
+            coefficients = recurrence["coefficients"]
+            if not any(isinstance(coefficient, str) for coefficient in coefficients):
+                engine = self.__recurrence_engine(tuple(coefficients))
+
+                def recurrence_method(values: Sequence[int]) -> List[int]:
+                    """
+                    Runs the (bound) engine on the seeds among `values`.
+                    """
+                    return engine.terms([values[i] for i in seeds], length)
+
+                return recurrence_method
+
+            # Coefficients are constants, or the position of a parameter among `values`
+            resolved = [
+                (
+                    (names.index(coefficient), 0)
+                    if isinstance(coefficient, str)
+                    else (None, coefficient)
+                )
+                for coefficient in coefficients
+            ]
+            engine_for = self.__recurrence_engine
+
+            def parametric_method(values: Sequence[int]) -> List[int]:
+                """
+                Runs the engine of the coefficients among `values` on the seeds among `values`.
+                """
+                engine = engine_for(
+                    tuple(
+                        constant if i is None else values[i] for i, constant in resolved
+                    )
+                )
+                return engine.terms([values[i] for i in seeds], length)
+
+            return parametric_method
+
+        method = self.__get_method(seq_name)
+
+        def config_method(values: Sequence[int]) -> Iterable[int]:
+            """
+            Calls the (bound) config method with a dictionary of `values`.
+            """
+            return method(dict(zip(names, values)))
+
+        return config_method
 
     # Helper methods
+    def __check_implemented(self, seq_name: str) -> None:
+        """
+        Checks whether a sequence generation method is implemented.
+
+        Parameters:
+          seq_name: The name of the sequence generation method to check.
+
+        Raises a `NotYetImplemented` when the `seq_name` key does not correspond to a generator method.
+        """
+        if seq_name.strip().lower() not in self.config:
+            raise NotYetImplemented(seq_name)
+
     def __check_params(self, given: Dict[str, Any], required: List[str]) -> None:
         """
         Checks correctness of supplied parameters to `self.generate_trace` or `self.generate_log`.
@@ -596,60 +929,246 @@ class SequenceGenerator:
             for required_parameter in required
         }
 
-    def __build_param_matrix(
-        self, givens: Dict[str, Any], requireds: List[str]
-    ) -> List[Dict[str, int]]:
+    def __get_basis(self, seq_name: str) -> List[Tuple[int, ...]]:
         """
-        Builds parameter list for usage in `self.generate_log`.
+        Gets the basis traces of a linear sequence generator, computing them at most once per length and config entry.
+        Basis trace `i` is the trace where parameter `i` is 1 and all other parameters are 0.
 
-        Transforms a dictionary of shape:
-        ```
-        {
-            "required_param1" : [1, 2, ..],
-            "required_param2" : [1, 2, 3, 4, ..],
-            "required_param3" : [1, ..],
-            ..
+        Parameters:
+          seq_name: The name of the (linear) sequence generation method for which to retrieve the basis.
+
+        Returns a list of basis traces, one per parameter.
+        """
+        key = (seq_name, self.length, self.__entry_key(seq_name))
+        if key not in self.__basis_cache:
+            required_params = self.__get_params(seq_name)
+            method = self.__get_method(seq_name)
+            self.__basis_cache[key] = [
+                tuple(method({param: int(param == unit) for param in required_params}))
+                for unit in required_params
+            ]
+
+        return self.__basis_cache[key]
+
+    def __superpose_log(
+        self, seq_name: str, value_lists: List[List[int]], start: int = 0
+    ) -> Generator:
+        """
+        Generates the traces of a linear sequence generator for the cartesian product of `value_lists`,
+        as weighted sums of the basis traces rather than by running the generator for every tuple.
+
+        Partial sums are shared between tuples with the same leading parameters,
+        such that every trace costs a single multiply-add per term on top of its parent.
+
+        Parameters:
+          seq_name: The name of the (linear) sequence generation method for which to generate traces.
+          value_lists: Per required parameter (in config order), the list of values to use.
+          start: The first trace to generate, the traces before it are skipped without being generated.
+
+        Returns a generator of traces, in the same order as `itertools.product(*value_lists)`.
+        """
+        basis = self.__get_basis(seq_name)
+        last = len(basis) - 1
+
+        # The position of `start` in every value list, the last list varies fastest
+        firsts = []
+        remaining = start
+        for values in reversed(value_lists):
+            remaining, position = divmod(remaining, max(1, len(values)))
+            firsts.append(position)
+        firsts.reverse()
+
+        def combine(level: int, partial: Tuple[int, ...], resume: bool) -> Generator:
+            """
+            Adds every weighted basis trace of `level` to `partial`, and recurses into the next level.
+            The first branch of a resumed level starts at the position of `start`.
+            """
+            first = firsts[level] if resume else 0
+            for position, weight in enumerate(value_lists[level][first:], first):
+                if weight == 0:
+                    combined = partial
+                else:
+                    combined = tuple(
+                        [
+                            term + weight * unit
+                            for term, unit in zip(partial, basis[level])
+                        ]
+                    )
+
+                if level == last:
+                    yield combined
+                else:
+                    yield from combine(
+                        level + 1, combined, resume and position == first
+                    )
+
+        return combine(0, (0,) * self.length, True)
+
+    def __entry_key(self, seq_name: str) -> Hashable:
+        """
+        Gets a hashable copy of the config entry of a sequence generator (see `SequenceGenerator.export_entry`),
+        which is equal for generators with equal entries, to key caches that outlive changes of the config.
+
+        Parameters:
+          seq_name: The name of the sequence generation method.
+
+        Returns a nested tuple.
+        """
+
+        def freeze(value: Any) -> Hashable:
+            """
+            Converts dictionaries and lists into (sorted) tuples, recursively.
+            """
+            if isinstance(value, dict):
+                return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+            if isinstance(value, (list, tuple)):
+                return tuple(freeze(item) for item in value)
+            return value
+
+        return freeze(self.export_entry(seq_name))
+
+    def __check_log(
+        self,
+        seq_name: str,
+        backend: str,
+        modulus: Optional[int],
+        given: Dict[str, Any],
+    ) -> ParamGrid:
+        """
+        Checks correctness of supplied arguments to `self.generate_log` or `self.iter_log`.
+
+        Parameters:
+          seq_name: The name of the sequence generation method for which to generate a log.
+          backend: The name of the backend.
+          modulus: The modulus, or None.
+          given: The given (keyword) arguments.
+
+        Raises the errors listed in `SequenceGenerator.generate_log`.
+
+        Returns the parameter combinations, as a `generator.ParamGrid.ParamGrid` in config order.
+        """
+        self.__check_implemented(seq_name)
+
+        if backend not in ["python", "numpy"]:
+            raise NotYetImplemented(backend)
+
+        names = self.__get_params(seq_name)
+        required_params = [param + "s" for param in names]
+        self.__check_params(given, required_params)
+        self.__check_length_with_params(seq_name)
+
+        if modulus is not None:
+            self.__check_modulus(modulus)
+
+        return ParamGrid(names, [given[param] for param in required_params])
+
+    def __iter_traces(
+        self,
+        seq_name: str,
+        grid: ParamGrid,
+        backend: str,
+        modulus: Optional[int],
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[Tuple[int, ...]]:
+        """
+        Generates the traces of a sequence generator for the rows of `grid`, one at a time.
+        Backends that build arrays do so per block of traces, such that at most one block is kept in memory.
+
+        **Unsafe** for arguments that were not checked with `self.__check_log`.
+
+        Parameters:
+          seq_name: The name of the sequence generation method for which to generate traces.
+          grid: The parameter combinations, in config order.
+          backend: The name of the backend.
+          modulus: The modulus, or None.
+          start: The first trace to generate.
+          stop: The trace after the last trace to generate, all traces by default.
+
+        Returns an iterator of traces, in the same order as the rows of `grid`.
+        """
+        # Modular arithmetic: every sequence fits in fixed width integers
+        if modulus is not None:
+            modular_backend = self.__modular_backend(modulus)
+            return modular_backend.iter_log(seq_name, grid, start, stop)
+
+        # Closed forms: build blocks of the log at once
+        if backend == "numpy":
+            numpy_backend = NumpyBackend(self.length, self.__planner())
+            if numpy_backend.supports(seq_name):
+                return numpy_backend.iter_log(seq_name, grid, start, stop)
+
+        # Short linear generators: combine basis traces in stead of generating every trace
+        linear = self.config[seq_name].get("linear", False)
+        short = self.length <= self.superpose_length
+        if linear and short and grid.selection is None:
+            last = len(grid) if stop is None else min(stop, len(grid))
+            superposed = self.__superpose_log(seq_name, grid.value_lists, start)
+            return itertools.islice(superposed, max(0, last - start))
+
+        plan = self.compile(seq_name)
+        return (plan.generate_trace(values) for values in grid.rows(start, stop))
+
+    def __recurrences(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Gets the config entries of all linear recurrences, for backends that evaluate (or bound) them generically.
+
+        Returns a dictionary with the config entry per sequence name.
+        """
+        return {
+            seq_name: entry
+            for seq_name, entry in self.config.items()
+            if "recurrence" in entry
         }
-        ```
-        to our wanted list of shape:
-        ```
-        [
-            {
-                "required_param1" : 1,
-                "required_param2" : 1,
-                "required_param3" : 1
-            },
-            ...
-            {
-                "required_param1" : 3,
-                "required_param2" : 3,
-                "required_param3" : 3
-            }
-        ]
-        ```
+
+    def __planner(self) -> DtypePlanner:
+        """
+        Builds the dtype planner for `self.length`, with the linear recurrences of `self.config`.
+
+        Returns a `generator.DtypePlanner.DtypePlanner`.
+        """
+        return DtypePlanner(self.length, self.generate_trace, self.__recurrences())
+
+    def __modular_backend(self, modulus: int) -> ModularBackend:
+        """
+        Builds the modular backend for `self.length`, with the linear recurrences of `self.config`.
 
         Parameters:
-          given: The given dictionary.
-          required : The required items.
+          modulus: The modulus, any integral type (such as a numpy integer) is converted to a python integer.
+
+        Returns a `generator.ModularBackend.ModularBackend`.
+        """
+        return ModularBackend(
+            self.length, operator.index(modulus), self.__recurrences()
+        )
 
-        Returns a list of dictionaries as listed above.
+    def __build_log(
+        self, seq_name: str, grid: ParamGrid, backend: str, modulus: Optional[int]
+    ) -> Log:
         """
-        # Keep result variable
-        result = []
+        Generates the traces of a sequence generator for the rows of `grid` into a `generator.Log.Log`.
+        Blocks of the numpy backend are stored in the integer type planned for them,
+        without a python integer per term.
+
+        **Unsafe** for arguments that were not checked with `self.__check_log`.
 
-        # Create dictionary out of lists
-        array_dict = self.__build_params(givens, requireds)
+        Parameters:
+          seq_name: The name of the sequence generation method for which to generate traces.
+          grid: The parameter combinations, in config order.
+          backend: The name of the backend.
+          modulus: The modulus, or None.
 
-        # Compute the cartesian product using itertools
-        compute_product_of_me = list(array_dict.values())
-        for tuple_of_vals in itertools.product(*compute_product_of_me):
-            # tuple_of_vals: (a, b, c, ...)
-            # len(item) == len(keys)
-            # item[0] corresponds with keys[0]
-            keys = [key[:-1] for key in array_dict.keys()]
-            result.append({key: value for (key, value) in zip(keys, tuple_of_vals)})
+        Returns a `generator.Log.Log` with the traces, in the same order as the rows of `grid`.
+        """
+        if backend == "numpy" and modulus is None:
+            numpy_backend = NumpyBackend(self.length, self.__planner())
+            if numpy_backend.supports(seq_name):
+                log = Log()
+                for block in numpy_backend.iter_blocks(seq_name, grid):
+                    log.extend_array(block)
+                return log
 
-        return result
+        return Log(self.__iter_traces(seq_name, grid, backend, modulus))
 
     def __check_length_with_params(self, seq_name: str) -> None:
         """
@@ -670,6 +1189,22 @@ class SequenceGenerator:
                     if a method needs a minimum of %s parameters",
             )
 
+    def __check_modulus(self, modulus: int) -> None:
+        """
+        Checks whether sequences can be reduced by `modulus`.
+
+        Parameters:
+          modulus: The modulus to check.
+
+        Raises an `InvalidModulusException` when the modulus is not a positive integer.
+        """
+        if (
+            not isinstance(modulus, numbers.Integral)
+            or isinstance(modulus, bool)
+            or modulus <= 0
+        ):
+            raise InvalidModulusException(modulus)
+
     # Public methods
     def get_generators(self) -> List[str]:
         """
@@ -679,22 +1214,80 @@ class SequenceGenerator:
         """
         return [generator for generator in self.config.keys()]
 
-    def generate_trace(self, seq_name: str, **kwargs: Any) -> Generator:
+    def export_entry(self, seq_name: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Copies the config entry of a sequence generator, such that another generator
+        (of another length, or in another process) can register it with `SequenceGenerator.import_entry`.
+        Methods of this generator cannot be pickled, so they are exported by the name of their attribute.
+
+        Parameters:
+          seq_name: The name of the sequence generation method for which to export the config entry.
+
+        Raises a `NotYetImplemented` when the `seq_name` key does not correspond to a generator method.
+
+        Returns a tuple of the entry without the methods of this generator, and per key of those methods,
+        the name of the attribute that holds it.
+        """
+        self.__check_implemented(seq_name)
+
+        attributes = {
+            attribute: name
+            for cls in reversed(type(self).__mro__)
+            for name, attribute in vars(cls).items()
+            if callable(attribute)
+        }
+        entry = self.config[seq_name]
+        methods = {
+            key: attributes[value.__func__]
+            for key, value in entry.items()
+            if getattr(value, "__self__", None) is self
+        }
+        data = {key: value for key, value in entry.items() if key not in methods}
+        return data, methods
+
+    def import_entry(
+        self, seq_name: str, entry: Dict[str, Any], methods: Dict[str, str]
+    ) -> None:
+        """
+        Registers a config entry exported by `SequenceGenerator.export_entry` of another generator,
+        replacing the entry of this generator with the same name.
+
+        Parameters:
+          seq_name: The name of the sequence generation method.
+          entry: The entry, without the methods of the other generator.
+          methods: Per key of a method of the other generator, the name of the attribute that holds it,
+                     which is bound to this generator.
+        """
+        bound = {key: getattr(self, name) for key, name in methods.items()}
+        self.config[seq_name] = dict(entry, **bound)
+
+    def generate_trace(
+        self, seq_name: str, modulus: Optional[int] = None, **kwargs: Any
+    ) -> Generator:
         """
         Generates a single trace corresponding to some sequence.
 
         Parameters:
           seq_name: The name of the sequence generation method for which to generate a trace.
+          modulus: If given, every term is reduced modulo `modulus`,
+                     and computed in fixed width arithmetic (see `generator.ModularBackend.ModularBackend`).
 
         Raises a `NotYetImplemented` when the `seq_name` key does not correspond to a generator method.
         Raises a `MissingRequiredParameter` when a particular parameter was not provided.
+        Raises an `InvalidModulusException` when the modulus is not a positive integer.
 
         Returns a generator for a particular sequence.
         """
-        try:
-            check_item_list(seq_name.strip().lower(), self.get_generators())
-        except MissingItem:
-            raise NotYetImplemented(seq_name)
+        self.__check_implemented(seq_name)
+
+        if modulus is not None:
+            self.__check_modulus(modulus)
+            self.__check_params(kwargs, self.__get_params(seq_name))
+
+            names = self.__get_params(seq_name)
+            grid = ParamGrid(names, [[kwargs[param]] for param in names])
+            (trace,) = self.__modular_backend(modulus).generate_log(seq_name, grid)
+            return (term for term in trace)
 
         # It exists, check for param mismatch
         required_params = self.__get_params(seq_name)
@@ -710,32 +1303,381 @@ class SequenceGenerator:
         # call the function, and return its result
         return method(method_params)
 
-    def generate_log(self, seq_name: str, **kwargs: Any) -> List[Tuple[int, ...]]:
+    def compile(self, seq_name: str, **kwargs: Any) -> GenerationPlan:
         """
-        Generates an entire log corresponding to some sequence.
+        Validates a sequence generator once, and gets a plan that generates its traces without further checks.
+        Plans are cached per (sequence name, length, config entry), such that compiling again only checks
+        the parameter lists, and a changed config entry is compiled again.
 
         Parameters:
-          seq_name: The name of the sequence generation method for which to generate a log.
+          seq_name: The name of the sequence generation method for which to compile a plan.
+
+        Optionally takes the parameter lists of `SequenceGenerator.generate_log`, for `GenerationPlan.generate_log`.
 
         Raises a `NotYetImplemented` when the `seq_name` key does not correspond to a generator method.
+        Raises a `MissingRequiredParameter` when some, but not all, parameter lists were provided.
+        Raises an `InvalidLengthException` when the length is smaller than the amount of parameters.
+
+        Returns a `generator.GenerationPlan.GenerationPlan`.
+        """
+        key = (seq_name, self.length, self.__entry_key(seq_name))
+        if key not in self.__plans:
+            self.__check_length_with_params(seq_name)
+            self.__plans[key] = GenerationPlan(
+                seq_name,
+                self.length,
+                self.__get_params(seq_name),
+                self.__compile_method(seq_name),
+            )
+
+        plan = self.__plans[key]
+        if not kwargs:
+            return plan
+
+        required_params = [param + "s" for param in plan.names]
+        self.__check_params(kwargs, required_params)
+        return plan.bind([kwargs[param] for param in required_params])
+
+    def trace(self, seq_name: str, **kwargs: Any) -> Trace:
+        """
+        Gets a trace corresponding to some sequence, that can be extended in place with `Trace.extend_to`.
+        Traces are shared between generators through a bounded cache keyed on the sequence, its config entry
+        and its parameters (see `generator.Trace.Trace.cached`),
+        such that a longer trace resumes where a shorter one stopped.
+
+        Parameters:
+          seq_name: The name of the sequence generation method for which to get a trace.
+
+        Raises a `NotYetImplemented` when the `seq_name` key does not correspond to a generator method,
+        or when that method cannot be resumed.
         Raises a `MissingRequiredParameter` when a particular parameter was not provided.
 
-        Returns a log of traces a list of tuples.
+        Returns a `generator.Trace.Trace` with (at least) `self.length` terms.
+        `Trace.prefix(self.length)` is equal to `tuple(self.generate_trace(seq_name, **kwargs))`.
         """
-        try:
-            check_item_list(seq_name.strip().lower(), self.get_generators())
-        except MissingItem:
-            raise NotYetImplemented(seq_name)
+        self.__check_implemented(seq_name)
+        stream = self.__get_stream_method(seq_name)
 
-        required_params = [param + "s" for param in self.__get_params(seq_name)]
+        required_params = self.__get_params(seq_name)
         self.__check_params(kwargs, required_params)
-        self.__check_length_with_params(seq_name)
+        params = self.__build_params(kwargs, required_params)
+
+        trace = Trace.cached(
+            seq_name,
+            params,
+            partial(stream, params),
+            reverse=self.config[seq_name].get("reversed", False),
+            entry=self.__entry_key(seq_name),
+        )
+        trace.extend_to(self.length)
+        return trace
+
+    def nth_term(self, seq_name: str, n: int, **kwargs: Any) -> int:
+        """
+        Computes a single term of some sequence, without generating the terms before it.
+        Accepts the same parameters as `SequenceGenerator.generate_trace`,
+        and does not depend on `self.length`.
+
+        Parameters:
+          seq_name: The name of the sequence generation method for which to compute a term.
+          n: The (zero-based) index of the wanted term.
+               Equal to `list(self.generate_trace(seq_name, **kwargs))[n]` whenever `n < self.length`.
 
-        # Create the log variable as a set
-        log = []
+        Raises a `NotYetImplemented` when the `seq_name` key does not correspond to a generator method,
+        or when that method does not support random access.
+        Raises a `MissingRequiredParameter` when a particular parameter was not provided.
+        Raises an `InvalidIndexException` when `n` is negative.
+
+        Returns the term at index `n`.
+        """
+        self.__check_implemented(seq_name)
+        method = self.__get_nth_term_method(seq_name)
 
-        for params in self.__build_param_matrix(kwargs, required_params):
-            trace = tuple(self.generate_trace(seq_name, **params))
-            log.append(trace)
+        if n < 0:
+            raise InvalidIndexException(n)
+
+        required_params = self.__get_params(seq_name)
+        self.__check_params(kwargs, required_params)
+
+        return method(n, self.__build_params(kwargs, required_params))
+
+    def iter_log(
+        self,
+        seq_name: str,
+        backend: str = "python",
+        modulus: Optional[int] = None,
+        sample: Optional[int] = None,
+        seed: Optional[int] = None,
+        stratified: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[Tuple[Dict[str, int], Tuple[int, ...]]]:
+        """
+        Generates an entire log corresponding to some sequence, one trace at a time.
+        Neither the parameter combinations nor the traces are stored,
+        such that memory use does not depend on the size of the log.
+
+        Takes the parameters of `SequenceGenerator.generate_log` that choose the traces
+        (`backend`, `modulus`, `sample`, `seed`, `stratified` and the lists of parameter values),
+        and raises the same errors (immediately).
+
+        Returns an iterator over `(params, trace)` tuples in the order of `SequenceGenerator.generate_log`,
+        where `params` holds a value per parameter (the keyword arguments of `SequenceGenerator.generate_trace`)
+        and `trace` is a tuple.
+        """
+        grid = self.__check_log(seq_name, backend, modulus, kwargs)
+        if sample is not None:
+            grid = grid.sample(sample, seed, stratified)
+
+        params = (dict(zip(grid.names, values)) for values in grid.rows())
+        return zip(params, self.__iter_traces(seq_name, grid, backend, modulus))
+
+    # The type of log depends on the flags, `lengths` first and `compact` last
+    @overload
+    def generate_log(
+        self,
+        seq_name: str,
+        backend: str = ...,
+        modulus: Optional[int] = ...,
+        *,
+        lengths: List[int],
+        **kwargs: Any,
+    ) -> Dict[int, PrefixLog]: ...
+
+    @overload
+    def generate_log(
+        self,
+        seq_name: str,
+        backend: str = ...,
+        modulus: Optional[int] = ...,
+        *,
+        lazy: Literal[True],
+        lengths: None = ...,
+        **kwargs: Any,
+    ) -> VirtualLog: ...
+
+    @overload
+    def generate_log(
+        self,
+        seq_name: str,
+        backend: str = ...,
+        modulus: Optional[int] = ...,
+        *,
+        lazy: Literal[False] = ...,
+        intern: Literal[True],
+        lengths: None = ...,
+        **kwargs: Any,
+    ) -> InternedLog: ...
+
+    @overload
+    def generate_log(
+        self,
+        seq_name: str,
+        backend: str = ...,
+        modulus: Optional[int] = ...,
+        *,
+        lazy: Literal[False] = ...,
+        intern: Literal[False] = ...,
+        compact: Literal[True],
+        lengths: None = ...,
+        **kwargs: Any,
+    ) -> Log: ...
+
+    @overload
+    def generate_log(
+        self,
+        seq_name: str,
+        backend: str = ...,
+        modulus: Optional[int] = ...,
+        *,
+        lazy: Literal[False] = ...,
+        intern: Literal[False] = ...,
+        compact: Literal[False] = ...,
+        lengths: None = ...,
+        **kwargs: Any,
+    ) -> List[Tuple[int, ...]]: ...
+
+    @overload
+    def generate_log(
+        self,
+        seq_name: str,
+        backend: str = ...,
+        modulus: Optional[int] = ...,
+        **kwargs: Any,
+    ) -> Union[
+        List[Tuple[int, ...]], VirtualLog, InternedLog, Log, Dict[int, PrefixLog]
+    ]: ...
+
+    def generate_log(
+        self,
+        seq_name: str,
+        backend: str = "python",
+        modulus: Optional[int] = None,
+        lazy: bool = False,
+        workers: Optional[int] = None,
+        sample: Optional[int] = None,
+        seed: Optional[int] = None,
+        stratified: bool = False,
+        intern: bool = False,
+        lengths: Optional[List[int]] = None,
+        compact: bool = False,
+        **kwargs: Any,
+    ) -> Union[
+        List[Tuple[int, ...]], VirtualLog, InternedLog, Log, Dict[int, PrefixLog]
+    ]:
+        """
+        Generates an entire log corresponding to some sequence.
+        See `SequenceGenerator.iter_log` to generate the traces one at a time.
+
+        Parameters:
+          seq_name: The name of the sequence generation method for which to generate a log.
+          backend: Either "python" (default) or "numpy".
+                     The numpy backend builds the log as one integer array for sequences with a closed form
+                     (see `generator.NumpyBackend.NumpyBackend`), and falls back to python for other sequences.
+                     Both backends produce identical logs.
+          modulus: If given, every term is reduced modulo `modulus`.
+                     All sequences are then generated as (64 bit) integer arrays, regardless of `backend`
+                     (see `generator.ModularBackend.ModularBackend`).
+          lazy: If true, returns a `generator.VirtualLog.VirtualLog` that generates no trace until it is requested,
+                  and supports `len()`, indexing and slicing without building the cartesian product.
+          workers: If more than 1, the log is generated by that many processes,
+                     that each generate contiguous shards of the log (see `generator.ParallelBackend.ParallelBackend`).
+                     The log is identical to the serial log. Ignored when `lazy` is true.
+          sample: If given, only this many distinct parameter combinations are drawn at random,
+                    without building the cartesian product (see `generator.ParamGrid.ParamGrid.sample`).
+                    The traces of the sample are in the order of the full log.
+          seed: The seed of the sample, the same seed gives the same sample.
+          stratified: If true, every value of every parameter occurs (about) equally often in the sample,
+                        in stead of drawing combinations uniformly.
+          intern: If true, returns a `generator.InternedLog.InternedLog` that stores identical traces once,
+                    with a count per distinct trace and the `dedup_ratio` of the log. Ignored when `lazy` is true.
+          lengths: If given, generates the log once, for the longest of these lengths (in stead of `self.length`),
+                     and returns a `generator.PrefixLog.PrefixLog` per length, that views the shorter traces.
+                     Generating for another length uses a generator with the config entry of `seq_name`.
+          compact: If true, returns a `generator.Log.Log` that stores all terms in one flat buffer
+                     of the narrowest integer type, plus an offset per trace. Ignored when `lazy` or `intern` is true.
+                     The numpy backend stores its blocks in the type planned for them (see `self.plan_dtypes`),
+                     without a python integer per term.
+
+        Raises a `NotYetImplemented` when the `seq_name` key does not correspond to a generator method,
+        or when the `backend` is unknown.
+        Raises a `MissingRequiredParameter` when a particular parameter was not provided.
+        Raises an `InvalidModulusException` when the modulus is not a positive integer.
+        Raises an `InvalidLengthException` when the sample is larger than the log,
+        or when a length is not positive or smaller than the amount of parameters.
+
+        Returns a log of traces a list of tuples, a `generator.VirtualLog.VirtualLog` if `lazy` is true,
+        a `generator.InternedLog.InternedLog` if `intern` is true, or a `generator.Log.Log` if `compact` is true.
+        If `lengths` are given, returns a dictionary with a log per length.
+        """
+        if lengths is not None:
+            return self.__generate_logs(
+                seq_name,
+                lengths,
+                backend=backend,
+                modulus=modulus,
+                lazy=lazy,
+                workers=workers,
+                sample=sample,
+                seed=seed,
+                stratified=stratified,
+                intern=intern,
+                compact=compact,
+                **kwargs,
+            )
+
+        grid = self.__check_log(seq_name, backend, modulus, kwargs)
+
+        if sample is not None:
+            # Workers draw the sample again, so they need the seed
+            seed = Random().randrange(2 ** 32) if seed is None else seed
+            grid = grid.sample(sample, seed, stratified)
+            kwargs = dict(kwargs, sample=sample, seed=seed, stratified=stratified)
+
+        if lazy:
+            generate = partial(self.__iter_traces, seq_name, grid, backend, modulus)
+            return VirtualLog(seq_name, grid, generate)
+
+        if workers is not None and workers > 1:
+            parallel = ParallelBackend(self.length, workers)
+            options = dict(kwargs, backend=backend, modulus=modulus)
+            entry = self.export_entry(seq_name)
+            log = parallel.generate_log(type(self), seq_name, grid, options, entry)
+            if intern:
+                return InternedLog(log)
+            return Log(log) if compact else log
+
+        if compact and not intern:
+            return self.__build_log(seq_name, grid, backend, modulus)
+
+        traces = self.__iter_traces(seq_name, grid, backend, modulus)
+        if intern:
+            return InternedLog(traces)
+        return list(traces)
+
+    def __generate_logs(
+        self, seq_name: str, lengths: List[int], **kwargs: Any
+    ) -> Dict[int, PrefixLog]:
+        """
+        Generates a log for the longest of some lengths, and views it for every length.
+        Sequences are prefixes of their longer sequences, except those flagged with `reversed`,
+        which are suffixes (`range_down` counts down to `last`).
+
+        Parameters:
+          seq_name: The name of the sequence generation method for which to generate logs.
+          lengths: The lengths of the logs.
+
+        Takes the same parameters as `SequenceGenerator.generate_log`, and raises the same errors.
+
+        Returns a dictionary with a `generator.PrefixLog.PrefixLog` per length.
+        """
+        self.__check_implemented(seq_name)
+        minimum = len(self.__get_params(seq_name))
+        for length in lengths:
+            if length <= 0:
+                raise InvalidLengthException(length)
+            if length < minimum:
+                raise InvalidLengthException(
+                    length=minimum,
+                    message=f"Cannot generate sequence of length {length}\
+                    if a method needs a minimum of %s parameters",
+                )
+
+        if not lengths:
+            return {}
+
+        longest = max(lengths)
+        generator = self
+        if longest != self.length:
+            generator = type(self)(longest)
+            generator.import_entry(seq_name, *self.export_entry(seq_name))
+        log = generator.generate_log(seq_name, **kwargs)
+
+        reverse = self.config[seq_name].get("reversed", False)
+        return {length: PrefixLog(log, length, reverse) for length in lengths}
+
+    def plan_dtypes(
+        self, seq_name: str, block_size: int = 4096, **kwargs: Any
+    ) -> List[Tuple[int, int, np.dtype]]:
+        """
+        Chooses the narrowest safe integer type per block of traces of a log, without generating the log.
+        The largest term of every trace is predicted from the growth rate of the sequence,
+        the length and the parameters, see `generator.DtypePlanner.DtypePlanner`.
+
+        Parameters:
+          seq_name: The name of the sequence generation method for which to plan a log.
+          block_size: The amount of traces per block.
+
+        Takes the same parameters as `SequenceGenerator.generate_log`, and raises the same errors.
+
+        Returns a list of (start, stop, dtype) tuples, one per block of traces in the order of `self.generate_log`.
+        The dtype is one of int8, int16, int32 and int64, or object when python integers are needed.
+        """
+        self.__check_implemented(seq_name)
+
+        names = self.__get_params(seq_name)
+        required_params = [param + "s" for param in names]
+        self.__check_params(kwargs, required_params)
+        self.__check_length_with_params(seq_name)
 
-        return log
+        grid = ParamGrid(names, [kwargs[param] for param in required_params])
+        return self.__planner().plan(seq_name, grid, block_size)
@@ -0,0 +1,130 @@
+# Typing
+from typing import Callable, Dict, Hashable, Iterator, List, Tuple, Union
+
+# Packages
+from collections import OrderedDict
+from itertools import islice
+
+
+class Trace:
+    """
+    A trace of some sequence generator that can be extended in place,
+    by resuming the (infinite) stream of terms it was computed from in stead of starting over.
+
+    Some sequences are anchored at their end (`range_down` counts down to `last`),
+    such that a longer trace grows at the front. Those are streamed, and stored, back to front.
+
+    Attributes:
+      seq_name -- The name of the sequence generation method.
+      params -- The parameters of the trace.
+      reverse -- Whether the stream yields the terms back to front.
+    """
+
+    cache_size = 128
+    """The maximum amount of traces kept by `Trace.cached`."""
+
+    __cache: "OrderedDict[Tuple[str, Hashable, Tuple], Trace]" = OrderedDict()
+    """The most recently used traces, by sequence name, config entry and parameters."""
+
+    # Class Methods
+    def __init__(
+        self,
+        seq_name: str,
+        params: Dict[str, int],
+        stream: Iterator[int],
+        reverse: bool = False,
+    ) -> None:
+        """
+        Initialises the Trace class.
+
+        Parameters:
+          seq_name -- The name of the sequence generation method.
+          params -- The parameters of the trace.
+          stream -- An infinite iterator over the terms of the sequence.
+          reverse -- Whether `stream` yields the terms back to front, see above.
+        """
+        self.seq_name = seq_name
+        """The name of the sequence generation method."""
+        self.params = params
+        """The parameters of the trace."""
+        self.reverse = reverse
+        """Whether the stream yields the terms back to front."""
+
+        # The stream and the terms taken from it so far
+        self.__stream = stream
+        self.__terms: List[int] = []
+
+    def __repr__(self) -> str:
+        return f"Trace(seq_name={self.seq_name}, params={self.params}, computed={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self.__terms)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.prefix(len(self)))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, Tuple[int, ...]]:
+        if self.reverse:
+            return self.prefix(len(self))[index]
+        if isinstance(index, slice):
+            return tuple(self.__terms[index])
+        return self.__terms[index]
+
+    @classmethod
+    def cached(
+        cls,
+        seq_name: str,
+        params: Dict[str, int],
+        stream: Callable[[], Iterator[int]],
+        reverse: bool = False,
+        entry: Hashable = None,
+    ) -> "Trace":
+        """
+        Gets the (shared) trace for a particular sequence and parameters,
+        evicting the least recently used one when there are more than `Trace.cache_size`.
+
+        Parameters:
+          seq_name -- The name of the sequence generation method.
+          params -- The parameters of the trace.
+          stream -- Creates the infinite iterator over the terms, only called for traces that are not cached.
+          reverse -- Whether the stream yields the terms back to front.
+          entry -- A hashable form of the config entry of the sequence generation method,
+                   such that generators with a different entry under the same name do not share traces.
+
+        Returns a `Trace` instance, possibly with terms computed by earlier calls.
+        """
+        key = (seq_name, entry, tuple(sorted(params.items())))
+        if key in cls.__cache:
+            cls.__cache.move_to_end(key)
+        else:
+            cls.__cache[key] = cls(seq_name, dict(params), stream(), reverse)
+            while len(cls.__cache) > cls.cache_size:
+                cls.__cache.popitem(last=False)
+
+        return cls.__cache[key]
+
+    # Public methods
+    def extend_to(self, length: int) -> None:
+        """
+        Resumes the stream until (at least) the first `length` terms are known.
+
+        Parameters:
+          length -- The amount of terms that should be known.
+        """
+        missing = length - len(self.__terms)
+        if missing > 0:
+            self.__terms.extend(islice(self.__stream, missing))
+
+    def prefix(self, length: int) -> Tuple[int, ...]:
+        """
+        Gets the trace of `length` terms, extending this trace if needed.
+
+        Parameters:
+          length -- The amount of terms of the trace.
+
+        Returns the trace as a tuple, equal to the trace of a `SequenceGenerator` with that length.
+        """
+        self.extend_to(length)
+        if self.reverse:
+            return tuple(self.__terms[length - 1 :: -1]) if length > 0 else ()
+        return tuple(self.__terms[:length])
@@ -0,0 +1,105 @@
+# Typing
+from typing import Callable, Dict, Iterator, List, Tuple, Union, overload
+
+# Own
+from generator.ParamGrid import ParamGrid
+
+
+class VirtualLog:
+    """
+    A log over the cartesian product of parameter lists, of which no trace is computed until it is requested.
+
+    Trace `i` belongs to the `i`-th row of a `generator.ParamGrid.ParamGrid`, which is decoded from `i`,
+    such that a single trace costs the same in a log of 10 traces as in a log of 10^10 traces.
+
+    Attributes:
+      seq_name -- The name of the sequence generation method.
+      grid -- The parameter combinations, in config order.
+      names -- The names of the parameters, in config order.
+      value_lists -- Per parameter, the list of values to use.
+    """
+
+    # Class Methods
+    def __init__(
+        self,
+        seq_name: str,
+        grid: ParamGrid,
+        generate: Callable[[int, int], Iterator[Tuple[int, ...]]],
+    ) -> None:
+        """
+        Initialises the VirtualLog class.
+
+        Parameters:
+          seq_name -- The name of the sequence generation method.
+          grid -- The parameter combinations, in config order.
+          generate -- Generates the traces `start` up to `stop` of the log, given `start` and `stop`.
+        """
+        self.seq_name = seq_name
+        """The name of the sequence generation method."""
+        self.grid = grid
+        """The parameter combinations, in config order."""
+        self.names: List[str] = grid.names
+        """The names of the parameters, in config order."""
+        self.value_lists: List[List[int]] = grid.value_lists
+        """Per parameter, the list of values to use."""
+
+        self.__generate = generate
+        self.__length = len(grid)
+
+    def __repr__(self) -> str:
+        return f"VirtualLog(seq_name={self.seq_name}, traces={len(self)})"
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        return self.__generate(0, len(self))
+
+    @overload
+    def __getitem__(self, index: int) -> Tuple[int, ...]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Tuple[int, ...]]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[int, ...], List[Tuple[int, ...]]]:
+        if isinstance(index, slice):
+            indices = range(len(self))[index]
+            if indices.step == 1:
+                return list(self.__generate(indices.start, indices.stop))
+            return [next(self.__generate(i, i + 1)) for i in indices]
+
+        position = self.__position(index)
+        return next(self.__generate(position, position + 1))
+
+    # Helper methods
+    def __position(self, index: int) -> int:
+        """
+        Checks an index, and resolves negative indices.
+
+        Parameters:
+          index -- The index of a trace, negative indices count from the end.
+
+        Raises an `IndexError` when the index is out of range.
+
+        Returns the (nonnegative) index.
+        """
+        position = index + len(self) if index < 0 else index
+        if not 0 <= position < len(self):
+            raise IndexError(f"VirtualLog index out of range: {index}")
+        return position
+
+    # Public methods
+    def params(self, index: int) -> Dict[str, int]:
+        """
+        Gets the parameters of a trace, as accepted by `SequenceGenerator.generate_trace`.
+
+        Parameters:
+          index -- The index of the trace, negative indices count from the end.
+
+        Raises an `IndexError` when the index is out of range.
+
+        Returns a dictionary with a value per parameter.
+        """
+        return self.grid.params(self.__position(index))
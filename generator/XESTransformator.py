@@ -1,14 +1,22 @@
 # Typing
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 # Python Packages
 from os import access, R_OK
 from os.path import isfile
+from itertools import islice
 from xml.etree import ElementTree as ET
 import gzip
+import zlib
 
 # Own
-from exception import InvalidLogFormat, InvalidElementPassed, ParsingError
+from generator.Log import Log
+from exception import (
+    InvalidLengthException,
+    InvalidLogFormat,
+    InvalidElementPassed,
+    ParsingError,
+)
 
 # TODO: How to get ground truth given event log?
 # Need to figure out how to do this.
@@ -24,6 +32,9 @@ class XESTransformator:
       readable_exts -- All extensions that this transformator can handle.
     """
 
+    name_key = "concept:name"
+    """The key of the attribute that holds the name of an event."""
+
     # Class Methods
     def __init__(self) -> None:
         """
@@ -75,10 +86,6 @@ class XESTransformator:
 
         Returns a dictionary mapping a string (key) to an integer.
         """
-        # Check element tag
-        if "log" not in root.tag:
-            raise InvalidElementPassed(expected="log", element=root.tag)
-
         # Retrieve element by XPath
         dictionary_root_field = root.find(
             ".//*[@key='meta_concept:named_events_total']"
@@ -91,6 +98,17 @@ class XESTransformator:
                 + "present in the log. Does your log adhere to the OpenXES standard?",
             )
 
+        return self.__read_mapping(dictionary_root_field)
+
+    def __read_mapping(self, dictionary_root_field: ET.Element) -> Dict[str, int]:
+        """
+        Reads the mapping from the element that holds all event names.
+
+        Parameters:
+          dictionary_root_field -- The `meta_concept:named_events_total` element of an XES log.
+
+        Returns a dictionary mapping a string (key) to an integer.
+        """
         # Initialise the mapping as empty dictionary
         mapping = dict()
 
@@ -106,33 +124,72 @@ class XESTransformator:
 
         return mapping
 
-    def __get_all_traces(self, root: ET.Element) -> List[ET.Element]:
+    def __namespace(self, root: ET.Element) -> str:
         """
-        Given the root element (should be log), return a list of all trace elements.
+        Resolves the namespace of an XES log from its root element, and checks that the root element is a log.
 
         Parameters:
           root -- The root element (`<log>`) of an XES log file.
 
-        Returns a list of trace elements (`<trace>`).
+        Raises an `InvalidElementPassed` when the root element is not a log.
+
+        Returns the namespace as a tag prefix (`{uri}`), or an empty string for a log without namespace.
         """
-        if "log" not in root.tag:
+        namespace, _, name = root.tag.rpartition("}")
+        if name != "log":
             raise InvalidElementPassed(expected="log", element=root.tag)
 
-        return [elem for elem in root.iter() if "trace" in elem.tag]
+        return namespace + "}" if namespace else ""
 
-    def __get_all_events(self, root: ET.Element) -> List[ET.Element]:
+    def __get_all_traces(
+        self, root: ET.Element, namespace: str
+    ) -> List[List[ET.Element]]:
         """
-        Given the root element (should be trace), return a list of all event elements.
+        Given the root element (should be log), collects the events of every trace in a single pass.
+        Traces are the `<trace>` children of the log, and events the `<event>` children of a trace,
+        matched by their exact tag, such that attributes are never visited.
 
         Parameters:
-          root -- Any trace element (`<trace>`) of an XES log file.
+          root -- The root element (`<log>`) of an XES log file.
+          namespace -- The namespace of the log, see `XESTransformator.__namespace`.
+
+        Returns per trace element (`<trace>`), a list of its event elements (`<event>`).
+        """
+        trace_tag, event_tag = namespace + "trace", namespace + "event"
+        return [
+            self.__get_all_events(trace, event_tag)
+            for trace in root
+            if trace.tag == trace_tag
+        ]
+
+    def __get_all_events(self, trace: ET.Element, event_tag: str) -> List[ET.Element]:
+        """
+        Given a trace element, return a list of all event elements.
+
+        Parameters:
+          trace -- Any trace element (`<trace>`) of an XES log file.
+          event_tag -- The exact tag of an event, including the namespace of the log.
 
         Returns a list of event elements (`<event>`).
         """
-        if "trace" not in root.tag:
-            raise InvalidElementPassed(expected="trace", element=root.tag)
+        return [element for element in trace if element.tag == event_tag]
+
+    def __batch(
+        self, traces: Iterator[Tuple[int, ...]], batch_size: int
+    ) -> Iterator[List[Tuple[int, ...]]]:
+        """
+        Groups traces into lists.
 
-        return [elem for elem in root.iter() if "event" in elem.tag]
+        Parameters:
+          traces -- The traces to group.
+          batch_size -- The amount of traces per list.
+
+        Returns an iterator of lists of `batch_size` traces, the last list may be shorter.
+        """
+        batch = list(islice(traces, batch_size))
+        while batch:
+            yield batch
+            batch = list(islice(traces, batch_size))
 
     # Parsing methods
     def __parse_with_ET(self, file: str, gzipped: bool = False) -> ET.ElementTree:
@@ -154,6 +211,83 @@ class XESTransformator:
             raise ParsingError(
                 filepath=file, reason="Element Tree ParseError was raised."
             )
+        except (EOFError, gzip.BadGzipFile, zlib.error):
+            raise ParsingError(
+                filepath=file, reason="The gzipped log is truncated or corrupt."
+            )
+
+    def __parse_iter(self, file: str) -> Iterator[Tuple[int, ...]]:
+        """
+        Parses a file (that is either .xes or .xes.gz) incrementally with `ElementTree.iterparse`,
+        and converts every trace as soon as its end tag is parsed.
+
+        Elements are removed from the tree once they are handled, such that memory is bounded by the largest trace,
+        not by the log. The mapping is read as soon as its end tag is parsed,
+        and traces that end before it are kept until it is known.
+
+        Parameters:
+          file -- The file to parse.
+
+        Returns an iterator of converted traces, in order.
+        """
+        gzipped = ".gz" in file
+        try:
+            with gzip.open(file, "rb") if gzipped else open(file, "rb") as opened_file:
+                root: Optional[ET.Element] = None
+                mapping: Optional[Dict[str, int]] = None
+                pending: List[ET.Element] = []
+                depth = 0
+                trace_tag = event_tag = ""
+
+                for event, element in ET.iterparse(
+                    opened_file, events=("start", "end")
+                ):
+                    if event == "start":
+                        if root is None:
+                            root = element
+                            namespace = self.__namespace(root)
+                            trace_tag = namespace + "trace"
+                            event_tag = namespace + "event"
+                        depth += 1
+                        continue
+
+                    depth -= 1
+                    if (
+                        mapping is None
+                        and element.get("key") == "meta_concept:named_events_total"
+                    ):
+                        mapping = self.__read_mapping(element)
+                        for trace in pending:
+                            events = self.__get_all_events(trace, event_tag)
+                            yield self.__convert_trace(events, mapping, file)
+                        pending = []
+
+                    # Only children of the log are handled and removed, with all their descendants
+                    if depth != 1:
+                        continue
+                    if element.tag == trace_tag:
+                        if mapping is None:
+                            pending.append(element)
+                        else:
+                            events = self.__get_all_events(element, event_tag)
+                            yield self.__convert_trace(events, mapping, file)
+                    root.remove(element)  # type: ignore[union-attr]
+
+        except ET.ParseError:
+            raise ParsingError(
+                filepath=file, reason="Element Tree ParseError was raised."
+            )
+        except (EOFError, gzip.BadGzipFile, zlib.error):
+            raise ParsingError(
+                filepath=file, reason="The gzipped log is truncated or corrupt."
+            )
+
+        if mapping is None:
+            raise ParsingError(
+                filepath=file,
+                reason="'meta_concept:named_events_total' is not"
+                + "present in the log. Does your log adhere to the OpenXES standard?",
+            )
 
     def __parse(self, file: str) -> ET.Element:
         """
@@ -168,31 +302,44 @@ class XESTransformator:
         return tree.getroot()
 
     # Transforming methods
+    def __event_name(self, event: ET.Element) -> Optional[str]:
+        """
+        Finds the name of an event, which is the value of its `concept:name` attribute.
+        Attributes are the direct children of the event, so those are scanned first, without XPath.
+        Only events without such a child are searched for a nested attribute.
+
+        Parameters:
+          event -- The event element (`<event>`).
+
+        Returns the name of the event, or None if it has no name.
+        """
+        name_key = XESTransformator.name_key
+        for attribute in event:
+            if attribute.get("key") == name_key:
+                return attribute.attrib["value"]
+
+        key_element = event.find(f".//*[@key='{name_key}']")
+        return None if key_element is None else key_element.attrib["value"]
+
     def __convert_trace(
-        self, trace: ET.Element, mapping: Dict[str, int], file: str
+        self, events: List[ET.Element], mapping: Dict[str, int], file: str
     ) -> Tuple[int, ...]:
         """
-        Converts a single trace element into a tuple of integers.
+        Converts a single trace into a tuple of integers.
 
         Parameters:
-          trace -- The trace element (`<trace>`) to convert.
+          events -- The event elements (`<event>`) of the trace to convert, see `XESTransformator.__get_all_events`.
           mapping -- The mapping that defines how to convert.
           file -- Path to file, used for logging.
 
         Returns a tuple of integers representing a trace according to some mapping.
         """
-
-        # Check element tag
-        if "trace" not in trace.tag:
-            raise InvalidElementPassed(expected="trace", element=trace.tag)
-
         converted = []
-        for event in self.__get_all_events(trace):
-            key_element = event.find(".//*[@key='concept:name']")
+        for event in events:
+            key_itself = self.__event_name(event)
 
-            # Explicit not None check -> Ensures that key element is of type Element.
-            if key_element is not None:
-                key_itself = key_element.attrib["value"]
+            # Explicit not None check -> Ensures that the event has a name.
+            if key_itself is not None:
                 converted.append(mapping[key_itself])
             else:
                 # Got None, cannot process this file.
@@ -204,51 +351,89 @@ class XESTransformator:
         return tuple(converted)
 
     def __make_log(
-        self, root: ET.Element, mapping: Dict[str, int], file: str
-    ) -> List[Tuple[int, ...]]:
+        self, root: ET.Element, namespace: str, mapping: Dict[str, int], file: str
+    ) -> Log:
         """
         Makes a log, given a root element and a mapping dictionary.
 
         Parameters:
           root -- the root element (`<log>`) of an XES log.
+          namespace -- the namespace of the log, see `XESTransformator.__namespace`.
           mapping -- a mapping from key (XES concept:name) to integer.
           file -- Path to file, used for logging.
 
-        Returns a transformed log.
+        Returns a transformed log, as a `generator.Log.Log`.
         """
+        # Initialise empty log
+        log = Log()
 
-        # Check element tag
-        if "log" not in root.tag:
-            raise InvalidElementPassed(expected="log", element=root.tag)
-
-        # Initialise empty log list
-        log = []
-
-        # Iterate over all traces
-        for trace in self.__get_all_traces(root):
+        # Iterate over the events of all traces
+        for events in self.__get_all_traces(root, namespace):
             # Convert a single trace and add it to the log
-            converted_trace = self.__convert_trace(trace, mapping, file)
+            converted_trace = self.__convert_trace(events, mapping, file)
             log.append(converted_trace)
 
         return log
 
-    def transform(self, log: str) -> List[Tuple[int, ...]]:
+    def transform(self, log: str, streaming: bool = False) -> Log:
         """
         Transforms a XES log into integer sequences.
 
         Parameters:
           log -- A logfile to transform to integer sequences.
+          streaming -- If true, the log is parsed incrementally, and every trace is converted and discarded
+                       as soon as it is parsed, in stead of parsing the whole log into a tree first.
+                       Peak memory is then proportional to the largest trace, not to the log.
 
-        Returnsa transformed log.
+        Returns a transformed log as a `generator.Log.Log`, which stores all traces in one flat integer buffer,
+        and compares equal to the list of tuples of the traces.
         """
         # Check the log
         self.__check_log(log)
 
+        if streaming:
+            return Log(self.__parse_iter(log))
+
         # Parse the log if possible
         root = self.__parse(log)
 
+        # Resolve the namespace, which checks that the root is a log
+        namespace = self.__namespace(root)
+
         # Build the name mapping
         name_mapping = self.__build_mapping(root, log)
 
         # Build the log
-        return self.__make_log(root, name_mapping, log)
+        return self.__make_log(root, namespace, name_mapping, log)
+
+    def transform_iter(
+        self, log: str, batch_size: Optional[int] = None
+    ) -> Union[Iterator[Tuple[int, ...]], Iterator[List[Tuple[int, ...]]]]:
+        """
+        Transforms a XES log into integer sequences, yielding every trace as soon as it is parsed.
+        The log is parsed incrementally, as in `XESTransformator.transform` with `streaming`,
+        so the first traces are available before the log is read, and `itertools.islice` previews a huge log.
+
+        Parameters:
+          log -- A logfile to transform to integer sequences.
+          batch_size -- If given, yields lists of this many traces (the last list may be shorter),
+                        in stead of single traces.
+
+        Raises the same errors as `XESTransformator.transform`. Errors on the file itself and on `batch_size`
+        are raised by this call, errors on its contents when the traces are consumed.
+        Raises an `InvalidLengthException` when `batch_size` is not positive.
+
+        Returns an iterator of traces (tuples of integers), or of lists of traces if `batch_size` is given.
+        """
+        if batch_size is not None and batch_size <= 0:
+            raise InvalidLengthException(
+                length=batch_size, message="Cannot yield traces in batches of %s"
+            )
+
+        # Check the log before parsing starts
+        self.__check_log(log)
+
+        traces = self.__parse_iter(log)
+        if batch_size is None:
+            return traces
+        return self.__batch(traces, batch_size)
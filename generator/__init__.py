@@ -1,12 +1,60 @@
 from generator.XESTransformator import XESTransformator
 from generator.SequenceGenerator import SequenceGenerator
+from generator.Recaman import Recaman
+from generator.NumpyBackend import NumpyBackend
+from generator.DtypePlanner import DtypePlanner
+from generator.ModularBackend import ModularBackend
+from generator.LinearRecurrence import LinearRecurrence
+from generator.Trace import Trace
+from generator.VirtualLog import VirtualLog
+from generator.ParallelBackend import ParallelBackend
+from generator.GenerationPlan import GenerationPlan
+from generator.ParamGrid import ParamGrid
+from generator.InternedLog import InternedLog
+from generator.PrefixLog import PrefixLog
+from generator.Log import Log
+from generator.PackedInts import PackedInts
 from inspect import getmembers
 
-__all__ = ["SequenceGenerator", "XESTransformator"]
+__all__ = [
+    "SequenceGenerator",
+    "XESTransformator",
+    "Recaman",
+    "NumpyBackend",
+    "DtypePlanner",
+    "ModularBackend",
+    "LinearRecurrence",
+    "Trace",
+    "VirtualLog",
+    "ParallelBackend",
+    "GenerationPlan",
+    "ParamGrid",
+    "InternedLog",
+    "PrefixLog",
+    "Log",
+    "PackedInts",
+]
 
 # Override pdoc to also document private methods, but not __class__ methods.
 __pdoc__ = {}
-for cls in (XESTransformator, SequenceGenerator):
+for cls in (
+    XESTransformator,
+    SequenceGenerator,
+    Recaman,
+    NumpyBackend,
+    DtypePlanner,
+    ModularBackend,
+    LinearRecurrence,
+    Trace,
+    VirtualLog,
+    ParallelBackend,
+    GenerationPlan,
+    ParamGrid,
+    InternedLog,
+    PrefixLog,
+    Log,
+    PackedInts,
+):
     for name, value in getmembers(cls):
         if name.startswith("_") and not name.endswith("_"):
             __pdoc__[cls.__name__ + "." + name] = True
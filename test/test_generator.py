@@ -1,18 +1,34 @@
 # -*- coding: utf-8 -*-
 import sys
 import os
+import itertools
+import tracemalloc
+import numpy as np
 import pytest
 
 # Make pytest find our tests and modules
 sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
 
 # Own
-from helper import assert_equal
-from generator import SequenceGenerator
+from helper import assert_equal, TESTPATH
+from generator import (
+    SequenceGenerator,
+    Recaman,
+    LinearRecurrence,
+    ParamGrid,
+    Trace,
+    InternedLog,
+    Log,
+    PackedInts,
+    ParallelBackend,
+)
 from exception import (
+    InvalidIndexException,
     InvalidLengthException,
+    InvalidModulusException,
     NotYetImplemented,
     MissingRequiredParameter,
+    WorkerNotInitialised,
 )
 from sequences import (
     FIB,
@@ -26,6 +42,7 @@ from sequences import (
     SHORTTERM_SINGLE,
 )
 
+
 # Incorrect initialisation
 def negative_length_should_raise_test() -> None:
     """
@@ -210,6 +227,41 @@ def catalan_trace(generator: SequenceGenerator) -> None:
     assert_equal(expected, result)
 
 
+def catalan_parametrised_trace(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_trace()` for the `catalan` sequence generator with a non-default `first`.
+    Test case is the dynamic programming table C(n) = sum_j C(j) * C(n - j - 1), with C(0) = C(1) = first.
+    """
+    for first in [0, 2, 3, -4]:
+        expected = [first, first]
+        for i in range(2, generator.length):
+            expected.append(sum(expected[j] * expected[i - j - 1] for j in range(i)))
+
+        result = list(generator.generate_trace("catalan", first=first))
+        assert_equal(expected[0 : generator.length], result)
+
+
+def recaman_parametrised_trace(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_trace()` for the `recaman` sequence generator with a non-default `first`.
+    Test case is the definition a(n) = a(n - 1) - n if nonnegative and not seen before, else a(n - 1) + n.
+    """
+    for first in [1, 7, -5]:
+        expected = []
+        already_seen = set()
+        current = first
+        for index in range(generator.length):
+            new = current - index
+            if new < 0 or new in already_seen:
+                new = current + index
+            already_seen.add(new)
+            expected.append(new)
+            current = new
+
+        result = list(generator.generate_trace("recaman", first=first))
+        assert_equal(expected, result)
+
+
 def range_up_trace(generator: SequenceGenerator) -> None:
     """
     A call to `SequenceGenerator.generate_trace()` with known sequence key `seq_name` parameter,
@@ -697,6 +749,317 @@ def short_single_log_multiple_items(generator: SequenceGenerator) -> None:
     assert_equal(expected=expected_traces_in_set, result=resulting_traces_in_set)
 
 
+def linear_log_matches_traces(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_log()` for a linear sequence generator combines basis traces
+    in stead of generating every trace. Tests that the result is identical to generating every trace, in the same order.
+    """
+    fib_lists = {"firsts": [0, 1, -2, 7], "seconds": [3, 0, 1]}
+    expected = [
+        tuple(generator.generate_trace("fib", first=first, second=second))
+        for first in fib_lists["firsts"]
+        for second in fib_lists["seconds"]
+    ]
+    assert_equal(expected, generator.generate_log("fib", **fib_lists))
+
+    long_lists = {
+        "firsts": [1, 0],
+        "seconds": [2, 5],
+        "thirds": [-3],
+        "fourths": [0, 4],
+        "fifths": [5, 1],
+    }
+    expected = [
+        tuple(
+            generator.generate_trace(
+                "long_term_dependency",
+                first=first,
+                second=second,
+                third=third,
+                fourth=fourth,
+                fifth=fifth,
+            )
+        )
+        for first in long_lists["firsts"]
+        for second in long_lists["seconds"]
+        for third in long_lists["thirds"]
+        for fourth in long_lists["fourths"]
+        for fifth in long_lists["fifths"]
+    ]
+    assert_equal(expected, generator.generate_log("long_term_dependency", **long_lists))
+
+
+def numpy_backend_log(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_log()` with the numpy backend should produce the same log as the python backend,
+    including rows that do not fit in 64 bit integers, and sequences that the numpy backend does not support.
+    """
+    cases = [
+        ("range_up", {"firsts": [1, -3, 2 ** 70], "steps": [0, 5, -2, 2 ** 61]}),
+        ("range_down", {"lasts": [1, -3, 2 ** 70], "steps": [0, 5, -2, 2 ** 61]}),
+        (
+            "short_term_single_dependency",
+            {"firsts": [0, 1, -3], "constants": [0, 1, -7, 100, 2 ** 70]},
+        ),
+        (
+            "long_term_single_dependency",
+            {
+                "firsts": [0, -3],
+                "seconds": [2],
+                "thirds": [5, 0],
+                "fourths": [-1],
+                "fifths": [3],
+                "constants": [0, 1, -2, 100],
+            },
+        ),
+        ("pascal", {"firsts": [1, 2]}),
+    ]
+    for seq_name, lists in cases:
+        expected = generator.generate_log(seq_name, **lists)
+        result = generator.generate_log(seq_name, backend="numpy", **lists)
+        assert_equal(expected, result)
+        assert_equal(True, all(type(item) is int for trace in result for item in trace))
+
+    with pytest.raises(NotYetImplemented):
+        generator.generate_log("range_up", backend="fortran", firsts=[1], steps=[1])
+
+
+def planned_dtypes_fit(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.plan_dtypes()` should choose, per block, an integer type that holds every term of the block.
+    """
+    cases = [
+        ("fib", {"firsts": [0, 1, -5], "seconds": [1, 100]}),
+        ("pascal", {"firsts": [1, -3, 100]}),
+        ("recaman", {"firsts": [0, 7]}),
+        ("catalan", {"firsts": [1, -2, 0]}),
+        ("range_up", {"firsts": [1, 100], "steps": [0, 1, -127]}),
+        ("range_down", {"lasts": [1, -100], "steps": [0, 1, 127]}),
+        (
+            "long_term_dependency",
+            {
+                "firsts": [1, -9],
+                "seconds": [2],
+                "thirds": [0],
+                "fourths": [4],
+                "fifths": [5],
+            },
+        ),
+        (
+            "long_term_single_dependency",
+            {
+                "firsts": [1],
+                "seconds": [-2],
+                "thirds": [3],
+                "fourths": [4],
+                "fifths": [5],
+                "constants": [0, 1, -3],
+            },
+        ),
+        ("short_term_single_dependency", {"firsts": [1, -4], "constants": [1, 2, 7]}),
+    ]
+    for seq_name, lists in cases:
+        log = generator.generate_log(seq_name, **lists)
+        plan = generator.plan_dtypes(seq_name, block_size=2, **lists)
+
+        assert_equal(len(log), plan[-1][1])
+        for start, stop, dtype in plan:
+            if dtype != object:
+                largest = max(abs(term) for trace in log[start:stop] for term in trace)
+                assert_equal(True, largest <= np.iinfo(dtype).max)
+
+
+def planned_dtypes_narrow(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.plan_dtypes()` should choose narrow types for slowly growing sequences,
+    and python integers for quickly growing sequences.
+    """
+    assert_equal(
+        [(0, 2, np.dtype(np.int8)), (2, 3, np.dtype(np.int16))],
+        generator.plan_dtypes("range_up", block_size=2, firsts=[1, 2, 1000], steps=[1]),
+    )
+    assert_equal(
+        [(0, 1, np.dtype(object))],
+        SequenceGenerator(wanted_length=100).plan_dtypes(
+            "fib", firsts=[1], seconds=[1]
+        ),
+    )
+
+
+def iterated_log(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.iter_log()` should yield the traces of `SequenceGenerator.generate_log()`, in order,
+    together with the parameters of `SequenceGenerator.generate_trace()` that generate them.
+    """
+    cases = [
+        ("fib", {"firsts": [0, 1, 2], "seconds": [1, -3]}),
+        ("recaman", {"firsts": [0, 4]}),
+        ("range_up", {"firsts": [1, -3], "steps": [0, 5]}),
+        ("short_term_single_dependency", {"firsts": [1, -3], "constants": [2, 100]}),
+    ]
+    for seq_name, lists in cases:
+        for options in [
+            {},
+            {"backend": "numpy"},
+            {"modulus": 97},
+            {"sample": 2, "seed": 1},
+            {"sample": 2, "seed": 4, "stratified": True},
+        ]:
+            items = list(generator.iter_log(seq_name, **options, **lists))
+            assert_equal(
+                generator.generate_log(seq_name, **options, **lists),
+                [trace for _, trace in items],
+            )
+
+        for params, trace in generator.iter_log(seq_name, **lists):
+            assert_equal(tuple(generator.generate_trace(seq_name, **params)), trace)
+
+
+def iterated_log_is_lazy(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.iter_log()` should not build the cartesian product,
+    and should raise errors before the first trace is requested.
+    """
+    values = list(range(100))
+    lists = {
+        "firsts": values,
+        "seconds": values,
+        "thirds": values,
+        "fourths": values,
+        "fifths": values,
+    }
+    for backend in ["python", "numpy"]:
+        log = generator.iter_log("long_term_dependency", backend=backend, **lists)
+        params, trace = next(log)
+        assert_equal(
+            {"first": 0, "second": 0, "third": 0, "fourth": 0, "fifth": 0}, params
+        )
+        params, trace = next(log)
+        assert_equal(1, params["fifth"])
+        assert_equal((0, 0, 0, 0, 1), trace[:5])
+
+    with pytest.raises(MissingRequiredParameter):
+        generator.iter_log("fib", firsts=[1])
+
+    with pytest.raises(NotYetImplemented):
+        generator.iter_log("fib", backend="fortran", firsts=[1], seconds=[1])
+
+
+def lazy_log(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_log()` with `lazy=True` should give a log
+    that is indexed and sliced like the list that `SequenceGenerator.generate_log()` returns.
+    """
+    cases = [
+        ("fib", {"firsts": [0, 1, 2], "seconds": [1, -3]}),
+        ("catalan", {"firsts": [1, 2, 3]}),
+        ("range_down", {"lasts": [1, -3], "steps": [0, 5, 2]}),
+        (
+            "long_term_single_dependency",
+            {
+                **{key: [1, 2] for key in ["firsts", "seconds", "thirds"]},
+                "fourths": [0],
+                "fifths": [3],
+                "constants": [2, -1],
+            },
+        ),
+    ]
+    for seq_name, lists in cases:
+        for options in [{}, {"backend": "numpy"}, {"modulus": 97}]:
+            expected = generator.generate_log(seq_name, **options, **lists)
+            log = generator.generate_log(seq_name, lazy=True, **options, **lists)
+
+            assert_equal(len(expected), len(log))
+            assert_equal(expected, list(log))
+            assert_equal(expected, [log[i] for i in range(len(log))])
+            assert_equal(expected[-1], log[-1])
+            for index in [
+                slice(1, 4),
+                slice(None, None, 2),
+                slice(-3, None),
+                slice(5, 1, -1),
+            ]:
+                assert_equal(expected[index], log[index])
+
+            # Every contiguous shard, as generated by a worker process
+            for start in range(len(log) + 1):
+                assert_equal(expected[start:], log[start:])
+                assert_equal(expected[start : start + 2], log[start : start + 2])
+
+        log = generator.generate_log(seq_name, lazy=True, **lists)
+        for index in range(len(log)):
+            assert_equal(
+                tuple(generator.generate_trace(seq_name, **log.params(index))),
+                log[index],
+            )
+        with pytest.raises(IndexError):
+            log[len(log)]
+
+
+def lazy_log_is_lazy(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_log()` with `lazy=True` should not build the cartesian product.
+    """
+    values = list(range(100))
+    lists = {
+        "firsts": values,
+        "seconds": values,
+        "thirds": values,
+        "fourths": values,
+        "fifths": values,
+    }
+    log = generator.generate_log("long_term_dependency", lazy=True, **lists)
+    assert_equal(100 ** 5, len(log))
+
+    index = 1234567890
+    params = log.params(index)
+    assert_equal(
+        {"first": 12, "second": 34, "third": 56, "fourth": 78, "fifth": 90}, params
+    )
+    assert_equal(
+        tuple(generator.generate_trace("long_term_dependency", **params)), log[index]
+    )
+    assert_equal([log[index], log[index + 1]], log[index : index + 2])
+
+
+def parallel_log(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_log()` with `workers` should give the same log as the serial call.
+    """
+    cases = [
+        ("fib", {"firsts": [0, 1, 2], "seconds": [1, -3]}),
+        ("catalan", {"firsts": [1, 2, 3, 4, 5]}),
+        ("range_down", {"lasts": [1, -3], "steps": [0, 5, 2]}),
+        ("recaman", {"firsts": [0, 1]}),
+    ]
+    for seq_name, lists in cases:
+        for options in [{}, {"backend": "numpy"}, {"modulus": 97}]:
+            expected = generator.generate_log(seq_name, **options, **lists)
+            for workers in [1, 2, 3]:
+                assert_equal(
+                    expected,
+                    generator.generate_log(
+                        seq_name, workers=workers, **options, **lists
+                    ),
+                )
+
+    # Workers use the config entry of the instance, also when it overrides a default entry
+    overridden = SequenceGenerator(wanted_length=5)
+    overridden.generate_log("fib", firsts=[1], seconds=[1])
+    overridden.config["fib"]["recurrence"] = {
+        "coefficients": (2, 1),
+        "seeds": ["first", "second"],
+    }
+    lists = {"firsts": [1], "seconds": [1, 2]}
+    expected = [(1, 1, 3, 7, 17), (1, 2, 5, 12, 29)]
+    assert_equal(expected, overridden.generate_log("fib", **lists))
+    assert_equal(expected, overridden.generate_log("fib", workers=2, **lists))
+
+    # Shards are only generated in worker processes
+    with pytest.raises(WorkerNotInitialised):
+        ParallelBackend.generate_shard((0, 1))
+
+
 # Test initialisation exceptions
 def test_exceptions() -> None:
     """
@@ -736,7 +1099,9 @@ def test_generate_trace() -> None:
         fib_trace(generator=generator)
         pascal_trace(generator=generator)
         recaman_trace(generator=generator)
+        recaman_parametrised_trace(generator=generator)
         catalan_trace(generator=generator)
+        catalan_parametrised_trace(generator=generator)
         range_up_trace(generator=generator)
         range_down_trace(generator=generator)
         long_dependency_trace(generator=generator)
@@ -765,6 +1130,13 @@ def test_generate_log() -> None:
     long_single_log_missing_param(generator=generator)
     short_single_log_missing_param(generator=generator)
 
+    # Dtype planning
+    planned_dtypes_narrow(generator=generator)
+
+    # Streaming
+    iterated_log_is_lazy(generator=generator)
+    lazy_log_is_lazy(generator=generator)
+
     # Fib wants 1+ param
     generator = SequenceGenerator(wanted_length=1)
     fib_log_multiple_items_error(generator=generator)
@@ -798,3 +1170,1028 @@ def test_generate_log() -> None:
         long_dependency_log_multiple_items(generator=generator)
         long_single_log_multiple_items(generator=generator)
         short_single_log_multiple_items(generator=generator)
+        linear_log_matches_traces(generator=generator)
+        numpy_backend_log(generator=generator)
+        planned_dtypes_fit(generator=generator)
+        iterated_log(generator=generator)
+        lazy_log(generator=generator)
+        parallel_log(generator=generator)
+
+
+# nth_term calls
+def fib_nth_term(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.nth_term()` for the `fib` sequence generator
+    should agree with every term of the corresponding trace.
+    """
+    for first, second in [(1, 1), (0, 1), (2, 7), (-3, 5)]:
+        trace = list(generator.generate_trace("fib", first=first, second=second))
+        for n, expected in enumerate(trace):
+            result = generator.nth_term("fib", n, first=first, second=second)
+            assert_equal(expected, result)
+
+
+def fib_nth_term_far(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.nth_term()` for the `fib` sequence generator
+    should not depend on `generator.length`, and should satisfy the recurrence for large indices.
+    """
+    assert_equal(FIB[-1], generator.nth_term("fib", len(FIB) - 1, first=1, second=1))
+
+    n = 10 ** 4
+    terms = [generator.nth_term("fib", n + i, first=3, second=4) for i in range(3)]
+    assert_equal(terms[2], terms[0] + terms[1])
+
+
+def pascal_nth_term(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.nth_term()` for the `pascal` sequence generator
+    should agree with every term of the corresponding (scaled) trace.
+    """
+    for first in [1, 3, -2]:
+        trace = list(generator.generate_trace("pascal", first=first))
+        assert_equal([first * item for item in PASCAL[0 : generator.length]], trace)
+        for n, expected in enumerate(trace):
+            assert_equal(expected, generator.nth_term("pascal", n, first=first))
+
+
+def pascal_nth_term_far(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.nth_term()` for the `pascal` sequence generator
+    should find the correct position in the triangle for large indices.
+    Row r starts at index r (r + 1) / 2 with a 1, and its second element is r.
+    """
+    row = 10 ** 4
+    start = row * (row + 1) // 2
+    assert_equal(5, generator.nth_term("pascal", start - 1, first=5))
+    assert_equal(5, generator.nth_term("pascal", start, first=5))
+    assert_equal(5 * row, generator.nth_term("pascal", start + 1, first=5))
+
+
+def recurrence_nth_term(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.nth_term()` for the other linear recurrences
+    should agree with every term of the corresponding trace.
+    """
+    seeds = {"first": 1, "second": -2, "third": 0, "fourth": 3, "fifth": 5}
+    cases = [
+        ("long_term_dependency", seeds),
+        ("long_term_single_dependency", {**seeds, "constant": -3}),
+        ("short_term_single_dependency", {"first": 7, "constant": 2}),
+    ]
+    for seq_name, params in cases:
+        trace = list(generator.generate_trace(seq_name, **params))
+        for n, expected in enumerate(trace):
+            assert_equal(expected, generator.nth_term(seq_name, n, **params))
+
+
+def recurrence_nth_term_far(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.nth_term()` for the other linear recurrences
+    should satisfy the recurrence for large indices.
+    """
+    params = {"first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5}
+    n = 10 ** 4
+    terms = [
+        generator.nth_term("long_term_dependency", n + i, **params) for i in range(6)
+    ]
+    assert_equal(terms[5], terms[4] + terms[0])
+
+    assert_equal(
+        3 * 2 ** n,
+        generator.nth_term("short_term_single_dependency", n, first=3, constant=2),
+    )
+    assert_equal(
+        4 * (-1) ** (n // 5),
+        generator.nth_term("long_term_single_dependency", n + 3, **params, constant=-1),
+    )
+
+
+def nth_term_errors(generator: SequenceGenerator) -> None:
+    """
+    Calls to `SequenceGenerator.nth_term()` should raise the same errors as `SequenceGenerator.generate_trace()`,
+    and an `InvalidIndexException` for negative indices.
+    """
+    with pytest.raises(NotYetImplemented):
+        generator.nth_term("i_dont_exist", 5, i_do_not_matter=True)
+
+    with pytest.raises(MissingRequiredParameter):
+        generator.nth_term("fib", 5, first=1)
+
+    with pytest.raises(InvalidIndexException):
+        generator.nth_term("fib", -1, first=1, second=1)
+
+
+# Extendable traces
+def extended_traces(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.trace()` should give the same trace as `SequenceGenerator.generate_trace()`,
+    also after extending it, and also for sequences that count down to their last element.
+    """
+    cases = [
+        ("fib", {"first": 2, "second": -1}),
+        ("pascal", {"first": 3}),
+        ("recaman", {"first": 4}),
+        ("catalan", {"first": 2}),
+        ("range_up", {"first": -3, "step": 4}),
+        ("range_down", {"last": 5, "step": 3}),
+        (
+            "long_term_dependency",
+            {"first": 1, "second": 0, "third": 2, "fourth": 0, "fifth": 3},
+        ),
+        (
+            "long_term_single_dependency",
+            {
+                "first": 1,
+                "second": 0,
+                "third": 2,
+                "fourth": 0,
+                "fifth": 3,
+                "constant": -2,
+            },
+        ),
+        ("short_term_single_dependency", {"first": 3, "constant": 5}),
+    ]
+    for seq_name, params in cases:
+        trace = generator.trace(seq_name, **params)
+        assert_equal(
+            tuple(generator.generate_trace(seq_name, **params)),
+            trace.prefix(generator.length),
+        )
+
+        longer = SequenceGenerator(wanted_length=generator.length + 7)
+        trace.extend_to(longer.length)
+        assert_equal(
+            tuple(longer.generate_trace(seq_name, **params)),
+            trace.prefix(longer.length),
+        )
+        assert_equal(tuple(longer.generate_trace(seq_name, **params)), tuple(trace))
+
+
+def trace_errors(generator: SequenceGenerator) -> None:
+    """
+    Calls to `SequenceGenerator.trace()` should raise the same errors as `SequenceGenerator.generate_trace()`.
+    """
+    with pytest.raises(NotYetImplemented):
+        generator.trace("i_dont_exist", i_do_not_matter=True)
+
+    with pytest.raises(MissingRequiredParameter):
+        generator.trace("fib", first=1)
+
+
+# Test Trace
+def test_trace() -> None:
+    """
+    Tests `SequenceGenerator.trace`, and that traces are shared and resumed between generators.
+    See individual methods.
+    """
+    generator = SequenceGenerator()
+    trace_errors(generator=generator)
+
+    generators = [SequenceGenerator(wanted_length=length) for length in [1, 5, 10, 50]]
+    for generator in generators:
+        extended_traces(generator=generator)
+
+    # A longer generator resumes the trace of a shorter one
+    short = SequenceGenerator(wanted_length=10).trace("catalan", first=5)
+    long = SequenceGenerator(wanted_length=100).trace("catalan", first=5)
+    assert_equal(True, short is long)
+    assert_equal(100, len(long))
+    assert_equal(long.prefix(10), short[0:10])
+
+    # The cache is bounded
+    for first in range(Trace.cache_size + 1):
+        SequenceGenerator(wanted_length=3).trace("range_up", first=first, step=1)
+    assert_equal(
+        False, short is SequenceGenerator(wanted_length=10).trace("catalan", first=5)
+    )
+
+    # Generators with a different config entry under the same name do not share traces
+    powers = []
+    for constant in [2, 3]:
+        generator = SequenceGenerator(wanted_length=5)
+        generator.config["powers"] = {
+            "parameters": ["first"],
+            "recurrence": {"coefficients": (constant,), "seeds": ["first"]},
+        }
+        powers.append(generator.trace("powers", first=1))
+        assert_equal(
+            tuple(generator.generate_trace("powers", first=1)), powers[-1].prefix(5)
+        )
+    assert_equal(False, powers[0] is powers[1])
+
+
+# Test Recaman
+def test_recaman() -> None:
+    """
+    Tests that `Recaman` extends previously computed prefixes in stead of recomputing them,
+    and that the extended sequence is identical to the one computed in one go.
+    """
+    extended = Recaman(first=3)
+    extended.extend_to(5)
+    assert_equal(5, len(extended))
+    extended.extend_to(2)
+    assert_equal(5, len(extended))
+    extended.extend_to(1000)
+
+    direct = Recaman(first=3)
+    assert_equal(list(direct.prefix(1000)), list(extended.prefix(1000)))
+
+    # Cached instances are shared
+    assert_equal(True, Recaman.cached(3) is Recaman.cached(3))
+    assert_equal(RECAMAN, list(Recaman.cached(0).prefix(len(RECAMAN))))
+
+    # Large first elements only track the values that are reachable, in a window or a set
+    for first, length in [(10 ** 9, 10), (10 ** 9, 1000), (10 ** 6, 5000)]:
+        expected = []
+        already_seen = set()
+        current = first
+        for index in range(length):
+            new = current - index
+            if new < 0 or new in already_seen:
+                new = current + index
+            already_seen.add(new)
+            expected.append(new)
+            current = new
+
+        tracemalloc.start()
+        result = list(Recaman(first=first).prefix(length))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert_equal(expected, result)
+        assert_equal(True, peak < 2 ** 22)
+
+
+# Test LinearRecurrence
+def test_linear_recurrence() -> None:
+    """
+    Tests that every way of evaluating a `LinearRecurrence` (in order, streaming, jumping ahead and batched)
+    agrees, and that new recurrences only need a config entry.
+    """
+    tribonacci = LinearRecurrence((1, 1, 1))
+    seeds = [0, 0, 1]
+    terms = tribonacci.terms(seeds, 40)
+    assert_equal([0, 0, 1, 1, 2, 4, 7, 13, 24, 44], terms[:10])
+    assert_equal(terms, list(itertools.islice(tribonacci.stream(seeds), 40)))
+    assert_equal(terms, [tribonacci.nth_term(seeds, n) for n in range(40)])
+    assert_equal(tuple(terms[30:33]), tribonacci.jump(seeds, 30))
+    assert_equal(
+        [tuple(terms), tuple(2 * term for term in terms)],
+        tribonacci.batch_terms([seeds, [0, 0, 2]], 40),
+    )
+    assert_equal(
+        [terms[39], 2 * terms[39]], tribonacci.batch_nth_term([seeds, [0, 0, 2]], 39)
+    )
+
+    with pytest.raises(InvalidLengthException):
+        tribonacci.terms([1, 1], 10)
+
+    # A recurrence without a method of its own
+    generator = SequenceGenerator(wanted_length=40)
+    generator.config["tribonacci"] = {
+        "parameters": ["first", "second", "third"],
+        "recurrence": {
+            "coefficients": (1, 1, 1),
+            "seeds": ["first", "second", "third"],
+        },
+    }
+    assert_equal(
+        terms, list(generator.generate_trace("tribonacci", first=0, second=0, third=1))
+    )
+    assert_equal(
+        terms[-1], generator.nth_term("tribonacci", 39, first=0, second=0, third=1)
+    )
+
+    # Every backend reads the recurrence from the config entry
+    lists = {"firsts": [0, 1, -4], "seconds": [0, 2], "thirds": [1, 2 ** 70]}
+    expected = generator.generate_log("tribonacci", **lists)
+    assert_equal(terms, list(expected[0]))
+    for options in [
+        {"backend": "numpy"},
+        {"workers": 2},
+        {"compact": True},
+        {"intern": True},
+        {"lazy": True},
+    ]:
+        assert_equal(
+            expected, list(generator.generate_log("tribonacci", **options, **lists))
+        )
+
+    for modulus in [7, 2 ** 40, 2 ** 70]:
+        reduced = [tuple(term % modulus for term in trace) for trace in expected]
+        assert_equal(
+            reduced, generator.generate_log("tribonacci", modulus=modulus, **lists)
+        )
+        assert_equal(
+            list(reduced[0]),
+            list(
+                generator.generate_trace(
+                    "tribonacci", modulus=modulus, first=0, second=0, third=1
+                )
+            ),
+        )
+
+    for start, stop, dtype in generator.plan_dtypes(
+        "tribonacci", block_size=2, **lists
+    ):
+        if dtype != object:
+            largest = max(abs(term) for trace in expected[start:stop] for term in trace)
+            assert_equal(True, largest <= np.iinfo(dtype).max)
+    assert_equal(
+        [(0, 1, np.dtype(np.int64))],
+        generator.plan_dtypes("tribonacci", firsts=[0], seconds=[0], thirds=[1]),
+    )
+
+    # Recurrences with parameters as coefficients are not bounded, so they are planned with python integers
+    generator.config["scaled"] = {
+        "parameters": ["first", "constant"],
+        "recurrence": {"coefficients": ("constant", 1), "seeds": ["first", "constant"]},
+    }
+    lists = {"firsts": [1, -2], "constants": [0, 3]}
+    expected = generator.generate_log("scaled", **lists)
+    assert_equal(expected, generator.generate_log("scaled", backend="numpy", **lists))
+    assert_equal(
+        [tuple(term % 11 for term in trace) for trace in expected],
+        generator.generate_log("scaled", modulus=11, **lists),
+    )
+    assert_equal([(0, 4, np.dtype(object))], generator.plan_dtypes("scaled", **lists))
+
+
+# Test nth_term
+def test_nth_term() -> None:
+    """
+    Tests `SequenceGenerator.nth_term` for various inputs.
+    See individual methods.
+    """
+    generator = SequenceGenerator()
+    nth_term_errors(generator=generator)
+    fib_nth_term_far(generator=generator)
+    pascal_nth_term_far(generator=generator)
+    recurrence_nth_term_far(generator=generator)
+
+    generators = [SequenceGenerator(wanted_length=length) for length in [1, 5, 100]]
+    for generator in generators:
+        fib_nth_term(generator=generator)
+        pascal_nth_term(generator=generator)
+        recurrence_nth_term(generator=generator)
+
+
+# Modular arithmetic
+def modular_log(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_log()` with a modulus should reduce every term of the exact log,
+    for every sequence generator, for small moduli, moduli close to the 64 bit limit and huge moduli.
+    """
+    lists = {
+        "fib": {"firsts": [1, -4], "seconds": [1, 9]},
+        "pascal": {"firsts": [1, -3]},
+        "recaman": {"firsts": [0, 5]},
+        "catalan": {"firsts": [1, 2, -3]},
+        "range_up": {"firsts": [1, -3], "steps": [0, 5, 2 ** 61]},
+        "range_down": {"lasts": [1, -3], "steps": [0, 5, 2 ** 61]},
+        "long_term_dependency": {
+            "firsts": [0, 1],
+            "seconds": [1],
+            "thirds": [-2],
+            "fourths": [3],
+            "fifths": [4],
+        },
+        "long_term_single_dependency": {
+            "firsts": [0, 1],
+            "seconds": [1],
+            "thirds": [-2],
+            "fourths": [3],
+            "fifths": [4],
+            "constants": [-1, 100],
+        },
+        "short_term_single_dependency": {"firsts": [1, -3], "constants": [2, 100]},
+    }
+    for modulus in [1, 7, 1000003, 3037000499, 2 ** 64 + 13]:
+        for seq_name, params in lists.items():
+            expected = [
+                tuple(term % modulus for term in trace)
+                for trace in generator.generate_log(seq_name, **params)
+            ]
+            result = generator.generate_log(seq_name, modulus=modulus, **params)
+            assert_equal(expected, result)
+            assert_equal(
+                True, all(type(item) is int for trace in result for item in trace)
+            )
+
+
+def modular_trace(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_trace()` with a modulus should reduce every term of the exact trace.
+    """
+    assert_equal(
+        [term % 1000 for term in CATALAN[: generator.length]],
+        list(generator.generate_trace("catalan", modulus=1000, first=1)),
+    )
+    assert_equal(
+        [term % 97 for term in PASCAL[: generator.length]],
+        list(generator.generate_trace("pascal", modulus=97, first=1)),
+    )
+    assert_equal(
+        [term % 10 for term in FIB[: generator.length]],
+        list(generator.generate_trace("fib", modulus=10, first=1, second=1)),
+    )
+
+
+def modulus_errors(generator: SequenceGenerator) -> None:
+    """
+    Calls with a modulus should raise an `InvalidModulusException` for non-positive or boolean moduli,
+    and the usual exceptions for missing parameters.
+    Numpy integers are valid moduli, and give the same result as python integers.
+    """
+    for modulus in [0, -7, True, 7.0]:
+        with pytest.raises(InvalidModulusException):
+            generator.generate_trace("fib", modulus=modulus, first=1, second=1)
+        with pytest.raises(InvalidModulusException):
+            generator.generate_log("fib", modulus=modulus, firsts=[1], seconds=[1])
+
+    with pytest.raises(MissingRequiredParameter):
+        generator.generate_trace("fib", modulus=10, first=1)
+
+    expected = generator.generate_log("fib", modulus=7, firsts=[1, 2], seconds=[1, 3])
+    result = generator.generate_log(
+        "fib", modulus=np.int64(7), firsts=[1, 2], seconds=[1, 3]
+    )
+    assert_equal(expected, result)
+    assert list(
+        generator.generate_trace("fib", modulus=np.int64(7), first=1, second=1)
+    ) == list(generator.generate_trace("fib", modulus=7, first=1, second=1))
+
+
+# Test modular arithmetic
+def test_modulus() -> None:
+    """
+    Tests the `modulus` option of `SequenceGenerator.generate_trace` and `SequenceGenerator.generate_log`.
+    See individual methods.
+    """
+    generator = SequenceGenerator()
+    modulus_errors(generator=generator)
+
+    generators = [SequenceGenerator(wanted_length=length) for length in [6, 10, 50]]
+    for generator in generators:
+        modular_log(generator=generator)
+        modular_trace(generator=generator)
+
+
+# Compiled plans
+def compiled_plan(generator: SequenceGenerator) -> None:
+    """
+    A plan from `SequenceGenerator.compile()` should generate the same traces and logs as the generator itself.
+    """
+    lists = {
+        "fib": {"firsts": [0, 1, -2], "seconds": [1, 7]},
+        "pascal": {"firsts": [1, 3]},
+        "recaman": {"firsts": [0, 2]},
+        "catalan": {"firsts": [1, 4]},
+        "range_up": {"firsts": [0, -5], "steps": [1, 3]},
+        "range_down": {"lasts": [0, 9], "steps": [2, 0]},
+        "long_term_dependency": {
+            key: [1, 2] for key in ["firsts", "seconds", "thirds", "fourths", "fifths"]
+        },
+        "long_term_single_dependency": {
+            **{key: [1] for key in ["firsts", "seconds", "thirds", "fourths"]},
+            "fifths": [2, 3],
+            "constants": [2, -1],
+        },
+        "short_term_single_dependency": {"firsts": [1, 5], "constants": [3, -2]},
+    }
+    for seq_name, param_lists in lists.items():
+        if len(param_lists) > generator.length:
+            continue
+
+        expected = generator.generate_log(seq_name, **param_lists)
+        plan = generator.compile(seq_name, **param_lists)
+        assert_equal(expected, plan.generate_log())
+        assert_equal(expected, list(plan.iter_log()))
+
+        rows = list(itertools.product(*plan.value_lists))
+        assert_equal(expected, plan.generate_traces(rows))
+        for values, trace in zip(rows, expected):
+            params = dict(zip(plan.names, values))
+            assert_equal(trace, tuple(generator.generate_trace(seq_name, **params)))
+            assert_equal(trace, plan.generate_trace(values))
+
+
+def compile_errors(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.compile()` should validate once, and reuse the plan afterwards.
+    """
+    with pytest.raises(NotYetImplemented):
+        generator.compile("nonexistent")
+    with pytest.raises(MissingRequiredParameter):
+        generator.compile("fib", firsts=[1])
+    with pytest.raises(InvalidLengthException):
+        SequenceGenerator(wanted_length=4).compile("long_term_dependency")
+
+    # A plan without parameter lists cannot generate a log
+    plan = generator.compile("fib")
+    with pytest.raises(MissingRequiredParameter):
+        plan.generate_log()
+
+    # Plans are shared per sequence and length
+    assert_equal(True, plan is generator.compile("fib"))
+    bound = generator.compile("fib", firsts=[1], seconds=[1])
+    assert_equal(True, bound is not plan)
+    assert_equal([[1], [1]], bound.value_lists)
+
+
+# Test compiled plans
+def test_compile() -> None:
+    """
+    Tests `SequenceGenerator.compile`, and the plans it returns.
+    See individual methods.
+    """
+    generator = SequenceGenerator()
+    compile_errors(generator=generator)
+
+    generators = [SequenceGenerator(wanted_length=length) for length in [1, 2, 6, 50]]
+    for generator in generators:
+        compiled_plan(generator=generator)
+
+    # Changing the config entry compiles a new plan
+    generator = SequenceGenerator(wanted_length=7)
+    seq_name = "long_term_single_dependency"
+    lists = {key: [1] for key in ["firsts", "seconds", "thirds", "fourths", "fifths"]}
+    lists["constants"] = [2]
+    plan = generator.compile(seq_name)
+    assert_equal([(1, 1, 1, 1, 1, 2, 2)], generator.generate_log(seq_name, **lists))
+
+    generator.config[seq_name]["recurrence"] = {
+        "coefficients": (1, 0, 0, 0, "constant"),
+        "seeds": ["first", "second", "third", "fourth", "fifth"],
+    }
+    assert_equal(False, plan is generator.compile(seq_name))
+    assert_equal([(1, 1, 1, 1, 1, 3, 5)], generator.generate_log(seq_name, **lists))
+
+
+# Parameter grids
+def param_grid_rows() -> None:
+    """
+    The rows and columns of a `ParamGrid` should be the combinations of `itertools.product`, from any row.
+    """
+    value_lists = [[3, -1, 10 ** 30], [0, 7], [5], [2, 4, 6, 8]]
+    grid = ParamGrid(["first", "second", "third", "fourth"], value_lists)
+    expected = list(itertools.product(*value_lists))
+
+    assert_equal(len(expected), len(grid))
+    assert_equal((3, 2, 1, 4), grid.shape)
+    assert_equal(expected, list(grid.rows()))
+    for start, stop in [(0, 5), (1, 24), (7, 8), (13, None), (20, 100), (24, None)]:
+        assert_equal(expected[start:stop], list(grid.rows(start, stop)))
+
+        columns = grid.columns(start, stop)
+        assert_equal(expected[start:stop], list(zip(*[c.tolist() for c in columns])))
+
+    for index, row in enumerate(expected):
+        assert_equal(row, grid.row(index))
+        assert_equal(dict(zip(grid.names, row)), grid.params(index))
+
+
+# Test parameter grids
+def test_param_grid() -> None:
+    """
+    Tests `ParamGrid`, that the backends consume.
+    See individual methods.
+    """
+    param_grid_rows()
+
+
+# Sampled logs
+def sampled_log(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_log()` with `sample` should give distinct traces of the full log,
+    in the order of the full log, and the same traces for the same seed.
+    """
+    lists = {"firsts": list(range(-20, 20)), "seconds": list(range(30))}
+    expected = generator.generate_log("fib", **lists)
+
+    for stratified in [False, True]:
+        for options in [{}, {"backend": "numpy"}, {"modulus": 97}]:
+            log = generator.generate_log(
+                "fib", sample=50, seed=7, stratified=stratified, **options, **lists
+            )
+            again = generator.generate_log(
+                "fib", sample=50, seed=7, stratified=stratified, **options, **lists
+            )
+            assert_equal(log, again)
+            assert_equal(50, len(log))
+
+        log = generator.generate_log(
+            "fib", sample=50, seed=7, stratified=stratified, **lists
+        )
+        lazy = generator.generate_log(
+            "fib", sample=50, seed=7, stratified=stratified, lazy=True, **lists
+        )
+        assert_equal(log, list(lazy))
+
+        # Every sampled trace is a distinct trace of the full log, in order
+        positions = [expected.index(trace) for trace in log]
+        assert_equal(sorted(set(positions)), positions)
+        for index, trace in enumerate(log):
+            assert_equal(
+                trace, tuple(generator.generate_trace("fib", **lazy.params(index)))
+            )
+
+    # A sample of everything is the full log
+    assert_equal(expected, generator.generate_log("fib", sample=1200, seed=1, **lists))
+    assert_equal([], generator.generate_log("fib", sample=0, **lists))
+    with pytest.raises(InvalidLengthException):
+        generator.generate_log("fib", sample=1201, **lists)
+    with pytest.raises(InvalidLengthException):
+        generator.generate_log("fib", sample=-1, **lists)
+
+
+def sampled_log_is_stratified(generator: SequenceGenerator) -> None:
+    """
+    A stratified sample should use every value of every parameter equally often.
+    """
+    lists = {"firsts": list(range(10)), "steps": list(range(25))}
+    log = generator.generate_log(
+        "range_up", sample=50, seed=3, stratified=True, lazy=True, **lists
+    )
+    params = [log.params(index) for index in range(len(log))]
+    for name, values in [("first", lists["firsts"]), ("step", lists["steps"])]:
+        counts = [sum(row[name] == value for row in params) for value in values]
+        assert_equal([50 // len(values)] * len(values), counts)
+
+
+def sampled_log_is_lazy(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_log()` with `sample` should not build the cartesian product,
+    even when it does not fit in 64 bit integers.
+    """
+    values = list(range(10000))
+    lists = {
+        "firsts": values,
+        "seconds": values,
+        "thirds": values,
+        "fourths": values,
+        "fifths": values,
+        "constants": [2, 3],
+    }
+    for stratified in [False, True]:
+        log = generator.generate_log(
+            "long_term_single_dependency",
+            sample=20,
+            seed=11,
+            stratified=stratified,
+            lazy=True,
+            **lists,
+        )
+        traces = list(log)
+        assert_equal(20, len(traces))
+        for index, trace in enumerate(traces):
+            params = log.params(index)
+            assert_equal(
+                trace,
+                tuple(
+                    generator.generate_trace("long_term_single_dependency", **params)
+                ),
+            )
+
+
+# Test sampled logs
+def test_sample() -> None:
+    """
+    Tests the `sample` option of `SequenceGenerator.generate_log`.
+    See individual methods.
+    """
+    generator = SequenceGenerator()
+    sampled_log_is_stratified(generator=generator)
+    sampled_log_is_lazy(generator=generator)
+
+    generators = [SequenceGenerator(wanted_length=length) for length in [2, 10, 50]]
+    for generator in generators:
+        sampled_log(generator=generator)
+
+    # Workers draw the same sample
+    generator = SequenceGenerator(wanted_length=20)
+    lists = {"firsts": list(range(100)), "seconds": list(range(100))}
+    assert_equal(
+        generator.generate_log("fib", sample=30, seed=5, **lists),
+        generator.generate_log("fib", sample=30, seed=5, workers=2, **lists),
+    )
+
+
+# Interned logs
+def interned_log(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_log()` with `intern=True` should give a log
+    that is equal to the plain log, and stores every distinct trace once.
+    """
+    cases = [
+        ("fib", {"firsts": [0, 1, 0], "seconds": [1, 0, 1]}),
+        ("range_down", {"lasts": [1, 1, -3], "steps": [0, 5]}),
+        ("catalan", {"firsts": [1, 2, 3]}),
+    ]
+    for seq_name, lists in cases:
+        for options in [{}, {"backend": "numpy"}, {"modulus": 97}]:
+            expected = generator.generate_log(seq_name, **options, **lists)
+            log = generator.generate_log(seq_name, intern=True, **options, **lists)
+
+            assert_equal(expected, log)
+            assert_equal(True, log == expected)
+            assert_equal(len(expected), len(log))
+            assert_equal(expected, list(log))
+            assert_equal(expected[1:4], log[1:4])
+            assert_equal(expected[-1], log[-1])
+
+            assert_equal(len(set(expected)), len(log.traces))
+            assert_equal(len(expected), sum(log.counts))
+            assert_equal(len(expected) / len(set(expected)), log.dedup_ratio)
+            for trace, count in zip(log.traces, log.counts):
+                assert_equal(expected.count(trace), count)
+            assert_equal(expected, [log.traces[index] for index in log.indices])
+
+
+def interned_log_shares_traces(generator: SequenceGenerator) -> None:
+    """
+    Zero seeds give the same trace for every constant, which should be stored once.
+    """
+    lists = {
+        **{key: [0] for key in ["firsts", "seconds", "thirds", "fourths", "fifths"]},
+        "constants": list(range(1, 101)),
+    }
+    log = generator.generate_log("long_term_single_dependency", intern=True, **lists)
+
+    assert_equal(100, len(log))
+    assert_equal([(0,) * generator.length], log.traces)
+    assert_equal([100], log.counts)
+    assert_equal(100.0, log.dedup_ratio)
+    assert_equal(True, all(trace is log[0] for trace in log))
+
+    # Workers give the same interned log
+    assert_equal(
+        log,
+        generator.generate_log(
+            "long_term_single_dependency", intern=True, workers=2, **lists
+        ),
+    )
+
+
+# Test interned logs
+def test_intern() -> None:
+    """
+    Tests the `intern` option of `SequenceGenerator.generate_log`.
+    See individual methods.
+    """
+    generators = [SequenceGenerator(wanted_length=length) for length in [6, 10, 50]]
+    for generator in generators:
+        interned_log(generator=generator)
+        interned_log_shares_traces(generator=generator)
+
+    # An empty log
+    log = InternedLog()
+    assert_equal([], log)
+    assert_equal(1.0, log.dedup_ratio)
+
+
+# Multi-length logs
+def multi_length_log(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_log()` with `lengths` should give, per length,
+    the log of a generator with that length.
+    """
+    lengths = [6, 10, 25, 50]
+    cases = [
+        ("fib", {"firsts": [0, 1, -2], "seconds": [1, 7]}),
+        ("pascal", {"firsts": [1, 3]}),
+        ("recaman", {"firsts": [0, 2]}),
+        ("catalan", {"firsts": [1, 4]}),
+        ("range_up", {"firsts": [0, -5], "steps": [1, 3]}),
+        ("range_down", {"lasts": [0, 9], "steps": [2, 0]}),
+        (
+            "long_term_single_dependency",
+            {
+                **{key: [1, 2] for key in ["firsts", "seconds", "thirds", "fourths"]},
+                "fifths": [3],
+                "constants": [2, -1],
+            },
+        ),
+    ]
+    expected = {length: SequenceGenerator(wanted_length=length) for length in lengths}
+    for seq_name, lists in cases:
+        for options in [{}, {"backend": "numpy"}, {"modulus": 97}, {"intern": True}]:
+            logs = generator.generate_log(seq_name, lengths=lengths, **options, **lists)
+            assert_equal(lengths, sorted(logs))
+            for length, log in logs.items():
+                full = expected[length].generate_log(seq_name, **options, **lists)
+                assert_equal(full, log)
+                assert_equal(full[-1], log[-1])
+                assert_equal(full[1:3], log[1:3])
+
+        # The longest log is shared, not copied
+        logs = generator.generate_log(seq_name, lengths=lengths, **lists)
+        assert_equal(True, all(log.log is logs[50].log for log in logs.values()))
+        assert_equal(True, logs[50][0] is logs[50].log[0])
+
+    # The config entry of the generator is used for every length, also when it is added or overridden
+    def customised(length: int) -> SequenceGenerator:
+        """
+        Builds a generator with an added and an overridden recurrence.
+        """
+        custom = SequenceGenerator(wanted_length=length)
+        custom.config["tribonacci"] = {
+            "parameters": ["first", "second", "third"],
+            "recurrence": {
+                "coefficients": (1, 1, 1),
+                "seeds": ["first", "second", "third"],
+            },
+        }
+        custom.config["fib"]["recurrence"] = {
+            "coefficients": (2, 1),
+            "seeds": ["first", "second"],
+        }
+        return custom
+
+    custom = customised(generator.length)
+    for seq_name, lists in [
+        ("tribonacci", {"firsts": [0, 1], "seconds": [0], "thirds": [1, 2]}),
+        ("fib", {"firsts": [1], "seconds": [1, 2]}),
+    ]:
+        logs = custom.generate_log(seq_name, lengths=[5, 60], **lists)
+        for length, log in logs.items():
+            assert_equal(customised(length).generate_log(seq_name, **lists), log)
+
+
+def multi_length_log_errors(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_log()` with invalid `lengths` should raise.
+    """
+    lists = {"firsts": [1], "seconds": [1]}
+    with pytest.raises(NotYetImplemented):
+        generator.generate_log("nonexistent", lengths=[5], **lists)
+    with pytest.raises(InvalidLengthException):
+        generator.generate_log("fib", lengths=[5, 0], **lists)
+    with pytest.raises(InvalidLengthException):
+        generator.generate_log("fib", lengths=[1, 5], **lists)
+    with pytest.raises(MissingRequiredParameter):
+        generator.generate_log("fib", lengths=[5], firsts=[1])
+    assert_equal({}, generator.generate_log("fib", lengths=[], **lists))
+
+
+# Test multi-length logs
+def test_lengths() -> None:
+    """
+    Tests the `lengths` option of `SequenceGenerator.generate_log`.
+    See individual methods.
+    """
+    generator = SequenceGenerator()
+    multi_length_log_errors(generator=generator)
+
+    generators = [SequenceGenerator(wanted_length=length) for length in [10, 50]]
+    for generator in generators:
+        multi_length_log(generator=generator)
+
+
+# Compact logs
+def compact_log(generator: SequenceGenerator) -> None:
+    """
+    A call to `SequenceGenerator.generate_log()` with `compact=True` should give a log
+    that is equal to the plain log, and stores its terms in one flat buffer.
+    """
+    cases = [
+        ("fib", {"firsts": [0, 1, 0], "seconds": [1, 0, 1]}),
+        ("range_down", {"lasts": [1, 1, -3], "steps": [0, 5]}),
+        ("catalan", {"firsts": [1, 2, 3]}),
+        ("range_up", {"firsts": [1, 2 ** 70, -3], "steps": [0, 2 ** 61]}),
+    ]
+    for seq_name, lists in cases:
+        for options in [{}, {"backend": "numpy"}, {"modulus": 97}]:
+            expected = generator.generate_log(seq_name, **options, **lists)
+            log = generator.generate_log(seq_name, compact=True, **options, **lists)
+
+            assert_equal(expected, log)
+            assert_equal(True, log == expected)
+            assert_equal(len(expected), len(log))
+            assert_equal(expected, list(log))
+            assert_equal(expected[1:4], log[1:4])
+            assert_equal(expected[::-2], log[::-2])
+            assert_equal(expected[-1], log[-1])
+            assert_equal(True, isinstance(log[0], tuple))
+
+            terms = [term for trace in expected for term in trace]
+            assert_equal(terms, log.values.tolist())
+            offsets = np.cumsum([0] + [len(trace) for trace in expected])
+            assert_equal(offsets.tolist(), log.offsets.tolist())
+
+    # Workers give the same compact log
+    lists = {"firsts": [0, 1, 2], "seconds": [1, 2]}
+    assert_equal(
+        generator.generate_log("fib", **lists),
+        generator.generate_log("fib", compact=True, workers=2, **lists),
+    )
+
+
+# Test compact logs
+def test_compact() -> None:
+    """
+    Tests the `compact` option of `SequenceGenerator.generate_log`, and `generator.Log.Log`.
+    See individual methods.
+    """
+    generators = [SequenceGenerator(wanted_length=length) for length in [6, 10, 50]]
+    for generator in generators:
+        compact_log(generator=generator)
+
+    # Buffers are widened as larger terms are added, only bigints use python integers
+    log = Log([(1, 2), (), (-3,)])
+    assert_equal(np.int8, log.values.dtype)
+    assert_equal([(1, 2), (), (-3,)], log)
+    log.append(iter([300, -70000]))
+    assert_equal(np.int32, log.values.dtype)
+    log.append((2 ** 63 - 1,))
+    assert_equal(np.int64, log.values.dtype)
+    log.append((2 ** 64, 1))
+    assert_equal(object, log.values.dtype)
+    assert_equal([(1, 2), (), (-3,), (300, -70000), (2 ** 63 - 1,), (2 ** 64, 1)], log)
+    assert_equal([0, 2, 2, 3, 5, 6, 8], log.offsets.tolist())
+
+    # Arrays keep their type, unless it is too narrow for the log
+    log = Log([(1, 2)])
+    log.extend_array(np.array([[3, 4], [5, 6]], dtype=np.int16))
+    assert_equal(np.int8, log.values.dtype)
+    log.extend_array(np.array([[-1000, 7]], dtype=np.int64))
+    assert_equal(np.int16, log.values.dtype)
+    log.extend_array(np.array([[2 ** 64, 8]], dtype=object))
+    assert_equal([(1, 2), (3, 4), (5, 6), (-1000, 7), (2 ** 64, 8)], log)
+    assert_equal([0, 2, 4, 6, 8, 10], log.offsets.tolist())
+
+    # The numpy backend stores its blocks in the planned type
+    generator = SequenceGenerator(wanted_length=10)
+    lists = {"firsts": [1, 2, 1000], "steps": [1]}
+    log = generator.generate_log("range_up", backend="numpy", compact=True, **lists)
+    assert_equal(generator.generate_log("range_up", **lists), log)
+    assert_equal(np.int16, log.values.dtype)
+
+    # Ragged traces, equal to other logs
+    assert_equal(Log(), [])
+    assert_equal(InternedLog([(1,), (1,)]), Log([(1,), (1,)]))
+    with pytest.raises(IndexError):
+        Log([(1,)])[1]
+
+
+# Packed integers
+def packed_log(generator: SequenceGenerator) -> None:
+    """
+    Big integer logs should be packed, and give the same log after saving and loading.
+    """
+    path = os.path.join(TESTPATH, f"packed-log-{generator.length}")
+    cases = [
+        ("catalan", {"firsts": [1, 2, 3, 50]}),
+        ("fib", {"firsts": [0, 1, -7], "seconds": [1, 2 ** 70]}),
+        ("range_down", {"lasts": [1, -3], "steps": [0, 5]}),
+    ]
+    for seq_name, lists in cases:
+        expected = generator.generate_log(seq_name, **lists)
+        log = generator.generate_log(seq_name, compact=True, **lists)
+        assert_equal(expected, log)
+
+        log.save(path)
+        for mmap in [True, False]:
+            loaded = Log.load(path, mmap=mmap)
+            assert_equal(expected, loaded)
+            assert_equal(expected[-1], loaded[-1])
+            assert_equal(log.nbytes, loaded.nbytes)
+
+            # Adding traces copies the loaded buffers
+            loaded.append((2 ** 100, -(2 ** 100)))
+            assert_equal(expected + [(2 ** 100, -(2 ** 100))], loaded)
+            del loaded
+
+        for name in ["values", "offsets", "widths"]:
+            if os.path.isfile(f"{path}-{name}.npy"):
+                os.remove(f"{path}-{name}.npy")
+
+
+# Test packed integers
+def test_packed() -> None:
+    """
+    Tests `generator.PackedInts.PackedInts`, and saving and loading a `generator.Log.Log`.
+    See individual methods.
+    """
+    generators = [SequenceGenerator(wanted_length=length) for length in [6, 100]]
+    for generator in generators:
+        packed_log(generator=generator)
+
+    # Every integer takes as many limbs as its bits and a sign bit need, in two's complement
+    values = [0, -1, 5, 2 ** 63 - 1, -(2 ** 63) + 1, 2 ** 63, -(2 ** 64) - 1, 3 ** 200]
+    packed = PackedInts(values)
+    assert_equal(values, list(packed))
+    assert_equal([1, 1, 1, 1, 1, 2, 2, 5], packed.widths.tolist())
+    assert_equal(14, len(packed.limbs))
+    assert_equal(values[2:6], packed[2:6])
+    assert_equal(values[::-3], packed[::-3])
+    assert_equal(values[-1], packed[-1])
+    with pytest.raises(IndexError):
+        packed[len(values)]
+
+    # Wrapped buffers are not copied, until integers are added
+    wrapped = PackedInts.from_limbs(packed.limbs, packed.widths)
+    assert_equal(values, list(wrapped))
+    wrapped.extend([-(7 ** 100), 1])
+    assert_equal(values + [-(7 ** 100), 1], list(wrapped))
+    assert_equal([], PackedInts().unpack())
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import sys
 import os
+import itertools
 import pytest
 
 # Make pytest find our tests and modules
@@ -8,8 +9,8 @@ sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
 
 # Own
 from helper import assert_equal
-from generator import XESTransformator
-from exception import InvalidLogFormat, ParsingError
+from generator import XESTransformator, Log
+from exception import InvalidLengthException, InvalidLogFormat, ParsingError
 from helper import TESTPATH
 from sequences import EXAMPLE_LOG_AS_INTS
 
@@ -63,3 +64,99 @@ def test_valid_logs():
 
         transformed = transformator.transform(log)
         assert_equal(EXAMPLE_LOG_AS_INTS, transformed)
+        assert_equal(True, isinstance(transformed, Log))
+        assert_equal(EXAMPLE_LOG_AS_INTS, list(transformed))
+
+
+def test_streaming_logs():
+    # The logs to test, including one that names its events after the traces, and one without namespace.
+    logs = [
+        os.path.join(os.path.join(TESTPATH, "logs"), "sample_log.xes"),
+        os.path.join(os.path.join(TESTPATH, "logs"), "sample_log.xes.gz"),
+        os.path.join(os.path.join(TESTPATH, "logs"), "sample_log_names_last.xes"),
+        os.path.join(os.path.join(TESTPATH, "logs"), "sample_log_no_namespace.xes"),
+    ]
+
+    # Create a transformator
+    transformator = XESTransformator()
+
+    # Loop through logs
+    for log in logs:
+
+        assert_equal(EXAMPLE_LOG_AS_INTS, transformator.transform(log))
+        assert_equal(EXAMPLE_LOG_AS_INTS, transformator.transform(log, streaming=True))
+
+    # Invalid logs raise the same error
+    for log in ["invalid_log.xes", "invalid_log.xes.gz"]:
+        with pytest.raises(ParsingError):
+            transformator.transform(
+                os.path.join(os.path.join(TESTPATH, "logs"), log), streaming=True
+            )
+
+
+def test_transform_iter():
+    # The logs to test.
+    logs = [
+        os.path.join(os.path.join(TESTPATH, "logs"), "sample_log.xes"),
+        os.path.join(os.path.join(TESTPATH, "logs"), "sample_log.xes.gz"),
+        os.path.join(os.path.join(TESTPATH, "logs"), "sample_log_names_last.xes"),
+    ]
+
+    # Create a transformator
+    transformator = XESTransformator()
+
+    # Loop through logs
+    for log in logs:
+
+        assert_equal(EXAMPLE_LOG_AS_INTS, list(transformator.transform_iter(log)))
+        assert_equal(
+            EXAMPLE_LOG_AS_INTS[:1],
+            list(itertools.islice(transformator.transform_iter(log), 1)),
+        )
+        assert_equal(
+            [[trace] for trace in EXAMPLE_LOG_AS_INTS],
+            list(transformator.transform_iter(log, batch_size=1)),
+        )
+        for batch_size in [2, 3]:
+            assert_equal(
+                [EXAMPLE_LOG_AS_INTS],
+                list(transformator.transform_iter(log, batch_size=batch_size)),
+            )
+
+    # Errors on the file are raised before iterating, errors on its contents while iterating
+    with pytest.raises(FileNotFoundError):
+        transformator.transform_iter(os.path.join(TESTPATH, "no_log.xes"))
+    with pytest.raises(InvalidLengthException):
+        transformator.transform_iter(logs[0], batch_size=0)
+
+    traces = transformator.transform_iter(
+        os.path.join(os.path.join(TESTPATH, "logs"), "invalid_log.xes")
+    )
+    with pytest.raises(ParsingError):
+        next(traces)
+
+
+def test_corrupt_gzip(tmp_path):
+    # Create a transformator
+    transformator = XESTransformator()
+    log = os.path.join(os.path.join(TESTPATH, "logs"), "sample_log.xes.gz")
+    with open(log, "rb") as compressed:
+        content = compressed.read()
+
+    # A truncated file, and a file with a damaged compressed stream
+    middle = len(content) // 2
+    damaged = {
+        "truncated_log.xes.gz": content[:-20],
+        "corrupt_log.xes.gz": content[:middle] + bytes(64) + content[middle + 64 :],
+    }
+
+    for name, data in damaged.items():
+        path = os.path.join(tmp_path, name)
+        with open(path, "wb") as damaged_log:
+            damaged_log.write(data)
+
+        for streaming in [False, True]:
+            with pytest.raises(ParsingError):
+                transformator.transform(path, streaming=streaming)
+        with pytest.raises(ParsingError):
+            list(transformator.transform_iter(path))